@@ -0,0 +1,40 @@
+"""Add collection cursors
+
+Revision ID: a3f9c2d1e8b7
+Revises: phase5_heavy_models
+Create Date: 2026-10-17 09:12:41.208113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f9c2d1e8b7"
+down_revision: Union[str, Sequence[str], None] = "phase5_heavy_models"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "collection_cursors",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("subreddit_name", sa.String(255), nullable=False),
+        sa.Column("sort", sa.String(20), nullable=False),
+        sa.Column("newest_fullname", sa.String(20), nullable=True),
+        sa.Column("newest_created_utc", sa.DateTime(), nullable=True),
+        sa.Column("last_run_at", sa.DateTime(), nullable=True),
+        sa.Column("last_run_items", sa.Integer(), default=0),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("subreddit_name", "sort", name="uq_collection_cursor"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("collection_cursors")
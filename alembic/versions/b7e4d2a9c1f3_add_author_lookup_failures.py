@@ -0,0 +1,42 @@
+"""Add author lookup failures
+
+Revision ID: b7e4d2a9c1f3
+Revises: a3f9c2d1e8b7
+Create Date: 2026-10-17 11:40:05.772310
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4d2a9c1f3"
+down_revision: Union[str, Sequence[str], None] = "a3f9c2d1e8b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "author_lookup_failures",
+        sa.Column("username", sa.String(255), primary_key=True),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("failed_at", sa.DateTime(), nullable=False),
+        sa.Column("attempts", sa.Integer(), default=1),
+    )
+    op.create_index(
+        "ix_author_lookup_failures_failed_at",
+        "author_lookup_failures",
+        ["failed_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_author_lookup_failures_failed_at", table_name="author_lookup_failures"
+    )
+    op.drop_table("author_lookup_failures")
@@ -0,0 +1,39 @@
+"""Add post and comment query indexes
+
+Revision ID: c5d8e1f4a2b6
+Revises: b7e4d2a9c1f3
+Create Date: 2026-10-17 14:03:27.519644
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d8e1f4a2b6"
+down_revision: Union[str, Sequence[str], None] = "b7e4d2a9c1f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_posts_subreddit_created_utc", "posts", ["subreddit_id", "created_utc"]),
+    ("ix_posts_subreddit_created_at", "posts", ["subreddit_id", "created_at"]),
+    ("ix_posts_created_utc", "posts", ["created_utc"]),
+    ("ix_posts_created_at", "posts", ["created_at"]),
+    ("ix_posts_author_created_utc", "posts", ["author_id", "created_utc"]),
+    ("ix_comments_post_created_utc", "comments", ["post_id", "created_utc"]),
+    ("ix_comments_author_created_utc", "comments", ["author_id", "created_utc"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
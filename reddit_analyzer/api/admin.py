@@ -2,7 +2,7 @@
 
 from flask import Blueprint, request, jsonify, g
 from sqlalchemy import func
-from reddit_analyzer.database import get_db
+from reddit_analyzer.database import get_db, get_pool_status
 from reddit_analyzer.models.user import User, UserRole
 from reddit_analyzer.models.collection_job import CollectionJob
 from reddit_analyzer.models.subreddit import Subreddit
@@ -247,7 +247,12 @@ def health_check():
 
         return (
             jsonify(
-                {"status": "healthy", "database": "connected", "timestamp": func.now()}
+                {
+                    "status": "healthy",
+                    "database": "connected",
+                    "pool": get_pool_status(),
+                    "timestamp": func.now(),
+                }
             ),
             200,
         )
@@ -1,5 +1,8 @@
 """Data management CLI commands."""
 
+from pathlib import Path
+from typing import List, Optional
+
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -12,8 +15,15 @@ from reddit_analyzer.models.post import Post
 from reddit_analyzer.models.comment import Comment
 from reddit_analyzer.models.subreddit import Subreddit
 from reddit_analyzer.models.text_analysis import TextAnalysis
-from reddit_analyzer.database import get_db
+from reddit_analyzer.database import dispose_async_engine, get_db, get_pool_status
 from reddit_analyzer.services.nlp_service import get_nlp_service
+from reddit_analyzer.services.author_resolver import AuthorResolver
+from reddit_analyzer.services.bulk_writer import BulkWriter
+from reddit_analyzer.services.collection_cursors import (
+    INCREMENTAL_SORTS,
+    advance_cursor,
+    get_cursor,
+)
 
 data_app = typer.Typer(help="Data management commands")
 console = Console()
@@ -107,6 +117,17 @@ def database_health():
             table.add_column("Value", style="green")
 
             table.add_row("Connection", "✅ Healthy")
+
+            pool = get_pool_status()
+            table.add_row("Pool", pool["pool_class"])
+            if pool["in_use"] is not None:
+                table.add_row("Connections In Use", str(pool["in_use"]))
+            if "checkout" in pool:
+                table.add_row(
+                    "Checkout Wait (avg/max)",
+                    f"{pool['checkout']['avg_wait_ms']:.1f} / "
+                    f"{pool['checkout']['max_wait_ms']:.1f} ms",
+                )
             table.add_row("Users", str(user_count))
             table.add_row("Subreddits", str(subreddit_count))
             table.add_row("Posts", str(post_count))
@@ -152,6 +173,11 @@ def collect_data(
     min_comment_score: int = typer.Option(
         None, "--min-comment-score", help="Minimum comment score to include"
     ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="With --sort new, ignore the saved cursor and fetch up to --limit posts",
+    ),
 ):
     """Collect data from specified subreddit."""
     if comments_only and with_comments:
@@ -173,13 +199,19 @@ def collect_data(
         reddit_client = RedditClient()
         db = next(get_db())
         nlp_service = get_nlp_service() if not skip_nlp else None
+        author_resolver = AuthorResolver(
+            db, reddit_client.get_user_info, reddit_client.rate_limiter
+        )
+        bulk_writer = BulkWriter(db)
 
         # First, get or create the subreddit
         subreddit_info = reddit_client.get_subreddit_info(subreddit)
 
         # Check if subreddit exists in database
         db_subreddit = (
-            db.query(Subreddit).filter(Subreddit.name == subreddit_info["name"]).first()
+            db.query(Subreddit)
+            .filter(func.lower(Subreddit.name) == subreddit_info["name"].lower())
+            .first()
         )
 
         if not db_subreddit:
@@ -198,89 +230,93 @@ def collect_data(
             db.add(db_subreddit)
             db.commit()
 
-        posts = []
-        if not comments_only:
-            # Fetch posts from Reddit
-            posts = reddit_client.get_subreddit_posts(subreddit, sort=sort, limit=limit)
+        incremental = sort in INCREMENTAL_SORTS and not comments_only
+        if comments_only:
+            pages = iter(())
+        elif incremental and not full:
+            # Only fetch posts newer than the last run's newest post
+            cursor = get_cursor(db, subreddit, sort)
+            new_posts = reddit_client.get_new_posts_since(
+                subreddit,
+                newest_fullname=cursor.newest_fullname if cursor else None,
+                newest_created_utc=cursor.newest_created_utc if cursor else None,
+                limit=limit,
+            )
+            if cursor and cursor.newest_fullname:
+                console.print(
+                    f"ℹ️  {len(new_posts)} posts since {cursor.newest_fullname}",
+                    style="yellow",
+                )
+            pages = iter([new_posts])
+        else:
+            # Fetch posts from Reddit a page at a time
+            pages = reddit_client.iter_subreddit_posts(
+                subreddit, sort=sort, limit=limit
+            )
+
+        fetched_post_ids = []
+        collected_count = 0
+        analyzed_count = 0
 
         with Progress() as progress:
             task = progress.add_task(
-                f"[cyan]Collecting from r/{subreddit}...", total=len(posts)
+                f"[cyan]Collecting from r/{subreddit}...",
+                total=0 if comments_only else limit,
             )
 
-            collected_count = 0
-            posts_to_analyze = []  # Store posts for NLP analysis
+            # Each page is stored and analyzed before the next is fetched
+            for page in pages:
+                # One query for known authors, concurrent fetches for the rest
+                authors = author_resolver.resolve(p["author"] for p in page)
+                author_ids = {name: user.id for name, user in authors.items() if user}
 
-            for post_data in posts:
-                # Get or create user
-                author_name = post_data["author"]
-                if author_name != "[deleted]":
-                    db_user = (
-                        db.query(User).filter(User.username == author_name).first()
-                    )
+                # New posts are inserted, existing ones get fresh scores
+                result = bulk_writer.upsert_posts(page, db_subreddit.id, author_ids)
+                collected_count += result.inserted
+                progress.update(task, advance=len(page))
 
-                    if not db_user:
-                        try:
-                            user_info = reddit_client.get_user_info(author_name)
-                            db_user = User(
-                                username=user_info["username"],
-                                created_utc=user_info["created_utc"],
-                                comment_karma=user_info["comment_karma"],
-                                link_karma=user_info["link_karma"],
-                                is_verified=user_info["is_verified"],
-                                role=UserRole.USER,  # Reddit users are regular users
-                                is_active=True,  # Mark as active
-                                # No password_hash - these are Reddit users, not app users
-                            )
-                            db.add(db_user)
-                            db.commit()
-                        except Exception:
-                            # User might be suspended or deleted
-                            db_user = None
-                else:
-                    db_user = None
-
-                # Check if post already exists
-                existing_post = (
-                    db.query(Post).filter(Post.id == post_data["id"]).first()
-                )
+                fetched_post_ids.extend(p["id"] for p in page)
+                if incremental:
+                    advance_cursor(db, subreddit, sort, page)
+                db.commit()
 
-                if not existing_post:
-                    new_post = Post(
-                        id=post_data["id"],
-                        title=post_data["title"],
-                        selftext=post_data["selftext"],
-                        url=post_data["url"],
-                        author_id=db_user.id if db_user else None,
-                        subreddit_id=db_subreddit.id,
-                        score=post_data["score"],
-                        upvote_ratio=post_data["upvote_ratio"],
-                        num_comments=post_data["num_comments"],
-                        created_utc=post_data["created_utc"],
-                        is_self=post_data["is_self"],
-                        is_nsfw=post_data["is_nsfw"],
-                        is_locked=post_data["is_locked"],
-                    )
-                    db.add(new_post)
-                    collected_count += 1
+                if skip_nlp:
+                    continue
 
-                    # Add to NLP analysis queue if not skipped
-                    if not skip_nlp:
-                        posts_to_analyze.append(new_post)
+                new_ids = set(result.inserted_ids)
+                for post in (p for p in page if p["id"] in new_ids):
+                    try:
+                        # Combine title and body for analysis
+                        full_text = f"{post['title']}"
+                        if post["selftext"]:
+                            full_text += f"\n\n{post['selftext']}"
+
+                        # Analyze text and store results
+                        nlp_service.analyze_text(full_text, post_id=post["id"])
+                        analyzed_count += 1
 
-                progress.update(task, advance=1)
+                    except Exception as e:
+                        console.print(
+                            f"⚠️  Failed to analyze post {post['id']}: {e}",
+                            style="yellow",
+                        )
 
-            db.commit()
+            progress.update(task, total=len(fetched_post_ids))
 
         console.print(
             f"✅ Collected {collected_count} new posts from r/{subreddit}",
             style="green",
         )
-        if collected_count < len(posts):
+        if collected_count < len(fetched_post_ids):
             console.print(
-                f"ℹ️  Skipped {len(posts) - collected_count} existing posts",
+                f"ℹ️  Updated {len(fetched_post_ids) - collected_count} existing posts",
                 style="yellow",
             )
+        if analyzed_count:
+            console.print(
+                f"✅ Completed NLP analysis for {analyzed_count} posts",
+                style="green",
+            )
 
         # Collect comments if requested
         comment_count = 0
@@ -302,7 +338,7 @@ def collect_data(
             else:
                 # For --with-comments, collect comments for all posts from this run
                 # Get post IDs from the posts we just fetched
-                post_ids = [p["id"] for p in posts]
+                post_ids = fetched_post_ids
                 target_posts = (
                     (db.query(Post).filter(Post.id.in_(post_ids)).all())
                     if post_ids
@@ -328,78 +364,24 @@ def collect_data(
                                 min_score=min_comment_score,
                             )
 
-                            for comment_data in comments:
-                                # Check if comment exists
-                                existing_comment = (
-                                    db.query(Comment)
-                                    .filter(Comment.id == comment_data["id"])
-                                    .first()
-                                )
+                            authors = author_resolver.resolve(
+                                c["author"] for c in comments
+                            )
+                            result = bulk_writer.upsert_comments(
+                                comments,
+                                {
+                                    name: user.id
+                                    for name, user in authors.items()
+                                    if user
+                                },
+                            )
+                            comment_count += result.inserted
 
-                                if not existing_comment:
-                                    # Get or create comment author
-                                    author_name = comment_data["author"]
-                                    comment_author = None
-
-                                    if author_name != "[deleted]":
-                                        comment_author = (
-                                            db.query(User)
-                                            .filter(User.username == author_name)
-                                            .first()
-                                        )
-
-                                        if not comment_author:
-                                            try:
-                                                user_info = reddit_client.get_user_info(
-                                                    author_name
-                                                )
-                                                comment_author = User(
-                                                    username=user_info["username"],
-                                                    created_utc=user_info[
-                                                        "created_utc"
-                                                    ],
-                                                    comment_karma=user_info[
-                                                        "comment_karma"
-                                                    ],
-                                                    link_karma=user_info["link_karma"],
-                                                    is_verified=user_info[
-                                                        "is_verified"
-                                                    ],
-                                                    role=UserRole.USER,
-                                                    is_active=True,
-                                                )
-                                                db.add(comment_author)
-                                                db.commit()
-                                            except Exception:
-                                                pass
-
-                                    # Create comment
-                                    new_comment = Comment(
-                                        id=comment_data["id"],
-                                        post_id=comment_data["post_id"],
-                                        parent_id=(
-                                            comment_data["parent_id"]
-                                            if comment_data["parent_id"]
-                                            != f"t3_{comment_data['post_id']}"
-                                            else None
-                                        ),
-                                        author_id=(
-                                            comment_author.id
-                                            if comment_author
-                                            else None
-                                        ),
-                                        body=comment_data["body"],
-                                        score=comment_data["score"],
-                                        created_utc=comment_data["created_utc"],
-                                        is_deleted=comment_data.get(
-                                            "is_deleted", False
-                                        ),
-                                    )
-                                    db.add(new_comment)
-                                    comment_count += 1
-
-                                    if not skip_nlp:
-                                        comments_to_analyze.append(new_comment)
+                            if not skip_nlp:
+                                new_ids = set(result.inserted_ids)
+                                comments_to_analyze.extend(
+                                    c for c in comments if c["id"] in new_ids
+                                )
 
                             db.commit()
 
@@ -419,42 +401,6 @@ def collect_data(
                     "ℹ️  No posts found to collect comments for", style="yellow"
                 )
 
-        # Run NLP analysis on collected posts and comments
-        if not skip_nlp and posts_to_analyze:
-            console.print(
-                f"\n🧠 Processing NLP analysis for {len(posts_to_analyze)} posts..."
-            )
-
-            with Progress() as nlp_progress:
-                nlp_task = nlp_progress.add_task(
-                    "[cyan]Analyzing sentiment and extracting features...",
-                    total=len(posts_to_analyze),
-                )
-
-                analyzed_count = 0
-                for post in posts_to_analyze:
-                    try:
-                        # Combine title and body for analysis
-                        full_text = f"{post.title}"
-                        if post.selftext:
-                            full_text += f"\n\n{post.selftext}"
-
-                        # Analyze text and store results
-                        nlp_service.analyze_text(full_text, post_id=post.id)
-                        analyzed_count += 1
-
-                    except Exception as e:
-                        console.print(
-                            f"⚠️  Failed to analyze post {post.id}: {e}", style="yellow"
-                        )
-
-                    nlp_progress.update(nlp_task, advance=1)
-
-            console.print(
-                f"✅ Completed NLP analysis for {analyzed_count} posts",
-                style="green",
-            )
-
         # Run NLP analysis on comments
         if not skip_nlp and comments_to_analyze:
             console.print(
@@ -471,11 +417,13 @@ def collect_data(
                 for comment in comments_to_analyze:
                     try:
                         # Analyze comment text
-                        nlp_service.analyze_text(comment.body, comment_id=comment.id)
+                        nlp_service.analyze_text(
+                            comment["body"], comment_id=comment["id"]
+                        )
                         analyzed_comments += 1
                     except Exception as e:
                         console.print(
-                            f"⚠️  Failed to analyze comment {comment.id}: {e}",
+                            f"⚠️  Failed to analyze comment {comment['id']}: {e}",
                             style="yellow",
                         )
 
@@ -496,6 +444,88 @@ def collect_data(
         db.close()
 
 
+@data_app.command("collect-many")
+@cli_auth.require_auth()
+def collect_many(
+    subreddits: Optional[List[str]] = typer.Argument(
+        None, help="Subreddits to collect from"
+    ),
+    watch_list: Optional[Path] = typer.Option(
+        None,
+        "--watch-list",
+        "-f",
+        help="File with one subreddit per line (# starts a comment)",
+    ),
+    sort: str = typer.Option(
+        "new", help="Sort method (hot, new, top, rising); new resumes from cursors"
+    ),
+    limit: int = typer.Option(100, help="Maximum posts per subreddit"),
+    concurrency: int = typer.Option(
+        8, help="Subreddits collected at once under the shared rate limit"
+    ),
+):
+    """Collect posts from many subreddits, stalest first, in one process."""
+    import asyncio
+
+    from reddit_analyzer.core.rate_limiter import RateLimitConfig
+    from reddit_analyzer.services.collection_scheduler import CollectionScheduler
+    from reddit_analyzer.services.enhanced_reddit_client import EnhancedRedditClient
+
+    names = list(subreddits or [])
+    if watch_list:
+        for line in watch_list.read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                names.append(line.removeprefix("r/"))
+    if not names:
+        console.print("❌ No subreddits given", style="red")
+        raise typer.Exit(1)
+
+    async def _run():
+        # Pace by the budget Reddit reports rather than a fixed rate
+        client = EnhancedRedditClient(RateLimitConfig(adaptive=True))
+        scheduler = CollectionScheduler(
+            client, max_concurrency=concurrency, sort=sort, post_limit=limit
+        )
+        await client.start()
+        try:
+            return await scheduler.run(names)
+        finally:
+            await client.stop()
+            await dispose_async_engine()
+
+    try:
+        with console.status(f"[bold green]Collecting from {len(names)} subreddits..."):
+            summary = asyncio.run(_run())
+    except Exception as e:
+        console.print(f"❌ Data collection failed: {e}", style="red")
+        raise typer.Exit(1)
+
+    table = Table(title="📥 Collection Summary")
+    table.add_column("Subreddit", style="cyan")
+    table.add_column("Fetched", style="green")
+    table.add_column("New", style="green")
+    table.add_column("Seconds")
+    for name, result in summary["subreddits"].items():
+        table.add_row(
+            f"r/{name}",
+            str(result["posts_fetched"]),
+            str(result["posts_stored"]),
+            f"{result['duration_seconds']:.1f}",
+        )
+    console.print(table)
+
+    console.print(
+        f"✅ Collected {summary['total_posts_stored']} new posts "
+        f"({summary['posts_per_minute']:.0f} posts/min)",
+        style="green",
+    )
+    for name in summary["failed"]:
+        console.print(
+            f"⚠️  r/{name}: {summary['subreddits'][name]['error']}", style="yellow"
+        )
+
+
 @data_app.command("init")
 @cli_auth.require_auth(UserRole.ADMIN)
 def init_database():
@@ -21,8 +21,39 @@ class Config:
         "DATABASE_URL",
         "sqlite:///./reddit_analyzer.db",
     )
+    # Connection pool, for server databases and file-backed SQLite alike
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # Opt-in WAL/mmap pragma profile for file-backed SQLite
+    SQLITE_PERFORMANCE_PROFILE = (
+        os.getenv("SQLITE_PERFORMANCE_PROFILE", "false").lower() == "true"
+    )
+    SQLITE_CACHE_SIZE_MB = int(os.getenv("SQLITE_CACHE_SIZE_MB", "64"))
+    SQLITE_MMAP_SIZE_MB = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+    # Cache Configuration
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "redis")
+    CACHE_PATH = os.getenv("CACHE_PATH", ".cache/reddit_analyzer_cache.db")
+    CACHE_MAX_SIZE_MB = int(os.getenv("CACHE_MAX_SIZE_MB", "256"))
+    CACHE_LOCAL_ENABLED = os.getenv("CACHE_LOCAL_ENABLED", "false").lower() == "true"
+    CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "1024"))
+    CACHE_LOCAL_TTL = int(os.getenv("CACHE_LOCAL_TTL", "60"))
+    CACHE_MAX_CONNECTIONS = int(os.getenv("CACHE_MAX_CONNECTIONS", "50"))
+    CACHE_SERIALIZER = os.getenv("CACHE_SERIALIZER", "json")
+    CACHE_COMPRESSOR = os.getenv("CACHE_COMPRESSOR", "gzip")
+    CACHE_COMPRESS_THRESHOLD = int(os.getenv("CACHE_COMPRESS_THRESHOLD", "1024"))
+
+    # Collection Configuration
+    # Seconds before a failed author profile lookup is retried
+    AUTHOR_NEGATIVE_CACHE_TTL = int(os.getenv("AUTHOR_NEGATIVE_CACHE_TTL", "604800"))
+    # Author profiles looked up at once by async collection
+    AUTHOR_FETCH_CONCURRENCY = int(os.getenv("AUTHOR_FETCH_CONCURRENCY", "4"))
+
     # Application Configuration
     APP_ENV = os.getenv("APP_ENV", "development")
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -1,11 +1,40 @@
+import asyncio
+import gzip
 import json
 import time
 import hashlib
-from typing import Any, Dict, Optional
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date, datetime
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 import redis
+import redis.asyncio as aioredis
 from reddit_analyzer.config import get_settings
 
+# Optional fast codecs (install with the "cache" extra)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
 
 @dataclass
 class CacheConfig:
@@ -13,29 +42,429 @@ class CacheConfig:
     max_key_length: int = 250
     compress_threshold: int = 1024  # Compress values larger than 1KB
     key_prefix: str = "reddit_analyzer"
+    # Codecs from SERIALIZERS / COMPRESSORS
+    serializer: str = "json"
+    compressor: str = "gzip"
+    compress_level: Optional[int] = None  # None uses the compressor default
+    # Connection pool shared by all callers of one cache instance
+    max_connections: int = 50
+    socket_timeout: float = 5.0
+    socket_connect_timeout: float = 5.0
+    health_check_interval: int = 30
+    # Invalidation
+    scan_batch_size: int = 500  # Keys per SCAN/UNLINK round trip
+    tag_ttl: int = 86400  # Tag sets outlive the keys they index
+    # Embedded SQLite backend (CACHE_BACKEND=disk)
+    disk_path: str = ".cache/reddit_analyzer_cache.db"
+    disk_max_bytes: int = 256 * 1024 * 1024  # Evict LRU entries past this
+    # In-process L1 cache in front of Redis
+    local_cache_enabled: bool = False
+    local_cache_max_entries: int = 1024
+    local_cache_ttl: int = 60  # Bounds staleness across processes
 
 
-class RedisCache:
-    def __init__(self, config: Optional[CacheConfig] = None):
-        self.config = config or CacheConfig()
-        settings = get_settings()
-
-        # Parse Redis URL
-        redis_url = settings.redis_url
-        self.redis_client = redis.from_url(
-            redis_url,
-            decode_responses=False,  # We'll handle encoding ourselves
-            socket_timeout=5.0,
-            socket_connect_timeout=5.0,
-            retry_on_timeout=True,
-            health_check_interval=30,
+@dataclass(frozen=True)
+class Serializer:
+    name: str
+    codec_id: int
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+@dataclass(frozen=True)
+class Compressor:
+    name: str
+    codec_id: int
+    default_level: Optional[int]
+    compress: Callable[[bytes, Optional[int]], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+# Tagged values start with one header byte: 0x10 | serializer_id << 2 |
+# compressor_id. Legacy values are JSON text or "GZIP:"-prefixed and always
+# start with a printable byte, so the two formats never collide.
+CODEC_TAG_BASE = 0x10
+MAX_CODEC_ID = 3
+
+SERIALIZERS: Dict[str, Serializer] = {}
+COMPRESSORS: Dict[str, Compressor] = {}
+_SERIALIZERS_BY_ID: Dict[int, Serializer] = {}
+_COMPRESSORS_BY_ID: Dict[int, Compressor] = {}
+
+
+def register_serializer(serializer: Serializer) -> None:
+    if not 0 <= serializer.codec_id <= MAX_CODEC_ID:
+        raise ValueError(f"Serializer id must be 0-{MAX_CODEC_ID}")
+    SERIALIZERS[serializer.name] = serializer
+    _SERIALIZERS_BY_ID[serializer.codec_id] = serializer
+
+
+def register_compressor(compressor: Compressor) -> None:
+    if not 0 <= compressor.codec_id <= MAX_CODEC_ID:
+        raise ValueError(f"Compressor id must be 0-{MAX_CODEC_ID}")
+    COMPRESSORS[compressor.name] = compressor
+    _COMPRESSORS_BY_ID[compressor.codec_id] = compressor
+
+
+def encode_value(
+    value: Any,
+    serializer: str = "json",
+    compressor: str = "gzip",
+    compress_threshold: int = 1024,
+    compress_level: Optional[int] = None,
+) -> bytes:
+    """Serialize and optionally compress a value into a tagged payload."""
+    codec = SERIALIZERS[serializer]
+    packer = COMPRESSORS[compressor]
+    payload = codec.dumps(value)
+
+    compressor_id = 0
+    if packer.codec_id != 0 and len(payload) > compress_threshold:
+        level = packer.default_level if compress_level is None else compress_level
+        compressed = packer.compress(payload, level)
+        # Only use compression if it actually reduces size
+        if len(compressed) < len(payload):
+            payload = compressed
+            compressor_id = packer.codec_id
+
+    header = CODEC_TAG_BASE | (codec.codec_id << 2) | compressor_id
+    return bytes((header,)) + payload
+
+
+def decode_value(value: bytes) -> Any:
+    """Decode a tagged payload, or a legacy JSON / "GZIP:" entry."""
+    header = value[0] if value else 0
+    if CODEC_TAG_BASE <= header <= CODEC_TAG_BASE | 0x0F:
+        codec = _SERIALIZERS_BY_ID[(header >> 2) & MAX_CODEC_ID]
+        payload = value[1:]
+        compressor_id = header & MAX_CODEC_ID
+        if compressor_id:
+            payload = _COMPRESSORS_BY_ID[compressor_id].decompress(payload)
+        return codec.loads(payload)
+
+    if value.startswith(b"GZIP:"):
+        return json.loads(gzip.decompress(value[5:]).decode("utf-8"))
+
+    return json.loads(value.decode("utf-8"))
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(1, obj.isoformat().encode("utf-8"))
+    if isinstance(obj, date):
+        return msgpack.ExtType(2, obj.isoformat().encode("utf-8"))
+    return str(obj)
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == 1:
+        return datetime.fromisoformat(data.decode("utf-8"))
+    if code == 2:
+        return date.fromisoformat(data.decode("utf-8"))
+    return msgpack.ExtType(code, data)
+
+
+# json and orjson write datetimes as ISO strings; msgpack round-trips them.
+register_serializer(
+    Serializer(
+        name="json",
+        codec_id=0,
+        dumps=lambda value: json.dumps(value, default=str).encode("utf-8"),
+        loads=lambda data: json.loads(data.decode("utf-8")),
+    )
+)
+register_compressor(
+    Compressor(
+        name="none",
+        codec_id=0,
+        default_level=None,
+        compress=lambda data, level: data,
+        decompress=lambda data: data,
+    )
+)
+register_compressor(
+    Compressor(
+        name="gzip",
+        codec_id=1,
+        default_level=6,
+        compress=lambda data, level: gzip.compress(data, compresslevel=level),
+        decompress=gzip.decompress,
+    )
+)
+
+if orjson is not None:
+    register_serializer(
+        Serializer(
+            name="orjson",
+            codec_id=1,
+            dumps=lambda value: orjson.dumps(
+                value, default=str, option=orjson.OPT_NON_STR_KEYS
+            ),
+            loads=orjson.loads,
         )
+    )
+
+if msgpack is not None:
+    register_serializer(
+        Serializer(
+            name="msgpack",
+            codec_id=2,
+            dumps=lambda value: msgpack.packb(
+                value, default=_msgpack_default, use_bin_type=True
+            ),
+            loads=lambda data: msgpack.unpackb(
+                data, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False
+            ),
+        )
+    )
+
+if zstandard is not None:
+    register_compressor(
+        Compressor(
+            name="zstd",
+            codec_id=2,
+            default_level=3,
+            compress=lambda data, level: zstandard.ZstdCompressor(level=level).compress(
+                data
+            ),
+            decompress=lambda data: zstandard.ZstdDecompressor().decompress(data),
+        )
+    )
+
+if lz4_frame is not None:
+    register_compressor(
+        Compressor(
+            name="lz4",
+            codec_id=3,
+            default_level=0,
+            compress=lambda data, level: lz4_frame.compress(
+                data, compression_level=level
+            ),
+            decompress=lz4_frame.decompress,
+        )
+    )
+
+
+class LocalCache:
+    """Size- and TTL-bounded in-process LRU cache of deserialized values.
+
+    Values are stored as returned to callers, so hits skip the network round
+    trip and deserialization entirely. Callers must not mutate cached objects.
+    """
 
-        # Test connection
+    def __init__(self, max_entries: int = 1024, ttl: int = 60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        if self.max_entries <= 0:
+            return
+
+        # Never keep an entry longer than the backing store would
+        ttl = min(ttl, self.ttl) if ttl else self.ttl
+        expires_at = time.monotonic() + ttl
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> int:
+        with self._lock:
+            matching = [key for key in self._entries if fnmatchcase(key, pattern)]
+            for key in matching:
+                del self._entries[key]
+            return len(matching)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def _validate_codecs(config: CacheConfig) -> None:
+    if config.serializer not in SERIALIZERS:
+        raise ValueError(
+            f"Unknown or unavailable cache serializer: {config.serializer}"
+        )
+    if config.compressor not in COMPRESSORS:
+        raise ValueError(
+            f"Unknown or unavailable cache compressor: {config.compressor}"
+        )
+
+
+class CacheBackend(ABC):
+    """Async cache interface used by the services.
+
+    ``RedisCache`` shares entries across workers; ``DiskCache`` keeps them
+    in a local SQLite file for single-node runs. Both store values in the
+    same tagged codec format. A backend missing any abstract method fails
+    at construction.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """The cached value, or None on a miss or backend error."""
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        nx: bool = False,
+        xx: bool = False,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Store ``value``, registering the key under ``tags``."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Remove ``key``; True if it existed."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Whether ``key`` is cached and unexpired."""
+
+    @abstractmethod
+    async def ttl(self, key: str) -> int:
+        """Seconds left on ``key``; -2, as in Redis, if it isn't cached."""
+
+    @abstractmethod
+    async def expire(self, key: str, ttl: int) -> bool:
+        """Reset the expiry of an existing ``key``."""
+
+    @abstractmethod
+    async def increment(self, key: str, amount: int = 1) -> Optional[int]:
+        """Add ``amount`` to an integer counter and return the new value."""
+
+    @abstractmethod
+    async def get_many(self, keys: list) -> Dict[str, Any]:
+        """Values for the ``keys`` that are cached."""
+
+    @abstractmethod
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Store every entry of ``mapping`` with one expiry and tag set."""
+
+    @abstractmethod
+    async def flush_pattern(self, pattern: str) -> int:
+        """Delete keys matching a glob ``pattern``; the number removed."""
+
+    @abstractmethod
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete every key registered under ``tags``; the number removed."""
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Backend usage and hit-rate figures."""
+
+    async def health_check(self) -> Dict[str, Any]:
         try:
-            self.redis_client.ping()
-        except redis.ConnectionError as e:
-            raise ConnectionError(f"Failed to connect to Redis: {e}")
+            start_time = time.time()
+
+            # Test basic operations
+            test_key = f"health_check_{int(time.time())}"
+            test_value = {"timestamp": time.time(), "test": True}
+
+            # Set operation
+            await self.set(test_key, test_value, ttl=60)
+
+            # Get operation
+            retrieved_value = await self.get(test_key)
+
+            # Delete operation
+            await self.delete(test_key)
+
+            response_time = time.time() - start_time
+
+            return {
+                "status": "healthy",
+                "response_time_ms": round(response_time * 1000, 2),
+                "operations_tested": ["set", "get", "delete"],
+                "data_integrity": retrieved_value == test_value,
+            }
+
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e), "response_time_ms": None}
+
+    async def aclose(self):
+        self.close()
+
+    def close(self):
+        pass
+
+
+class BaseRedisCache:
+    """Key generation, serialization and L1 handling shared by both clients."""
+
+    def __init__(self, config: Optional[CacheConfig] = None):
+        self.config = config or CacheConfig()
+        self.redis_url = get_settings().REDIS_URL
+        _validate_codecs(self.config)
+
+        self.local_cache: Optional[LocalCache] = None
+        if self.config.local_cache_enabled:
+            self.local_cache = LocalCache(
+                max_entries=self.config.local_cache_max_entries,
+                ttl=self.config.local_cache_ttl,
+            )
+
+    def _connection_kwargs(self) -> Dict[str, Any]:
+        return {
+            "decode_responses": False,  # We'll handle encoding ourselves
+            "max_connections": self.config.max_connections,
+            "socket_timeout": self.config.socket_timeout,
+            "socket_connect_timeout": self.config.socket_connect_timeout,
+            "retry_on_timeout": True,
+            "health_check_interval": self.config.health_check_interval,
+        }
 
     def _generate_key(self, key: str) -> str:
         full_key = f"{self.config.key_prefix}:{key}"
@@ -48,39 +477,129 @@ class RedisCache:
         return full_key
 
     def _serialize_value(self, value: Any) -> bytes:
-        serialized = json.dumps(value, default=str).encode("utf-8")
+        return encode_value(
+            value,
+            serializer=self.config.serializer,
+            compressor=self.config.compressor,
+            compress_threshold=self.config.compress_threshold,
+            compress_level=self.config.compress_level,
+        )
+
+    def _deserialize_value(self, value: bytes) -> Any:
+        return decode_value(value)
 
-        # Optionally compress large values
-        if len(serialized) > self.config.compress_threshold:
-            import gzip
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.config.key_prefix}:tag:{tag}"
 
-            compressed = gzip.compress(serialized)
-            # Only use compression if it actually reduces size
-            if len(compressed) < len(serialized):
-                return b"GZIP:" + compressed
+    def _queue_tags(self, pipe, keys: List[str], tags: Iterable[str], ttl: int):
+        """Index logical keys under each tag on a pipeline."""
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, *keys)
+            pipe.expire(tag_key, max(ttl, self.config.tag_ttl))
 
-        return serialized
+    def _local_get(self, key: str) -> Optional[Any]:
+        if self.local_cache is None:
+            return None
+        return self.local_cache.get(key)
 
-    def _deserialize_value(self, value: bytes) -> Any:
-        if value.startswith(b"GZIP:"):
-            import gzip
+    def _local_set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        if self.local_cache is not None:
+            self.local_cache.set(key, value, ttl=ttl)
+
+    def _local_delete(self, key: str) -> None:
+        if self.local_cache is not None:
+            self.local_cache.delete(key)
+
+    def _local_get_many(self, keys: list) -> Dict[str, Any]:
+        result = {}
+        if self.local_cache is not None:
+            for key in keys:
+                local_value = self.local_cache.get(key)
+                if local_value is not None:
+                    result[key] = local_value
+        return result
+
+    def _decode_many(self, keys: list, values: list, result: Dict[str, Any]) -> None:
+        for key, value in zip(keys, values):
+            if value is None:
+                continue
+            try:
+                result[key] = self._deserialize_value(value)
+            except Exception as e:
+                print(f"Failed to deserialize value for key {key}: {e}")
+                continue
+            self._local_set(key, result[key])
+
+    def _format_stats(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        stats = {
+            "connected_clients": info.get("connected_clients", 0),
+            "used_memory": info.get("used_memory", 0),
+            "used_memory_human": info.get("used_memory_human", "0B"),
+            "keyspace_hits": info.get("keyspace_hits", 0),
+            "keyspace_misses": info.get("keyspace_misses", 0),
+            "total_commands_processed": info.get("total_commands_processed", 0),
+            "instantaneous_ops_per_sec": info.get("instantaneous_ops_per_sec", 0),
+            "keyspace": info.get("db0", {}),
+        }
+        stats.update(self._local_stats())
+        return stats
+
+    def _local_stats(self) -> Dict[str, Any]:
+        if self.local_cache is None:
+            return {}
+        return {"local_cache": self.local_cache.get_stats()}
 
-            decompressed = gzip.decompress(value[5:])
-            return json.loads(decompressed.decode("utf-8"))
 
-        return json.loads(value.decode("utf-8"))
+class RedisCache(BaseRedisCache, CacheBackend):
+    """Non-blocking Redis cache backed by ``redis.asyncio``.
+
+    One connection pool is kept per event loop, so callers that create a
+    fresh loop per task (Celery) get a working pool instead of connections
+    bound to a closed loop. A pool can only be closed on its own loop:
+    whoever owns a loop awaits ``aclose()`` before closing it, as
+    ``EnhancedRedditClient.stop()`` does.
+    """
+
+    def __init__(self, config: Optional[CacheConfig] = None):
+        super().__init__(config)
+        self._clients: Dict[asyncio.AbstractEventLoop, aioredis.Redis] = {}
+        self._stats_client: Optional[redis.Redis] = None
+
+    @property
+    def redis_client(self) -> aioredis.Redis:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            self._forget_closed_loops()
+            client = self._clients[loop] = aioredis.from_url(
+                self.redis_url, **self._connection_kwargs()
+            )
+        return client
+
+    def _forget_closed_loops(self) -> None:
+        # Clients of loops closed without aclose() can't be awaited any
+        # more; drop them so their sockets are reclaimed with the objects
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            del self._clients[loop]
 
     async def get(self, key: str) -> Optional[Any]:
+        local_value = self._local_get(key)
+        if local_value is not None:
+            return local_value
+
         try:
             redis_key = self._generate_key(key)
-            value = self.redis_client.get(redis_key)
+            value = await self.redis_client.get(redis_key)
 
             if value is None:
                 return None
 
-            return self._deserialize_value(value)
+            result = self._deserialize_value(value)
+            self._local_set(key, result)
+            return result
 
-        except (redis.RedisError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        except (redis.RedisError, ValueError, KeyError, OSError) as e:
             print(f"Cache get error for key {key}: {e}")
             return None
 
@@ -91,26 +610,40 @@ class RedisCache:
         ttl: Optional[int] = None,
         nx: bool = False,
         xx: bool = False,
+        tags: Optional[Iterable[str]] = None,
     ) -> bool:
         try:
             redis_key = self._generate_key(key)
             serialized_value = self._serialize_value(value)
             ttl = ttl or self.config.default_ttl
 
-            result = self.redis_client.set(
-                redis_key, serialized_value, ex=ttl, nx=nx, xx=xx
-            )
+            if tags:
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.set(redis_key, serialized_value, ex=ttl, nx=nx, xx=xx)
+                self._queue_tags(pipe, [key], tags, ttl)
+                result = (await pipe.execute())[0]
+            else:
+                result = await self.redis_client.set(
+                    redis_key, serialized_value, ex=ttl, nx=nx, xx=xx
+                )
+
+            if result:
+                self._local_set(key, value, ttl=ttl)
+            elif not nx:
+                self._local_delete(key)
 
             return bool(result)
 
-        except (redis.RedisError, json.JSONEncodeError) as e:
+        except (redis.RedisError, TypeError, ValueError) as e:
             print(f"Cache set error for key {key}: {e}")
             return False
 
     async def delete(self, key: str) -> bool:
+        self._local_delete(key)
+
         try:
             redis_key = self._generate_key(key)
-            result = self.redis_client.delete(redis_key)
+            result = await self.redis_client.delete(redis_key)
             return result > 0
 
         except redis.RedisError as e:
@@ -120,7 +653,7 @@ class RedisCache:
     async def exists(self, key: str) -> bool:
         try:
             redis_key = self._generate_key(key)
-            return bool(self.redis_client.exists(redis_key))
+            return bool(await self.redis_client.exists(redis_key))
 
         except redis.RedisError as e:
             print(f"Cache exists error for key {key}: {e}")
@@ -129,142 +662,430 @@ class RedisCache:
     async def ttl(self, key: str) -> int:
         try:
             redis_key = self._generate_key(key)
-            return self.redis_client.ttl(redis_key)
+            return await self.redis_client.ttl(redis_key)
 
         except redis.RedisError as e:
             print(f"Cache TTL error for key {key}: {e}")
             return -1
 
     async def expire(self, key: str, ttl: int) -> bool:
+        self._local_delete(key)
+
         try:
             redis_key = self._generate_key(key)
-            return bool(self.redis_client.expire(redis_key, ttl))
+            return bool(await self.redis_client.expire(redis_key, ttl))
 
         except redis.RedisError as e:
             print(f"Cache expire error for key {key}: {e}")
             return False
 
     async def increment(self, key: str, amount: int = 1) -> Optional[int]:
+        self._local_delete(key)
+
         try:
             redis_key = self._generate_key(key)
-            return self.redis_client.incrby(redis_key, amount)
+            return await self.redis_client.incrby(redis_key, amount)
 
         except redis.RedisError as e:
             print(f"Cache increment error for key {key}: {e}")
             return None
 
     async def get_many(self, keys: list) -> Dict[str, Any]:
+        result = self._local_get_many(keys)
+        keys = [key for key in keys if key not in result]
+        if not keys:
+            return result
+
         try:
             redis_keys = [self._generate_key(key) for key in keys]
-            values = self.redis_client.mget(redis_keys)
-
-            result = {}
-            for key, value in zip(keys, values):
-                if value is not None:
-                    try:
-                        result[key] = self._deserialize_value(value)
-                    except Exception as e:
-                        print(f"Failed to deserialize value for key {key}: {e}")
-
+            values = await self.redis_client.mget(redis_keys)
+            self._decode_many(keys, values, result)
             return result
 
         except redis.RedisError as e:
             print(f"Cache get_many error: {e}")
-            return {}
+            return result
 
     async def set_many(
-        self, mapping: Dict[str, Any], ttl: Optional[int] = None
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
     ) -> bool:
         try:
             ttl = ttl or self.config.default_ttl
-            pipe = self.redis_client.pipeline()
+            pipe = self.redis_client.pipeline(transaction=False)
 
             for key, value in mapping.items():
                 redis_key = self._generate_key(key)
                 serialized_value = self._serialize_value(value)
                 pipe.set(redis_key, serialized_value, ex=ttl)
 
-            results = pipe.execute()
+            if tags and mapping:
+                self._queue_tags(pipe, list(mapping), tags, ttl)
+
+            results = (await pipe.execute())[: len(mapping)]
+
+            for key, value in mapping.items():
+                self._local_set(key, value, ttl=ttl)
+
             return all(results)
 
-        except (redis.RedisError, json.JSONEncodeError) as e:
+        except (redis.RedisError, TypeError, ValueError) as e:
             print(f"Cache set_many error: {e}")
             return False
 
+    async def _unlink(self, redis_keys: List[Any]) -> int:
+        # UNLINK frees memory off the main thread; DEL is the pre-4.0 fallback
+        try:
+            return await self.redis_client.unlink(*redis_keys)
+        except redis.ResponseError:
+            return await self.redis_client.delete(*redis_keys)
+
     async def flush_pattern(self, pattern: str) -> int:
+        """Delete keys matching a glob with incremental SCAN, never KEYS."""
+        if self.local_cache is not None:
+            self.local_cache.delete_pattern(pattern)
+
         try:
             full_pattern = self._generate_key(pattern)
-            keys = self.redis_client.keys(full_pattern)
+            batch_size = self.config.scan_batch_size
+            deleted = 0
+            batch = []
 
-            if keys:
-                return self.redis_client.delete(*keys)
+            async for redis_key in self.redis_client.scan_iter(
+                match=full_pattern, count=batch_size
+            ):
+                batch.append(redis_key)
+                if len(batch) >= batch_size:
+                    deleted += await self._unlink(batch)
+                    batch = []
 
-            return 0
+            if batch:
+                deleted += await self._unlink(batch)
+
+            return deleted
 
         except redis.RedisError as e:
             print(f"Cache flush_pattern error: {e}")
             return 0
 
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete every key registered under the given tags."""
+        deleted = 0
+        try:
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                batch = []
+                found = False
+
+                async for member in self.redis_client.sscan_iter(
+                    tag_key, count=self.config.scan_batch_size
+                ):
+                    key = member.decode("utf-8")
+                    found = True
+                    self._local_delete(key)
+                    batch.append(self._generate_key(key))
+                    if len(batch) >= self.config.scan_batch_size:
+                        deleted += await self._unlink(batch)
+                        batch = []
+
+                # Count only cached keys that still existed, not the tag set
+                # (which exists whenever SSCAN returned members)
+                removed = await self._unlink(batch + [tag_key])
+                deleted += max(removed - (1 if found else 0), 0)
+
+            return deleted
+
+        except redis.RedisError as e:
+            print(f"Cache invalidate_tags error: {e}")
+            return deleted
+
     def get_stats(self) -> Dict[str, Any]:
+        # INFO is diagnostic only, so it goes over a small blocking client
+        # rather than forcing every caller of get_stats() to be async.
         try:
-            info = self.redis_client.info()
-            return {
-                "connected_clients": info.get("connected_clients", 0),
-                "used_memory": info.get("used_memory", 0),
-                "used_memory_human": info.get("used_memory_human", "0B"),
-                "keyspace_hits": info.get("keyspace_hits", 0),
-                "keyspace_misses": info.get("keyspace_misses", 0),
-                "total_commands_processed": info.get("total_commands_processed", 0),
-                "instantaneous_ops_per_sec": info.get("instantaneous_ops_per_sec", 0),
-                "keyspace": info.get("db0", {}),
-            }
+            if self._stats_client is None:
+                self._stats_client = redis.from_url(
+                    self.redis_url,
+                    socket_timeout=self.config.socket_timeout,
+                    socket_connect_timeout=self.config.socket_connect_timeout,
+                )
+            return self._format_stats(self._stats_client.info())
 
         except redis.RedisError as e:
             print(f"Cache stats error: {e}")
-            return {}
+            return self._local_stats()
 
-    async def health_check(self) -> Dict[str, Any]:
+    async def aclose(self):
+        if self.local_cache is not None:
+            self.local_cache.clear()
+
+        # Only this loop's pool can be awaited here; other loops close theirs
+        client = self._clients.pop(asyncio.get_running_loop(), None)
         try:
-            start_time = time.time()
+            if client is not None:
+                close = getattr(client, "aclose", None) or client.close
+                await close()
+        except Exception as e:
+            print(f"Error closing Redis connection: {e}")
+        finally:
+            self.close()
 
-            # Test basic operations
-            test_key = f"health_check_{int(time.time())}"
-            test_value = {"timestamp": time.time(), "test": True}
+    def close(self):
+        if self.local_cache is not None:
+            self.local_cache.clear()
 
-            # Set operation
-            await self.set(test_key, test_value, ttl=60)
+        # Async pools are closed per loop by aclose(); only the blocking
+        # stats connection can be closed from here.
+        self._forget_closed_loops()
+        try:
+            if self._stats_client is not None:
+                self._stats_client.close()
+                self._stats_client = None
+        except Exception as e:
+            print(f"Error closing Redis connection: {e}")
 
-            # Get operation
-            retrieved_value = await self.get(test_key)
 
-            # Delete operation
-            await self.delete(test_key)
+class SyncRedisCache(BaseRedisCache):
+    """Blocking facade over the same keys and encoding as ``RedisCache``.
 
-            response_time = time.time() - start_time
+    Intended for code that has no event loop, such as Celery tasks and CLI
+    commands.
+    """
 
-            return {
-                "status": "healthy",
-                "response_time_ms": round(response_time * 1000, 2),
-                "operations_tested": ["set", "get", "delete"],
-                "data_integrity": retrieved_value == test_value,
-            }
+    def __init__(self, config: Optional[CacheConfig] = None):
+        super().__init__(config)
+        self.redis_client = redis.from_url(self.redis_url, **self._connection_kwargs())
 
-        except Exception as e:
-            return {"status": "unhealthy", "error": str(e), "response_time_ms": None}
+    def get(self, key: str) -> Optional[Any]:
+        local_value = self._local_get(key)
+        if local_value is not None:
+            return local_value
+
+        try:
+            value = self.redis_client.get(self._generate_key(key))
+
+            if value is None:
+                return None
+
+            result = self._deserialize_value(value)
+            self._local_set(key, result)
+            return result
+
+        except (redis.RedisError, ValueError, KeyError, OSError) as e:
+            print(f"Cache get error for key {key}: {e}")
+            return None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        nx: bool = False,
+        xx: bool = False,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        try:
+            ttl = ttl or self.config.default_ttl
+            redis_key = self._generate_key(key)
+            serialized_value = self._serialize_value(value)
+
+            if tags:
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.set(redis_key, serialized_value, ex=ttl, nx=nx, xx=xx)
+                self._queue_tags(pipe, [key], tags, ttl)
+                result = pipe.execute()[0]
+            else:
+                result = self.redis_client.set(
+                    redis_key, serialized_value, ex=ttl, nx=nx, xx=xx
+                )
+
+            if result:
+                self._local_set(key, value, ttl=ttl)
+            elif not nx:
+                self._local_delete(key)
+
+            return bool(result)
+
+        except (redis.RedisError, TypeError, ValueError) as e:
+            print(f"Cache set error for key {key}: {e}")
+            return False
+
+    def delete(self, key: str) -> bool:
+        self._local_delete(key)
+
+        try:
+            return self.redis_client.delete(self._generate_key(key)) > 0
+
+        except redis.RedisError as e:
+            print(f"Cache delete error for key {key}: {e}")
+            return False
+
+    def get_many(self, keys: list) -> Dict[str, Any]:
+        result = self._local_get_many(keys)
+        keys = [key for key in keys if key not in result]
+        if not keys:
+            return result
+
+        try:
+            values = self.redis_client.mget([self._generate_key(key) for key in keys])
+            self._decode_many(keys, values, result)
+            return result
+
+        except redis.RedisError as e:
+            print(f"Cache get_many error: {e}")
+            return result
+
+    def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        try:
+            ttl = ttl or self.config.default_ttl
+            pipe = self.redis_client.pipeline(transaction=False)
+
+            for key, value in mapping.items():
+                pipe.set(self._generate_key(key), self._serialize_value(value), ex=ttl)
+
+            if tags and mapping:
+                self._queue_tags(pipe, list(mapping), tags, ttl)
+
+            results = pipe.execute()[: len(mapping)]
+
+            for key, value in mapping.items():
+                self._local_set(key, value, ttl=ttl)
+
+            return all(results)
+
+        except (redis.RedisError, TypeError, ValueError) as e:
+            print(f"Cache set_many error: {e}")
+            return False
+
+    def _unlink(self, redis_keys: List[Any]) -> int:
+        try:
+            return self.redis_client.unlink(*redis_keys)
+        except redis.ResponseError:
+            return self.redis_client.delete(*redis_keys)
+
+    def flush_pattern(self, pattern: str) -> int:
+        """Delete keys matching a glob with incremental SCAN, never KEYS."""
+        if self.local_cache is not None:
+            self.local_cache.delete_pattern(pattern)
+
+        try:
+            batch_size = self.config.scan_batch_size
+            deleted = 0
+            batch = []
+
+            for redis_key in self.redis_client.scan_iter(
+                match=self._generate_key(pattern), count=batch_size
+            ):
+                batch.append(redis_key)
+                if len(batch) >= batch_size:
+                    deleted += self._unlink(batch)
+                    batch = []
+
+            if batch:
+                deleted += self._unlink(batch)
+
+            return deleted
+
+        except redis.RedisError as e:
+            print(f"Cache flush_pattern error: {e}")
+            return 0
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Delete every key registered under the given tags."""
+        deleted = 0
+        try:
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                batch = []
+                found = False
+
+                for member in self.redis_client.sscan_iter(
+                    tag_key, count=self.config.scan_batch_size
+                ):
+                    key = member.decode("utf-8")
+                    found = True
+                    self._local_delete(key)
+                    batch.append(self._generate_key(key))
+                    if len(batch) >= self.config.scan_batch_size:
+                        deleted += self._unlink(batch)
+                        batch = []
+
+                # Count only cached keys that still existed, not the tag set
+                # (which exists whenever SSCAN returned members)
+                removed = self._unlink(batch + [tag_key])
+                deleted += max(removed - (1 if found else 0), 0)
+
+            return deleted
+
+        except redis.RedisError as e:
+            print(f"Cache invalidate_tags error: {e}")
+            return deleted
+
+    def get_stats(self) -> Dict[str, Any]:
+        try:
+            return self._format_stats(self.redis_client.info())
+
+        except redis.RedisError as e:
+            print(f"Cache stats error: {e}")
+            return self._local_stats()
 
     def close(self):
+        if self.local_cache is not None:
+            self.local_cache.clear()
+
         try:
             self.redis_client.close()
         except Exception as e:
             print(f"Error closing Redis connection: {e}")
 
 
-# Global cache instance
+def _cache_config_from_settings() -> CacheConfig:
+    settings = get_settings()
+    return CacheConfig(
+        disk_path=settings.CACHE_PATH,
+        disk_max_bytes=settings.CACHE_MAX_SIZE_MB * 1024 * 1024,
+        local_cache_enabled=settings.CACHE_LOCAL_ENABLED,
+        local_cache_max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+        local_cache_ttl=settings.CACHE_LOCAL_TTL,
+        max_connections=settings.CACHE_MAX_CONNECTIONS,
+        serializer=settings.CACHE_SERIALIZER,
+        compressor=settings.CACHE_COMPRESSOR,
+        compress_threshold=settings.CACHE_COMPRESS_THRESHOLD,
+    )
+
+
+# Global cache instances
 _cache_instance = None
+_sync_cache_instance = None
 
 
-def get_cache() -> RedisCache:
+def get_cache() -> CacheBackend:
+    """Return the process-wide cache selected by ``CACHE_BACKEND``."""
     global _cache_instance
     if _cache_instance is None:
-        _cache_instance = RedisCache()
+        backend = get_settings().CACHE_BACKEND.lower()
+        config = _cache_config_from_settings()
+        if backend == "redis":
+            _cache_instance = RedisCache(config)
+        elif backend == "disk":
+            from reddit_analyzer.core.disk_cache import DiskCache
+
+            _cache_instance = DiskCache(config)
+        else:
+            raise ValueError(f"Unknown cache backend: {backend}")
     return _cache_instance
+
+
+def get_sync_cache() -> SyncRedisCache:
+    """Return the process-wide blocking Redis cache for code without a loop."""
+    global _sync_cache_instance
+    if _sync_cache_instance is None:
+        _sync_cache_instance = SyncRedisCache(_cache_config_from_settings())
+    return _sync_cache_instance
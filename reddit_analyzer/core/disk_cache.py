@@ -0,0 +1,517 @@
+"""Embedded SQLite cache backend for single-node runs."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+from reddit_analyzer.core.cache import (
+    CacheBackend,
+    CacheConfig,
+    _validate_codecs,
+    decode_value,
+    encode_value,
+)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        size INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries (expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache_entries (accessed_at)",
+    """
+    CREATE TABLE IF NOT EXISTS cache_tags (
+        tag TEXT NOT NULL,
+        key TEXT NOT NULL,
+        PRIMARY KEY (tag, key)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags (key)",
+)
+
+# Stay well under SQLITE_MAX_VARIABLE_NUMBER on older builds
+_MAX_PARAMS = 500
+
+
+def _chunks(items: List[Any], size: int = _MAX_PARAMS) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class DiskCache(CacheBackend):
+    """Persistent cache in a local SQLite file.
+
+    Entries survive across CLI invocations with no network round trip.
+    Expired entries are dropped lazily on read and in bulk during eviction;
+    once stored values exceed ``disk_max_bytes`` the least recently used
+    entries are evicted down to 90% of the budget. Every call runs in a
+    worker thread, so the event loop never waits on disk I/O.
+    """
+
+    EVICTION_TARGET = 0.9
+    EVICTION_CHECK_WRITES = 100
+
+    def __init__(
+        self, config: Optional[CacheConfig] = None, path: Optional[str] = None
+    ):
+        self.config = config or CacheConfig()
+        _validate_codecs(self.config)
+        self.path = path or self.config.disk_path
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes_since_check = 0
+        self._bytes_since_check = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                directory = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(directory, exist_ok=True)
+
+            # Autocommit; multi-statement writes open their own transaction
+            conn = sqlite3.connect(
+                self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            if self.path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self.connection
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    async def _run(self, func, *args):
+        def _locked():
+            with self._lock:
+                return func(*args)
+
+        return await asyncio.to_thread(_locked)
+
+    def _serialize_value(self, value: Any) -> bytes:
+        return encode_value(
+            value,
+            serializer=self.config.serializer,
+            compressor=self.config.compressor,
+            compress_threshold=self.config.compress_threshold,
+            compress_level=self.config.compress_level,
+        )
+
+    @staticmethod
+    def _glob(pattern: str) -> str:
+        # fnmatch negates classes with [!...], SQLite GLOB with [^...]
+        return pattern.replace("[!", "[^")
+
+    # Blocking implementations, always called with self._lock held
+
+    def _get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        row = self.connection.execute(
+            "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        if row[1] <= now:
+            self.connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self.connection.execute(
+            "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+        )
+        self.hits += 1
+        return row[0]
+
+    def _get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        now = time.time()
+        found = {}
+        for chunk in _chunks(keys):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.connection.execute(
+                "SELECT key, value FROM cache_entries "
+                f"WHERE key IN ({placeholders}) AND expires_at > ?",
+                (*chunk, now),
+            ).fetchall()
+            found.update(rows)
+
+        if found:
+            self.connection.executemany(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
+                [(now, key) for key in found],
+            )
+        self.hits += len(found)
+        self.misses += len(set(keys)) - len(found)
+        return found
+
+    def _write(
+        self, conn: sqlite3.Connection, key: str, data: bytes, ttl: int, now: float
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries "
+            "(key, value, expires_at, accessed_at, size) VALUES (?, ?, ?, ?, ?)",
+            (key, data, now + ttl, now, len(data)),
+        )
+
+    def _tag(
+        self, conn: sqlite3.Connection, keys: List[str], tags: Optional[Iterable[str]]
+    ) -> None:
+        if tags:
+            conn.executemany(
+                "INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)",
+                [(tag, key) for tag in tags for key in keys],
+            )
+
+    def _set(
+        self,
+        key: str,
+        data: bytes,
+        ttl: int,
+        nx: bool,
+        xx: bool,
+        tags: Optional[Iterable[str]],
+    ) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            if nx or xx:
+                row = conn.execute(
+                    "SELECT 1 FROM cache_entries WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if (nx and row is not None) or (xx and row is None):
+                    return False
+            self._write(conn, key, data, ttl, now)
+            self._tag(conn, [key], tags)
+
+        self._note_write(len(data))
+        return True
+
+    def _set_many(
+        self, encoded: Dict[str, bytes], ttl: int, tags: Optional[Iterable[str]]
+    ) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            for key, data in encoded.items():
+                self._write(conn, key, data, ttl, now)
+            self._tag(conn, list(encoded), tags)
+
+        self._note_write(sum(len(data) for data in encoded.values()))
+        return True
+
+    def _delete_keys(self, conn: sqlite3.Connection, keys: List[str]) -> int:
+        deleted = 0
+        for chunk in _chunks(keys):
+            placeholders = ",".join("?" * len(chunk))
+            deleted += conn.execute(
+                f"DELETE FROM cache_entries WHERE key IN ({placeholders})", chunk
+            ).rowcount
+            conn.execute(f"DELETE FROM cache_tags WHERE key IN ({placeholders})", chunk)
+        return deleted
+
+    def _delete(self, key: str) -> bool:
+        with self._transaction() as conn:
+            return self._delete_keys(conn, [key]) > 0
+
+    def _exists(self, key: str) -> bool:
+        row = self.connection.execute(
+            "SELECT 1 FROM cache_entries WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        return row is not None
+
+    def _ttl(self, key: str) -> int:
+        now = time.time()
+        row = self.connection.execute(
+            "SELECT expires_at FROM cache_entries WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        # Same convention as Redis TTL: -2 means the key does not exist
+        return int(row[0] - now) if row else -2
+
+    def _expire(self, key: str, ttl: int) -> bool:
+        now = time.time()
+        cursor = self.connection.execute(
+            "UPDATE cache_entries SET expires_at = ? WHERE key = ? AND expires_at > ?",
+            (now + ttl, key, now),
+        )
+        return cursor.rowcount > 0
+
+    def _increment(self, key: str, amount: int) -> int:
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache_entries "
+                "WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            value = int(decode_value(row[0])) + amount if row else amount
+            ttl = row[1] - now if row else self.config.default_ttl
+            self._write(conn, key, self._serialize_value(value), ttl, now)
+        return value
+
+    def _flush_pattern(self, pattern: str) -> int:
+        with self._transaction() as conn:
+            keys = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT key FROM cache_entries WHERE key GLOB ?",
+                    (self._glob(pattern),),
+                )
+            ]
+            return self._delete_keys(conn, keys)
+
+    def _invalidate_tags(self, tags: List[str]) -> int:
+        placeholders = ",".join("?" * len(tags))
+        with self._transaction() as conn:
+            keys = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT DISTINCT key FROM cache_tags WHERE tag IN ({placeholders})",
+                    tags,
+                )
+            ]
+            deleted = self._delete_keys(conn, keys)
+            conn.execute(f"DELETE FROM cache_tags WHERE tag IN ({placeholders})", tags)
+        return deleted
+
+    def _note_write(self, size: int) -> None:
+        self._writes_since_check += 1
+        self._bytes_since_check += size
+        # Summing the table is O(entries), so only check periodically or
+        # when enough new data could have pushed us over budget.
+        if (
+            self._writes_since_check >= self.EVICTION_CHECK_WRITES
+            or self._bytes_since_check
+            >= self.config.disk_max_bytes * (1 - self.EVICTION_TARGET)
+        ):
+            self._evict()
+
+    def _evict(self) -> None:
+        self._writes_since_check = 0
+        self._bytes_since_check = 0
+        now = time.time()
+
+        with self._transaction() as conn:
+            expired = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT key FROM cache_entries WHERE expires_at <= ?", (now,)
+                )
+            ]
+            self.expirations += self._delete_keys(conn, expired)
+
+            total = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()[0]
+            if total <= self.config.disk_max_bytes:
+                return
+
+            excess = total - self.config.disk_max_bytes * self.EVICTION_TARGET
+            victims = []
+            for key, size in conn.execute(
+                "SELECT key, size FROM cache_entries ORDER BY accessed_at"
+            ):
+                victims.append(key)
+                excess -= size
+                if excess <= 0:
+                    break
+            self.evictions += self._delete_keys(conn, victims)
+
+    def _stats(self) -> Dict[str, Any]:
+        entries, size = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "backend": "disk",
+            "path": self.path,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.config.disk_max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    # CacheBackend interface
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            value = await self._run(self._get, key)
+            if value is None:
+                return None
+            return decode_value(value)
+
+        except (sqlite3.Error, ValueError, KeyError) as e:
+            print(f"Cache get error for key {key}: {e}")
+            return None
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        nx: bool = False,
+        xx: bool = False,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        try:
+            data = self._serialize_value(value)
+            ttl = ttl or self.config.default_ttl
+            return await self._run(self._set, key, data, ttl, nx, xx, tags)
+
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Cache set error for key {key}: {e}")
+            return False
+
+    async def delete(self, key: str) -> bool:
+        try:
+            return await self._run(self._delete, key)
+
+        except sqlite3.Error as e:
+            print(f"Cache delete error for key {key}: {e}")
+            return False
+
+    async def exists(self, key: str) -> bool:
+        try:
+            return await self._run(self._exists, key)
+
+        except sqlite3.Error as e:
+            print(f"Cache exists error for key {key}: {e}")
+            return False
+
+    async def ttl(self, key: str) -> int:
+        try:
+            return await self._run(self._ttl, key)
+
+        except sqlite3.Error as e:
+            print(f"Cache TTL error for key {key}: {e}")
+            return -1
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        try:
+            return await self._run(self._expire, key, ttl)
+
+        except sqlite3.Error as e:
+            print(f"Cache expire error for key {key}: {e}")
+            return False
+
+    async def increment(self, key: str, amount: int = 1) -> Optional[int]:
+        try:
+            return await self._run(self._increment, key, amount)
+
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Cache increment error for key {key}: {e}")
+            return None
+
+    async def get_many(self, keys: list) -> Dict[str, Any]:
+        result = {}
+        if not keys:
+            return result
+
+        try:
+            found = await self._run(self._get_many, list(keys))
+        except sqlite3.Error as e:
+            print(f"Cache get_many error: {e}")
+            return result
+
+        for key, value in found.items():
+            try:
+                result[key] = decode_value(value)
+            except Exception as e:
+                print(f"Failed to deserialize value for key {key}: {e}")
+        return result
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        try:
+            encoded = {
+                key: self._serialize_value(value) for key, value in mapping.items()
+            }
+            ttl = ttl or self.config.default_ttl
+            return await self._run(self._set_many, encoded, ttl, tags)
+
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Cache set_many error: {e}")
+            return False
+
+    async def flush_pattern(self, pattern: str) -> int:
+        try:
+            return await self._run(self._flush_pattern, pattern)
+
+        except sqlite3.Error as e:
+            print(f"Cache flush_pattern error: {e}")
+            return 0
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        if not tags:
+            return 0
+
+        try:
+            return await self._run(self._invalidate_tags, list(tags))
+
+        except sqlite3.Error as e:
+            print(f"Cache invalidate_tags error: {e}")
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        try:
+            with self._lock:
+                return self._stats()
+
+        except sqlite3.Error as e:
+            print(f"Cache stats error: {e}")
+            return {"backend": "disk", "path": self.path}
+
+    async def aclose(self):
+        await self._run(self._close_connection)
+
+    def close(self):
+        with self._lock:
+            self._close_connection()
+
+    def _close_connection(self):
+        # The connection is reopened lazily, so a closed cache is reusable
+        try:
+            if self._conn is not None:
+                self._conn.close()
+        except sqlite3.Error as e:
+            print(f"Error closing cache database: {e}")
+        finally:
+            self._conn = None
@@ -0,0 +1,342 @@
+"""Rate limiter whose budget is shared by every worker through Redis."""
+
+import asyncio
+import math
+import os
+import socket
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+from uuid import uuid4
+
+import redis
+import redis.asyncio as aioredis
+
+from reddit_analyzer.core.rate_limiter import (
+    BURST_WINDOW,
+    MINUTE_WINDOW,
+    RateLimitConfig,
+    RateLimiter,
+)
+
+# GCRA over three theoretical arrival times: the global per-minute limit,
+# the global burst limit and this worker's fair share of the minute limit.
+# Time comes from the Redis server so worker clock skew cannot leak budget.
+#
+# KEYS: minute tat, burst tat, active worker zset, worker tat
+# ARGV: minute interval, minute tolerance, burst interval, burst tolerance,
+#       worker id, worker ttl, commit (1 = reserve, 0 = acquire-or-fail)
+# Returns: {granted, delay, active workers, minute tat, now}
+GCRA_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+
+local mi = tonumber(ARGV[1])
+local mtol = tonumber(ARGV[2])
+local bi = tonumber(ARGV[3])
+local btol = tonumber(ARGV[4])
+local worker_ttl = tonumber(ARGV[6])
+local commit = ARGV[7] == '1'
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', now - worker_ttl)
+redis.call('ZADD', KEYS[3], now, ARGV[5])
+redis.call('PEXPIRE', KEYS[3], math.ceil(worker_ttl * 1000))
+local workers = redis.call('ZCARD', KEYS[3])
+
+local mtat = tonumber(redis.call('GET', KEYS[1]) or '0')
+local btat = tonumber(redis.call('GET', KEYS[2]) or '0')
+local wtat = tonumber(redis.call('GET', KEYS[4]) or '0')
+
+-- Each worker may burst its share of burst_limit, then runs at 1/workers
+-- of the minute rate
+local wi = mi * workers
+local wtol = math.max((bi + btol) / bi / workers - 1, 0) * wi
+
+local delay = math.max(mtat - mtol - now, btat - btol - now, wtat - wtol - now, 0)
+if delay > 0 and not commit then
+    return {0, tostring(delay), workers, tostring(mtat), tostring(now)}
+end
+
+local at = now + delay
+mtat = math.max(mtat, at) + mi
+btat = math.max(btat, at) + bi
+wtat = math.max(wtat, at) + wi
+
+-- Keys expire once their limit has fully replenished
+redis.call('SET', KEYS[1], tostring(mtat), 'PX', math.ceil((mtat - now) * 1000) + 1000)
+redis.call('SET', KEYS[2], tostring(btat), 'PX', math.ceil((btat - now) * 1000) + 1000)
+redis.call('SET', KEYS[4], tostring(wtat), 'PX', math.ceil((wtat - now) * 1000) + 1000)
+
+return {1, tostring(delay), workers, tostring(mtat), tostring(now)}
+"""
+
+
+@dataclass
+class Reservation:
+    """Outcome of one atomic check against the shared budget."""
+
+    granted: bool
+    delay: float
+    active_workers: int
+    minute_tat: float
+    now: float
+
+
+def _gcra_params(config: RateLimitConfig) -> Tuple[float, float, float, float]:
+    minute_interval = MINUTE_WINDOW / config.requests_per_minute
+    burst_interval = BURST_WINDOW / config.burst_limit
+    return (
+        minute_interval,
+        MINUTE_WINDOW - minute_interval,
+        burst_interval,
+        BURST_WINDOW - burst_interval,
+    )
+
+
+class RedisRateLimitStore:
+    """Shared limiter state in Redis, updated atomically by ``GCRA_SCRIPT``."""
+
+    def __init__(self, redis_url: str, key_prefix: str = "reddit_analyzer:ratelimit"):
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self._client: Optional[aioredis.Redis] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._script = None
+
+    @property
+    def redis_client(self) -> aioredis.Redis:
+        # One client per event loop, as in RedisCache
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = aioredis.from_url(self.redis_url)
+            self._client_loop = loop
+            self._script = self._client.register_script(GCRA_SCRIPT)
+        return self._client
+
+    def _keys(self, endpoint: str, worker_id: str):
+        # The hash tag keeps one endpoint's keys in a single cluster slot
+        base = f"{self.key_prefix}:{{{endpoint}}}"
+        return [
+            f"{base}:minute",
+            f"{base}:burst",
+            f"{base}:workers",
+            f"{base}:worker:{worker_id}",
+        ]
+
+    async def reserve(
+        self,
+        endpoint: str,
+        config: RateLimitConfig,
+        worker_id: str,
+        worker_ttl: float,
+        commit: bool,
+    ) -> Reservation:
+        client = self.redis_client
+        granted, delay, workers, minute_tat, now = await self._script(
+            keys=self._keys(endpoint, worker_id),
+            args=[*_gcra_params(config), worker_id, worker_ttl, int(commit)],
+            client=client,
+        )
+        return Reservation(
+            bool(granted), float(delay), int(workers), float(minute_tat), float(now)
+        )
+
+    async def reset(self, endpoint: str) -> None:
+        base = f"{self.key_prefix}:{{{endpoint}}}"
+        keys = [key async for key in self.redis_client.scan_iter(match=f"{base}:*")]
+        if keys:
+            await self.redis_client.delete(*keys)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            close = getattr(self._client, "aclose", None) or self._client.close
+            await close()
+        self._client = None
+        self._client_loop = None
+
+
+class MemoryRateLimitStore:
+    """In-process stand-in for ``RedisRateLimitStore``.
+
+    Runs the same algorithm as ``GCRA_SCRIPT``; limiters sharing one
+    instance behave like workers sharing one Redis.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.tats: Dict[str, float] = {}
+        self.workers: Dict[str, Dict[str, float]] = {}
+
+    async def reserve(
+        self,
+        endpoint: str,
+        config: RateLimitConfig,
+        worker_id: str,
+        worker_ttl: float,
+        commit: bool,
+    ) -> Reservation:
+        now = self.clock()
+        mi, mtol, bi, btol = _gcra_params(config)
+
+        workers = self.workers.setdefault(endpoint, {})
+        for other, seen in list(workers.items()):
+            if seen <= now - worker_ttl:
+                del workers[other]
+        workers[worker_id] = now
+        active = len(workers)
+
+        keys = (
+            f"{endpoint}:minute",
+            f"{endpoint}:burst",
+            f"{endpoint}:worker:{worker_id}",
+        )
+        mtat, btat, wtat = (self.tats.get(key, 0.0) for key in keys)
+        wi = mi * active
+        wtol = max((bi + btol) / bi / active - 1, 0.0) * wi
+
+        delay = max(mtat - mtol - now, btat - btol - now, wtat - wtol - now, 0.0)
+        if delay > 0 and not commit:
+            return Reservation(False, delay, active, mtat, now)
+
+        at = now + delay
+        mtat = max(mtat, at) + mi
+        btat = max(btat, at) + bi
+        wtat = max(wtat, at) + wi
+        self.tats.update(zip(keys, (mtat, btat, wtat)))
+        return Reservation(True, delay, active, mtat, now)
+
+    async def reset(self, endpoint: str) -> None:
+        self.workers.pop(endpoint, None)
+        for key in [key for key in self.tats if key.startswith(f"{endpoint}:")]:
+            del self.tats[key]
+
+    async def aclose(self) -> None:
+        pass
+
+
+class DistributedRateLimiter(RateLimiter):
+    """``RateLimiter`` whose ``RateLimitConfig`` is a fleet-wide budget.
+
+    Every worker checks the same GCRA state in the store, so the fleet as a
+    whole never exceeds ``requests_per_minute`` or ``burst_limit``. Workers
+    that reserved within ``worker_ttl`` seconds count as active, and each is
+    additionally held to ``1/active`` of the minute rate and of the burst so
+    one busy worker cannot queue ahead of the rest. If the store is
+    unreachable the limiter falls back to a local limiter sized to this
+    worker's last known share.
+    """
+
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        store,
+        worker_id: Optional[str] = None,
+        worker_ttl: float = 30.0,
+    ):
+        super().__init__(config)
+        self.store = store
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        )
+        self.worker_ttl = worker_ttl
+        self.last_reservations: Dict[str, Reservation] = {}
+        self._fallback: Optional[RateLimiter] = None
+
+    def _local_fallback(self, endpoint: str) -> RateLimiter:
+        last = self.last_reservations.get(endpoint)
+        workers = last.active_workers if last else 1
+        if self._fallback is None:
+            self._fallback = RateLimiter(
+                RateLimitConfig(
+                    requests_per_minute=max(
+                        1, self.config.requests_per_minute // workers
+                    ),
+                    burst_limit=max(1, self.config.burst_limit // workers),
+                    backoff_factor=self.config.backoff_factor,
+                    max_retries=self.config.max_retries,
+                    initial_delay=self.config.initial_delay,
+                )
+            )
+        return self._fallback
+
+    async def _reserve(self, endpoint: str, commit: bool) -> Optional[Reservation]:
+        # Adaptive limits come from this worker's view of the shared OAuth
+        # budget, which already reflects what the rest of the fleet spent
+        requests_per_minute, burst_limit = self.effective_limits(time.time())
+        limits = RateLimitConfig(
+            requests_per_minute=requests_per_minute, burst_limit=burst_limit
+        )
+        try:
+            reservation = await self.store.reserve(
+                endpoint, limits, self.worker_id, self.worker_ttl, commit
+            )
+        except (redis.RedisError, OSError) as e:
+            print(f"Distributed rate limiter unavailable, limiting locally: {e}")
+            return None
+
+        self._fallback = None
+        self.last_reservations[endpoint] = reservation
+        if reservation.granted:
+            self.spent_since_observation += 1
+        return reservation
+
+    async def acquire(self, endpoint: str = "default") -> bool:
+        if self.window_delay(time.time()) > 0:
+            return False
+
+        reservation = await self._reserve(endpoint, commit=False)
+        if reservation is None:
+            return await self._local_fallback(endpoint).acquire(endpoint)
+        return reservation.granted
+
+    async def wait_if_needed(self, endpoint: str = "default") -> None:
+        window_delay = self.window_delay(time.time())
+        if window_delay > 0:
+            await asyncio.sleep(window_delay)
+
+        reservation = await self._reserve(endpoint, commit=True)
+        if reservation is None:
+            await self._local_fallback(endpoint).wait_if_needed(endpoint)
+        elif reservation.delay > 0:
+            await asyncio.sleep(reservation.delay)
+
+    async def reset_shared(self, endpoint: str) -> None:
+        """Clear the fleet-wide state for an endpoint."""
+        await self.store.reset(endpoint)
+        self.reset_endpoint(endpoint)
+
+    def reset_endpoint(self, endpoint: str) -> None:
+        self.last_reservations.pop(endpoint, None)
+        super().reset_endpoint(endpoint)
+
+    def get_status(self, endpoint: str = "default") -> Dict:
+        """Status as of this worker's last check against the store."""
+        last = self.last_reservations.get(endpoint)
+        if last is None:
+            return {
+                "requests_last_minute": 0,
+                "remaining_requests": self.config.requests_per_minute,
+                "reset_time": None,
+            }
+
+        used = 0
+        if last.minute_tat > last.now:
+            minute_interval = MINUTE_WINDOW / self.config.requests_per_minute
+            used = min(
+                self.config.requests_per_minute,
+                math.ceil((last.minute_tat - last.now) / minute_interval),
+            )
+
+        return {
+            "requests_last_minute": used,
+            "remaining_requests": max(0, self.config.requests_per_minute - used),
+            "reset_time": last.minute_tat if used else None,
+            "current_delay": self.retry_delays.get(endpoint, self.config.initial_delay),
+            "active_workers": last.active_workers,
+            "worker_id": self.worker_id,
+        }
+
+    async def aclose(self) -> None:
+        await self.store.aclose()
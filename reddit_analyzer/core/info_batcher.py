@@ -0,0 +1,102 @@
+"""Coalesce individual fullname lookups into batched /api/info calls."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+# Reddit's /api/info and /api/user_data_by_account_ids accept 100 ids
+MAX_INFO_BATCH = 100
+
+
+class InfoBatcher:
+    """Collect lookups for a short window and resolve them in one call.
+
+    ``load`` queues a fullname and waits for its result. Queued fullnames
+    are flushed as one ``fetch_batch`` call when ``max_batch_size`` are
+    waiting or ``max_wait`` seconds after the first one arrived, whichever
+    comes first. ``fetch_batch`` returns a mapping of fullname to result;
+    fullnames missing from it resolve to None. A fullname requested again
+    before its batch is sent shares the same slot in the batch.
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        max_batch_size: int = MAX_INFO_BATCH,
+        max_wait: float = 0.05,
+    ):
+        if not 1 <= max_batch_size <= MAX_INFO_BATCH:
+            raise ValueError(f"max_batch_size must be between 1 and {MAX_INFO_BATCH}")
+
+        self.fetch_batch = fetch_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._waiting: Dict[str, List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+        self.stats = {"lookups": 0, "batches": 0, "items": 0}
+
+    async def load(self, fullname: str) -> Optional[Any]:
+        """Resolve one fullname as part of the next batch."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiting.setdefault(fullname, []).append(future)
+        self.stats["lookups"] += 1
+
+        if len(self._waiting) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    async def load_many(self, fullnames: Iterable[str]) -> Dict[str, Optional[Any]]:
+        """Resolve several fullnames, split into as few batches as possible."""
+        fullnames = list(dict.fromkeys(fullnames))
+        results = await asyncio.gather(*(self.load(name) for name in fullnames))
+        return dict(zip(fullnames, results))
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._waiting:
+            return
+
+        batch, self._waiting = self._waiting, {}
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: Dict[str, List[asyncio.Future]]) -> None:
+        self.stats["batches"] += 1
+        self.stats["items"] += len(batch)
+        try:
+            results = await self.fetch_batch(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for fullname, futures in batch.items():
+            result = results.get(fullname)
+            for future in futures:
+                # Callers that gave up have cancelled their future
+                if not future.done():
+                    future.set_result(result)
+
+    async def aclose(self) -> None:
+        """Send any queued lookups and wait for batches in flight."""
+        self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "waiting": len(self._waiting),
+            "in_flight_batches": len(self._batches),
+            "api_calls_saved": self.stats["lookups"] - self.stats["batches"],
+        }
@@ -1,8 +1,8 @@
 import asyncio
+import math
 import time
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
-from asyncio import Lock
 
 
 @dataclass
@@ -12,74 +12,177 @@ class RateLimitConfig:
     backoff_factor: float = 2.0
     max_retries: int = 3
     initial_delay: float = 1.0
+    # Pace by the server-reported budget (observe_limits) when available
+    adaptive: bool = False
+    safety_margin: int = 10  # Requests held back from the reported budget
+    server_window: float = 600.0  # Reddit resets every 10 minutes
+
+
+BURST_WINDOW = 10.0  # Seconds covered by burst_limit
+MINUTE_WINDOW = 60.0
+
+
+@dataclass
+class EndpointState:
+    """GCRA theoretical arrival times for one endpoint."""
+
+    minute_tat: float = 0.0
+    burst_tat: float = 0.0
 
 
 class RateLimiter:
+    """Per-endpoint limiter using the generic cell rate algorithm (GCRA).
+
+    Each limit is tracked as a single theoretical arrival time (TAT), so a
+    check is O(1) with no per-request history. A request conforms when
+    ``now >= tat - tolerance`` for both the per-minute and the 10-second
+    burst limit, where the tolerance lets ``requests_per_minute`` (or
+    ``burst_limit``) requests through back to back before spacing them
+    out at the sustained rate.
+
+    With ``config.adaptive`` set, the static limits are replaced by the
+    budget the server reports through ``observe_limits`` (see
+    ``effective_limits``): budget beyond what the static rate needs for
+    the rest of the window is spent early, and pacing only drops below the
+    static rate when the budget can't sustain it until the reset.
+    """
+
     def __init__(self, config: RateLimitConfig):
         self.config = config
-        self.requests: Dict[str, list] = {}
-        self.locks: Dict[str, Lock] = {}
+        self.states: Dict[str, EndpointState] = {}
         self.retry_delays: Dict[str, float] = {}
+        self.observed_remaining: Optional[float] = None
+        self.observed_reset: Optional[float] = None
+        self.spent_since_observation = 0
+
+    def observe_limits(
+        self,
+        remaining: Optional[float],
+        reset_timestamp: Optional[float] = None,
+        used: Optional[float] = None,
+    ) -> None:
+        """Record the server's view of the budget, e.g. ``reddit.auth.limits``.
+
+        Without a reset timestamp the window is assumed to end at the next
+        multiple of ``config.server_window``, which is how Reddit aligns it.
+        """
+        if remaining is None:
+            return
+
+        if reset_timestamp is None:
+            window = self.config.server_window
+            reset_timestamp = (time.time() // window + 1) * window
+
+        self.observed_remaining = float(remaining)
+        self.observed_reset = float(reset_timestamp)
+        self.spent_since_observation = 0
+
+    def _budget(self, now: float) -> Optional[float]:
+        """Requests left in the server window, or None without a fresh report."""
+        if (
+            not self.config.adaptive
+            or self.observed_reset is None
+            or now >= self.observed_reset
+        ):
+            return None
+        return (
+            self.observed_remaining
+            - self.config.safety_margin
+            - self.spent_since_observation
+        )
+
+    def effective_limits(self, now: float) -> Tuple[float, float]:
+        """Requests per minute and burst limit currently in force.
+
+        With a reported budget, the floor is the static rate, or the even
+        spread of the budget over the time left if that is lower. Budget
+        beyond what the floor needs until the reset is surplus and may all
+        go within the next minute. Spending is front-loaded: a full budget
+        allows a high rate early in the window, which falls back to the
+        floor as the surplus is used up.
+        """
+        budget = self._budget(now)
+        if budget is None or budget <= 0:
+            return self.config.requests_per_minute, self.config.burst_limit
+
+        time_left = self.observed_reset - now
+        floor = min(self.config.requests_per_minute, budget * MINUTE_WINDOW / time_left)
+        surplus = budget - floor * time_left / MINUTE_WINDOW
+        per_minute = floor + max(surplus, 0.0)
+        return per_minute, max(
+            self.config.burst_limit, per_minute * BURST_WINDOW / MINUTE_WINDOW
+        )
+
+    def window_delay(self, now: float) -> float:
+        """Seconds until the server window resets if its budget is spent."""
+        budget = self._budget(now)
+        if budget is not None and budget <= 0:
+            return self.observed_reset - now
+        return 0.0
+
+    def _intervals(self, now: float):
+        """Emission interval and tolerance for the minute and burst limits."""
+        requests_per_minute, burst_limit = self.effective_limits(now)
+        minute_interval = MINUTE_WINDOW / requests_per_minute
+        burst_interval = BURST_WINDOW / burst_limit
+        return (
+            minute_interval,
+            MINUTE_WINDOW - minute_interval,
+            burst_interval,
+            BURST_WINDOW - burst_interval,
+        )
+
+    def _delay(self, state: EndpointState, now: float) -> float:
+        """Seconds until the next request for this state would conform."""
+        _, minute_tolerance, _, burst_tolerance = self._intervals(now)
+        return max(
+            state.minute_tat - minute_tolerance - now,
+            state.burst_tat - burst_tolerance - now,
+            self.window_delay(now),
+            0.0,
+        )
+
+    def _commit(self, state: EndpointState, at: float) -> None:
+        minute_interval, _, burst_interval, _ = self._intervals(at)
+        state.minute_tat = max(state.minute_tat, at) + minute_interval
+        state.burst_tat = max(state.burst_tat, at) + burst_interval
+        self.spent_since_observation += 1
+
+    def _state(self, endpoint: str) -> EndpointState:
+        state = self.states.get(endpoint)
+        if state is None:
+            state = self.states[endpoint] = EndpointState()
+        return state
+
+    # acquire/reserve never await between reading and updating state, so
+    # they are atomic on the event loop without a lock.
 
     async def acquire(self, endpoint: str = "default") -> bool:
-        if endpoint not in self.locks:
-            self.locks[endpoint] = Lock()
-
-        async with self.locks[endpoint]:
-            current_time = time.time()
-
-            if endpoint not in self.requests:
-                self.requests[endpoint] = []
-
-            # Clean old requests (older than 1 minute)
-            minute_ago = current_time - 60
-            self.requests[endpoint] = [
-                req_time
-                for req_time in self.requests[endpoint]
-                if req_time > minute_ago
-            ]
-
-            # Check rate limits
-            if len(self.requests[endpoint]) >= self.config.requests_per_minute:
-                return False
-
-            # Check burst limit (requests in last 10 seconds)
-            ten_seconds_ago = current_time - 10
-            recent_requests = [
-                req_time
-                for req_time in self.requests[endpoint]
-                if req_time > ten_seconds_ago
-            ]
-
-            if len(recent_requests) >= self.config.burst_limit:
-                return False
-
-            # Record this request
-            self.requests[endpoint].append(current_time)
-            return True
+        state = self._state(endpoint)
+        now = time.time()
+
+        if self._delay(state, now) > 0:
+            return False
+
+        self._commit(state, now)
+        return True
+
+    def reserve(self, endpoint: str = "default") -> float:
+        """Claim the next conforming slot and return how long to wait for it.
+
+        Concurrent callers are handed successive slots, so each sleeps
+        exactly once and they proceed in arrival order.
+        """
+        state = self._state(endpoint)
+        now = time.time()
+        delay = self._delay(state, now)
+        self._commit(state, now + delay)
+        return delay
 
     async def wait_if_needed(self, endpoint: str = "default") -> None:
-        while not await self.acquire(endpoint):
-            # Calculate delay based on current rate limit status
-            current_time = time.time()
-            minute_ago = current_time - 60
-
-            if endpoint in self.requests:
-                recent_requests = [
-                    req_time
-                    for req_time in self.requests[endpoint]
-                    if req_time > minute_ago
-                ]
-
-                if recent_requests:
-                    # Wait until the oldest request expires
-                    oldest_request = min(recent_requests)
-                    wait_time = max(0, oldest_request + 60 - current_time + 1)
-                    await asyncio.sleep(wait_time)
-                else:
-                    await asyncio.sleep(1)
-            else:
-                await asyncio.sleep(1)
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     async def exponential_backoff(self, endpoint: str, attempt: int) -> None:
         if endpoint not in self.retry_delays:
@@ -92,34 +195,44 @@ class RateLimiter:
         self.retry_delays[endpoint] = delay
 
     def reset_endpoint(self, endpoint: str) -> None:
-        if endpoint in self.requests:
-            self.requests[endpoint] = []
+        self.states.pop(endpoint, None)
         if endpoint in self.retry_delays:
             self.retry_delays[endpoint] = self.config.initial_delay
 
     def get_status(self, endpoint: str = "default") -> Dict:
-        current_time = time.time()
-        minute_ago = current_time - 60
-
-        if endpoint not in self.requests:
+        if endpoint not in self.states:
             return {
                 "requests_last_minute": 0,
                 "remaining_requests": self.config.requests_per_minute,
                 "reset_time": None,
             }
 
-        recent_requests = [
-            req_time for req_time in self.requests[endpoint] if req_time > minute_ago
-        ]
-
-        oldest_request = min(recent_requests) if recent_requests else None
-        reset_time = oldest_request + 60 if oldest_request else None
-
-        return {
-            "requests_last_minute": len(recent_requests),
-            "remaining_requests": max(
-                0, self.config.requests_per_minute - len(recent_requests)
-            ),
-            "reset_time": reset_time,
+        state = self.states[endpoint]
+        current_time = time.time()
+        requests_per_minute, _ = self.effective_limits(current_time)
+
+        # Slots still owed to the minute window: equal to the sliding-window
+        # count after a burst, lower once requests are being spaced out.
+        used = 0
+        if state.minute_tat > current_time:
+            minute_interval = MINUTE_WINDOW / requests_per_minute
+            used = min(
+                math.ceil(requests_per_minute),
+                math.ceil((state.minute_tat - current_time) / minute_interval),
+            )
+
+        status = {
+            "requests_last_minute": used,
+            "remaining_requests": max(0, math.floor(requests_per_minute) - used),
+            "reset_time": state.minute_tat if used else None,
+            "retry_after": round(self._delay(state, current_time), 3),
             "current_delay": self.retry_delays.get(endpoint, self.config.initial_delay),
         }
+        if self.config.adaptive:
+            status["observed_remaining"] = self.observed_remaining
+            status["observed_reset"] = self.observed_reset
+            status["effective_requests_per_minute"] = round(requests_per_minute, 2)
+        return status
+
+    async def aclose(self) -> None:
+        """Release shared resources; the in-process limiter holds none."""
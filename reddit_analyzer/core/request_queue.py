@@ -1,6 +1,11 @@
 import asyncio
+import heapq
+import inspect
+import itertools
+import json
 import time
-from typing import Any, Dict, List, Optional, Callable
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 from uuid import uuid4
@@ -19,6 +24,19 @@ class RequestStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     RETRYING = "retrying"
+    DROPPED = "dropped"
+
+
+class OverflowPolicy(Enum):
+    """What ``RequestQueue.enqueue`` does when the queue is at capacity."""
+
+    BLOCK = "block"  # Wait for room
+    REJECT = "reject"  # Raise QueueFullError
+    DROP_OLDEST_LOW = "drop_oldest_low"  # Shed the oldest pending LOW request
+
+
+class QueueFullError(Exception):
+    """Raised when a request cannot be admitted to a full queue."""
 
 
 @dataclass
@@ -44,16 +62,127 @@ class QueuedRequest:
         return data
 
 
+class RequestHistory:
+    """Finished requests kept for status lookups, bounded by count and age.
+
+    Entries are held in finish order in an ``OrderedDict``, which serves as
+    both the ring buffer (evict from the front) and the id index. Totals
+    are counted separately so they stay accurate after eviction.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_age: float = 3600.0):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.entries: "OrderedDict[str, QueuedRequest]" = OrderedDict()
+        self.counts: Dict[RequestStatus, int] = {
+            RequestStatus.COMPLETED: 0,
+            RequestStatus.FAILED: 0,
+            RequestStatus.DROPPED: 0,
+        }
+        self.evicted = 0
+
+    def add(self, request: QueuedRequest) -> None:
+        self.entries[request.id] = request
+        self.counts[request.status] += 1
+        self.prune(request.completed_at)
+
+    def get(self, request_id: str) -> Optional[QueuedRequest]:
+        return self.entries.get(request_id)
+
+    def prune(self, now: float) -> None:
+        """Evict entries past the count limit or older than max_age."""
+        cutoff = now - self.max_age
+        while self.entries:
+            oldest = next(iter(self.entries.values()))
+            if len(self.entries) <= self.max_entries and oldest.completed_at >= cutoff:
+                break
+            self.entries.popitem(last=False)
+            self.evicted += 1
+
+    def remove_older_than(self, cutoff: float) -> int:
+        removed = 0
+        while self.entries:
+            oldest = next(iter(self.entries.values()))
+            if oldest.completed_at >= cutoff:
+                break
+            self.entries.popitem(last=False)
+            removed += 1
+        return removed
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
 class RequestQueue:
-    def __init__(self, max_concurrent: int = 5):
+    """Priority queue of Reddit requests drained by a pool of workers.
+
+    Pending requests live in one heap ordered by
+    ``created_at - priority * aging_interval``: a request outranks anything of
+    one priority level higher that arrived more than ``aging_interval``
+    seconds after it, so LOW requests cannot starve under a steady HIGH
+    stream. Idle workers block on a condition until work arrives, and
+    failed requests wait in a second heap until their retry is due.
+
+    Capacity is unbounded unless ``max_pending`` (all priorities) or
+    ``priority_capacity`` (per priority) is set; ``overflow_policy`` decides
+    what happens to new requests beyond it. Scheduled retries were already
+    admitted and are never refused. Once ``high_water_mark`` requests are
+    waiting, producers can pause on ``wait_for_capacity`` until the queue
+    drains to ``low_water_mark``.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 5,
+        aging_interval: float = 30.0,
+        retry_delay: float = 2.0,
+        history_max_entries: int = 10000,
+        history_max_age: float = 3600.0,
+        max_pending: Optional[int] = None,
+        priority_capacity: Optional[Dict[RequestPriority, int]] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        high_water_mark: Optional[int] = None,
+        low_water_mark: Optional[int] = None,
+    ):
         self.max_concurrent = max_concurrent
-        self.queues: Dict[RequestPriority, asyncio.Queue] = {
-            priority: asyncio.Queue() for priority in RequestPriority
+        self.aging_interval = aging_interval
+        self.retry_delay = retry_delay  # Doubles with each further attempt
+        self._ready: List[Tuple[float, int, QueuedRequest]] = []
+        self._delayed: List[Tuple[float, int, QueuedRequest]] = []
+        self._sequence = itertools.count()
+        self._pending_counts: Dict[RequestPriority, int] = {
+            priority: 0 for priority in RequestPriority
+        }
+        self._condition: Optional[asyncio.Condition] = None
+        self._space: Optional[asyncio.Condition] = None
+
+        self.max_pending = max_pending
+        self.priority_capacity = priority_capacity or {}
+        self.overflow_policy = overflow_policy
+        if high_water_mark is None and max_pending is not None:
+            high_water_mark = int(max_pending * 0.8)
+        self.high_water_mark = high_water_mark
+        if low_water_mark is None and high_water_mark is not None:
+            low_water_mark = high_water_mark // 2
+        self.low_water_mark = low_water_mark
+        self._above_high_water = False
+        self.rejected_count = 0
+        # Arrival order per priority, for dropping and oldest-wait reporting
+        self._arrivals: Dict[RequestPriority, deque] = {
+            priority: deque() for priority in RequestPriority
         }
+        self._wait_times: Dict[RequestPriority, deque] = {
+            priority: deque(maxlen=1000) for priority in RequestPriority
+        }
+
+        self.pending: Dict[str, QueuedRequest] = {}  # Ready or awaiting retry
         self.processing: Dict[str, QueuedRequest] = {}
-        self.completed: List[QueuedRequest] = []
-        self.failed: List[QueuedRequest] = []
-        self.callbacks: Dict[str, Callable] = {}
+        self.history = RequestHistory(history_max_entries, history_max_age)
+        self.callbacks: Dict[str, List[Callable]] = {}
+        # Dedup key -> pending or processing request with that key
+        self._in_flight: Dict[Tuple[str, str, str], QueuedRequest] = {}
+        self._dedup_keys: Dict[str, Tuple[str, str, str]] = {}
+        self.deduplicated_count = 0
         self._worker_tasks: List[asyncio.Task] = []
         self._running = False
 
@@ -65,7 +194,59 @@ class RequestQueue:
         priority: RequestPriority = RequestPriority.MEDIUM,
         max_retries: int = 3,
         callback: Optional[Callable] = None,
+        deduplicate: bool = True,
+        timeout: Optional[float] = None,
     ) -> str:
+        """Queue a request and return its id.
+
+        If an identical request (same endpoint, method and params) is
+        already pending or in flight, no new request is queued: the
+        callback is attached to the existing one and its id is returned.
+
+        Raises ``QueueFullError`` if the queue is full and the overflow
+        policy rejects the request, or if ``timeout`` seconds pass while
+        blocked waiting for room.
+        """
+        key = self._dedup_key(endpoint, method, params) if deduplicate else None
+        existing_id = self._join_duplicate(key, callback)
+        if existing_id is not None:
+            return existing_id
+
+        async with self.condition:
+            await self._make_room(priority, timeout)
+            # Another producer may have queued the same request meanwhile
+            existing_id = self._join_duplicate(key, callback)
+            if existing_id is not None:
+                return existing_id
+
+            request = self._new_request(
+                endpoint, method, params, priority, max_retries, callback, key
+            )
+            self._push_ready(request)
+            self.condition.notify()
+        return request.id
+
+    def _join_duplicate(
+        self, key: Optional[Tuple[str, str, str]], callback: Optional[Callable]
+    ) -> Optional[str]:
+        existing = self._in_flight.get(key) if key is not None else None
+        if existing is None:
+            return None
+        if callback:
+            self._add_callback(existing, callback)
+        self.deduplicated_count += 1
+        return existing.id
+
+    def _new_request(
+        self,
+        endpoint: str,
+        method: str,
+        params: Dict[str, Any],
+        priority: RequestPriority,
+        max_retries: int,
+        callback: Optional[Callable],
+        key: Optional[Tuple[str, str, str]],
+    ) -> QueuedRequest:
         request_id = str(uuid4())
 
         request = QueuedRequest(
@@ -80,12 +261,145 @@ class RequestQueue:
         )
 
         if callback:
-            callback_name = f"callback_{request_id}"
-            self.callbacks[callback_name] = callback
-            request.callback = callback_name
+            self._add_callback(request, callback)
 
-        await self.queues[priority].put(request)
-        return request_id
+        if key is not None:
+            self._in_flight[key] = request
+            self._dedup_keys[request_id] = key
+        return request
+
+    async def _make_room(
+        self, priority: RequestPriority, timeout: Optional[float]
+    ) -> None:
+        """Apply the overflow policy until a request of ``priority`` fits."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            capacity = self.priority_capacity.get(priority)
+            priority_full = (
+                capacity is not None and self._pending_counts[priority] >= capacity
+            )
+            total_full = self.max_pending is not None and self.depth >= self.max_pending
+            if not (priority_full or total_full):
+                return
+
+            reason = (
+                f"{priority.name} queue is full ({capacity} pending)"
+                if priority_full
+                else f"Request queue is full ({self.max_pending} pending)"
+            )
+            if self.overflow_policy is OverflowPolicy.DROP_OLDEST_LOW:
+                # Shedding LOW work only helps if LOW is what's taking the room
+                if (priority is RequestPriority.LOW or not priority_full) and (
+                    self._drop_oldest_low()
+                ):
+                    continue
+            elif self.overflow_policy is OverflowPolicy.BLOCK:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is None or remaining > 0:
+                    try:
+                        await asyncio.wait_for(self.space.wait(), remaining)
+                        continue
+                    except asyncio.TimeoutError:
+                        pass
+
+            self.rejected_count += 1
+            raise QueueFullError(reason)
+
+    def _drop_oldest_low(self) -> bool:
+        arrivals = self._arrivals[RequestPriority.LOW]
+        while arrivals:
+            request = arrivals.popleft()
+            if request.status is not RequestStatus.PENDING:
+                continue  # Already started or dropped
+
+            # The heap entry is skipped when it surfaces
+            request.status = RequestStatus.DROPPED
+            request.completed_at = time.time()
+            request.error_message = "Dropped to make room in a full queue"
+            self._pending_counts[RequestPriority.LOW] -= 1
+            del self.pending[request.id]
+            self._finish(request)
+            self._update_high_water()
+            return True
+        return False
+
+    @property
+    def depth(self) -> int:
+        """Requests waiting to start, excluding scheduled retries."""
+        return sum(self._pending_counts.values())
+
+    @property
+    def above_high_water(self) -> bool:
+        return self._above_high_water
+
+    def _update_high_water(self) -> None:
+        if self.high_water_mark is None:
+            return
+        depth = self.depth
+        if depth >= self.high_water_mark:
+            self._above_high_water = True
+        elif depth <= self.low_water_mark:
+            self._above_high_water = False
+
+    async def wait_for_capacity(self) -> None:
+        """Block while the queue is above its high-water mark.
+
+        Bulk producers can call this between enqueues to pace themselves
+        to the workers instead of filling the queue to capacity.
+        """
+        async with self.condition:
+            await self.space.wait_for(lambda: not self._above_high_water)
+
+    @staticmethod
+    def _dedup_key(
+        endpoint: str, method: str, params: Dict[str, Any]
+    ) -> Optional[Tuple[str, str, str]]:
+        """Identity of a request, insensitive to param order."""
+        try:
+            canonical = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            # Unserializable params cannot be compared safely
+            return None
+        return (endpoint, method.upper(), canonical)
+
+    def _add_callback(self, request: QueuedRequest, callback: Callable) -> None:
+        if request.callback is None:
+            request.callback = f"callback_{request.id}"
+        self.callbacks.setdefault(request.callback, []).append(callback)
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._create_conditions()
+        return self._condition
+
+    @property
+    def space(self) -> asyncio.Condition:
+        """Notified whenever pending requests leave the queue."""
+        if self._space is None:
+            self._create_conditions()
+        return self._space
+
+    def _create_conditions(self) -> None:
+        # Created on first use so they bind to the loop the workers run on.
+        # Producers waiting for room share the workers' lock.
+        lock = asyncio.Lock()
+        self._condition = asyncio.Condition(lock)
+        self._space = asyncio.Condition(lock)
+
+    def _push_ready(self, request: QueuedRequest) -> None:
+        sort_key = request.created_at - request.priority.value * self.aging_interval
+        heapq.heappush(self._ready, (sort_key, next(self._sequence), request))
+        self._pending_counts[request.priority] += 1
+        self.pending[request.id] = request
+        self._arrivals[request.priority].append(request)
+        self._update_high_water()
+
+    def _promote_due_retries(self, now: float) -> None:
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, request = heapq.heappop(self._delayed)
+            request.status = RequestStatus.PENDING
+            self._push_ready(request)
 
     async def start_workers(self) -> None:
         if self._running:
@@ -110,10 +424,6 @@ class RequestQueue:
         while self._running:
             try:
                 request = await self._get_next_request()
-                if request is None:
-                    await asyncio.sleep(0.1)
-                    continue
-
                 await self._process_request(request, worker_name)
 
             except asyncio.CancelledError:
@@ -122,19 +432,42 @@ class RequestQueue:
                 print(f"Worker {worker_name} error: {e}")
                 await asyncio.sleep(1)
 
-    async def _get_next_request(self) -> Optional[QueuedRequest]:
-        # Process requests by priority (highest first)
-        for priority in sorted(RequestPriority, key=lambda x: x.value, reverse=True):
-            try:
-                request = self.queues[priority].get_nowait()
-                self.processing[request.id] = request
-                request.status = RequestStatus.PROCESSING
-                request.started_at = time.time()
-                return request
-            except asyncio.QueueEmpty:
-                continue
-
-        return None
+    async def _get_next_request(self) -> QueuedRequest:
+        """Block until a request is ready, waking early for due retries."""
+        async with self.condition:
+            while True:
+                now = time.time()
+                self._promote_due_retries(now)
+
+                while self._ready:
+                    _, _, request = heapq.heappop(self._ready)
+                    if request.status is RequestStatus.DROPPED:
+                        continue
+                    self._dequeued(request, now)
+                    return request
+
+                timeout = self._delayed[0][0] - now if self._delayed else None
+                try:
+                    await asyncio.wait_for(self.condition.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+    def _dequeued(self, request: QueuedRequest, now: float) -> None:
+        self._pending_counts[request.priority] -= 1
+        del self.pending[request.id]
+        self.processing[request.id] = request
+        request.status = RequestStatus.PROCESSING
+        if request.attempts == 0:
+            self._wait_times[request.priority].append(now - request.created_at)
+        request.started_at = now
+
+        # Forget arrivals that have started so the deque stays short
+        arrivals = self._arrivals[request.priority]
+        while arrivals and arrivals[0].status is not RequestStatus.PENDING:
+            arrivals.popleft()
+
+        self._update_high_water()
+        self.space.notify_all()
 
     async def _process_request(self, request: QueuedRequest, worker_name: str) -> None:
         try:
@@ -148,16 +481,15 @@ class RequestQueue:
             request.status = RequestStatus.COMPLETED
             request.completed_at = time.time()
 
-            # Execute callback if present
-            if request.callback and request.callback in self.callbacks:
+            # Fan the result out to every caller that enqueued this request
+            for callback in self._finish(request):
                 try:
-                    await self.callbacks[request.callback](result)
+                    outcome = callback(result)
+                    if inspect.isawaitable(outcome):
+                        await outcome
                 except Exception as callback_error:
                     print(f"Callback error for {request.id}: {callback_error}")
 
-            # Move to completed
-            self.completed.append(request)
-
         except Exception as e:
             await self._handle_request_error(request, str(e))
 
@@ -189,80 +521,107 @@ class RequestQueue:
         request.error_message = error_message
 
         if request.attempts < request.max_retries:
-            # Retry the request
+            # Schedule a retry with exponential backoff; the worker moves on
             request.status = RequestStatus.RETRYING
-            await asyncio.sleep(2**request.attempts)  # Exponential backoff
-            await self.queues[request.priority].put(request)
+            due_at = time.time() + self.retry_delay * 2 ** (request.attempts - 1)
+            async with self.condition:
+                heapq.heappush(self._delayed, (due_at, next(self._sequence), request))
+                self.pending[request.id] = request
+                # Let an idle worker shorten its wait to the new due time
+                self.condition.notify()
         else:
             # Mark as failed
             request.status = RequestStatus.FAILED
             request.completed_at = time.time()
-            self.failed.append(request)
+            self._finish(request)
+
+    def _finish(self, request: QueuedRequest) -> List[Callable]:
+        """Record a finished request and release its callbacks."""
+        self.history.add(request)
+        # Later identical requests must hit the API again
+        key = self._dedup_keys.pop(request.id, None)
+        if key is not None and self._in_flight.get(key) is request:
+            del self._in_flight[key]
+        if request.callback:
+            return self.callbacks.pop(request.callback, [])
+        return []
+
+    def _wait_time_stats(self, now: float) -> Dict[str, Dict[str, float]]:
+        """Queue wait of recently started requests and of the oldest waiting."""
+        stats = {}
+        for priority in RequestPriority:
+            waits = self._wait_times[priority]
+            oldest = next(
+                (
+                    request
+                    for request in self._arrivals[priority]
+                    if request.status is RequestStatus.PENDING
+                ),
+                None,
+            )
+            stats[priority.name] = {
+                "avg": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                "max": round(max(waits), 3) if waits else 0.0,
+                "oldest_pending": (
+                    round(now - oldest.created_at, 3) if oldest is not None else 0.0
+                ),
+            }
+        return stats
 
     def get_status(self) -> Dict[str, Any]:
+        now = time.time()
+        self.history.prune(now)
         return {
             "running": self._running,
             "processing_count": len(self.processing),
-            "completed_count": len(self.completed),
-            "failed_count": len(self.failed),
+            "completed_count": self.history.counts[RequestStatus.COMPLETED],
+            "failed_count": self.history.counts[RequestStatus.FAILED],
+            "dropped_count": self.history.counts[RequestStatus.DROPPED],
+            "rejected_count": self.rejected_count,
+            "history_size": len(self.history),
+            "history_evicted": self.history.evicted,
             "queue_sizes": {
-                priority.name: self.queues[priority].qsize()
+                priority.name: self._pending_counts[priority]
                 for priority in RequestPriority
             },
+            "queue_depth": self.depth,
+            "capacity": {
+                "max_pending": self.max_pending,
+                "per_priority": {
+                    priority.name: limit
+                    for priority, limit in self.priority_capacity.items()
+                },
+                "overflow_policy": self.overflow_policy.value,
+                "high_water_mark": self.high_water_mark,
+                "above_high_water": self._above_high_water,
+            },
+            "wait_times": self._wait_time_stats(now),
+            "scheduled_retries": len(self._delayed),
+            "deduplicated_requests": self.deduplicated_count,
             "workers": len(self._worker_tasks),
         }
 
     def get_request_status(self, request_id: str) -> Optional[Dict[str, Any]]:
+        # Check queued and scheduled retries
+        if request_id in self.pending:
+            return self.pending[request_id].to_dict()
+
         # Check processing
         if request_id in self.processing:
             return self.processing[request_id].to_dict()
 
-        # Check completed
-        for request in self.completed:
-            if request.id == request_id:
-                return request.to_dict()
-
-        # Check failed
-        for request in self.failed:
-            if request.id == request_id:
-                return request.to_dict()
+        # Check finished requests still in the history
+        request = self.history.get(request_id)
+        if request is not None:
+            return request.to_dict()
 
         return None
 
     async def clear_completed(self, older_than_hours: int = 24) -> int:
-        cutoff_time = time.time() - (older_than_hours * 3600)
-
-        old_completed = [
-            req
-            for req in self.completed
-            if req.completed_at and req.completed_at < cutoff_time
-        ]
-
-        old_failed = [
-            req
-            for req in self.failed
-            if req.completed_at and req.completed_at < cutoff_time
-        ]
-
-        self.completed = [
-            req
-            for req in self.completed
-            if not (req.completed_at and req.completed_at < cutoff_time)
-        ]
-
-        self.failed = [
-            req
-            for req in self.failed
-            if not (req.completed_at and req.completed_at < cutoff_time)
-        ]
+        """Drop finished requests from the history ahead of its own retention.
 
-        # Clean up old callbacks
-        old_callbacks = []
-        for callback_name in list(self.callbacks.keys()):
-            if any(req.callback == callback_name for req in old_completed + old_failed):
-                old_callbacks.append(callback_name)
-
-        for callback_name in old_callbacks:
-            del self.callbacks[callback_name]
-
-        return len(old_completed) + len(old_failed)
+        Callbacks are released when a request finishes, so only history
+        entries are removed here.
+        """
+        cutoff_time = time.time() - (older_than_hours * 3600)
+        return self.history.remove_older_than(cutoff_time)
@@ -1,30 +1,264 @@
 """Database configuration and connection management."""
 
-from contextlib import contextmanager
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, event, MetaData
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 import redis
 
 from reddit_analyzer.config import get_config
 
 config = get_config()
 
+
+class CheckoutTimingMixin:
+    """Record how long callers wait to check a connection out of the pool.
+
+    ``_do_get`` is where a pool blocks for a free connection (or opens a
+    new one), so timing it captures both queueing and connect latency.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self._record_wait(time.perf_counter() - started)
+
+    def _record_wait(self, seconds: float) -> None:
+        if not hasattr(self, "_checkout_waits"):
+            self._checkout_waits = deque(maxlen=1000)
+            self._checkout_stats = {"checkouts": 0, "max_wait": 0.0}
+        self._checkout_waits.append(seconds)
+        self._checkout_stats["checkouts"] += 1
+        self._checkout_stats["max_wait"] = max(
+            self._checkout_stats["max_wait"], seconds
+        )
+
+    def checkout_wait_stats(self) -> Dict[str, Any]:
+        waits = list(getattr(self, "_checkout_waits", ()))
+        stats = getattr(self, "_checkout_stats", {"checkouts": 0, "max_wait": 0.0})
+        return {
+            "checkouts": stats["checkouts"],
+            "avg_wait_ms": round(sum(waits) / len(waits) * 1000, 3) if waits else 0.0,
+            "max_wait_ms": round(stats["max_wait"] * 1000, 3),
+        }
+
+
+class TimedQueuePool(CheckoutTimingMixin, QueuePool):
+    pass
+
+
+def _is_memory_sqlite(url) -> bool:
+    return url.database in (None, "", ":memory:") or "mode=memory" in str(url)
+
+
+def sqlite_performance_pragmas() -> Dict[str, Any]:
+    """The pragma profile for file-backed SQLite, sized from config.
+
+    WAL lets ``viz`` reads run while a collection writes, and with WAL
+    ``synchronous=NORMAL`` only risks the last commits on power loss,
+    never corruption. A negative ``cache_size`` is in KiB.
+    """
+    return {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -config.SQLITE_CACHE_SIZE_MB * 1024,
+        "mmap_size": config.SQLITE_MMAP_SIZE_MB * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": config.SQLITE_BUSY_TIMEOUT_MS,
+    }
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """Set ``pragmas`` on every new connection the engine opens."""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def create_db_engine(
+    database_url: str,
+    echo: bool = False,
+    sqlite_profile: Optional[bool] = None,
+) -> Engine:
+    """Build an engine with a pool suited to the database backend.
+
+    - Server databases (Postgres, MySQL) get a ``QueuePool`` sized by
+      ``DB_POOL_SIZE``/``DB_MAX_OVERFLOW``, with pre-ping and recycling so
+      connections dropped by the server or a proxy are replaced.
+    - File-backed SQLite gets a ``QueuePool`` of the same size. Callers
+      beyond the limit wait for a connection instead of sharing or
+      closing one another thread still holds.
+    - In-memory SQLite keeps a single ``StaticPool`` connection, since each
+      new connection would see an empty database.
+
+    With ``sqlite_profile`` (default ``SQLITE_PERFORMANCE_PROFILE``),
+    file-backed SQLite connections also get ``sqlite_performance_pragmas``.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        connect_args = {"check_same_thread": False}
+        if _is_memory_sqlite(url):
+            engine = create_engine(
+                url, poolclass=StaticPool, connect_args=connect_args, echo=echo
+            )
+            _track_in_use(engine)
+            return engine
+        engine = create_engine(
+            url,
+            poolclass=TimedQueuePool,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            connect_args=connect_args,
+            echo=echo,
+        )
+        if sqlite_profile is None:
+            sqlite_profile = config.SQLITE_PERFORMANCE_PROFILE
+        if sqlite_profile:
+            apply_sqlite_pragmas(engine, sqlite_performance_pragmas())
+    else:
+        engine = create_engine(
+            url,
+            poolclass=TimedQueuePool,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+            pool_pre_ping=config.DB_POOL_PRE_PING,
+            echo=echo,
+        )
+    _track_in_use(engine)
+    return engine
+
+
+# asyncio DBAPI drivers used by the async engine, per backend
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def async_database_url(database_url: str) -> URL:
+    """Swap the driver in ``database_url`` for its asyncio counterpart."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver for {backend} databases")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def create_async_db_engine(
+    database_url: str,
+    echo: bool = False,
+    sqlite_profile: Optional[bool] = None,
+) -> AsyncEngine:
+    """Build an ``AsyncEngine`` for ``database_url`` via aiosqlite or asyncpg.
+
+    Pool sizing, pre-ping and the SQLite pragma profile follow
+    ``create_db_engine``; pool status is available through
+    ``get_pool_status(engine.sync_engine)``.
+    """
+    url = async_database_url(database_url)
+    if url.get_backend_name() == "sqlite" and _is_memory_sqlite(url):
+        engine = create_async_engine(url, poolclass=StaticPool, echo=echo)
+    else:
+        engine = create_async_engine(
+            url,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+            pool_pre_ping=config.DB_POOL_PRE_PING,
+            echo=echo,
+        )
+        if sqlite_profile is None:
+            sqlite_profile = config.SQLITE_PERFORMANCE_PROFILE
+        if url.get_backend_name() == "sqlite" and sqlite_profile:
+            apply_sqlite_pragmas(engine.sync_engine, sqlite_performance_pragmas())
+    _track_in_use(engine.sync_engine)
+    return engine
+
+
+class _InUseCounter:
+    """Connections currently checked out, kept across pool recreation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def add(self, delta: int) -> None:
+        with self._lock:
+            self.value += delta
+
+
+def _track_in_use(engine: Engine) -> None:
+    # StaticPool has no checkedout(), so count checkouts ourselves
+    counter = engine._in_use_counter = _InUseCounter()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        counter.add(1)
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        counter.add(-1)
+
+
+def get_pool_status(target: Optional[Engine] = None) -> Dict[str, Any]:
+    """Connection pool usage for health checks and monitoring."""
+    target = target or engine
+    pool = target.pool
+    status: Dict[str, Any] = {
+        "backend": target.url.get_backend_name(),
+        "pool_class": type(pool).__name__,
+        "in_use": (
+            target._in_use_counter.value if hasattr(target, "_in_use_counter") else None
+        ),
+    }
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+            }
+        )
+    if isinstance(pool, CheckoutTimingMixin):
+        status["checkout"] = pool.checkout_wait_stats()
+    return status
+
+
 # SQLAlchemy setup
-engine = create_engine(
-    config.DATABASE_URL,
-    poolclass=StaticPool,
-    connect_args=(
-        {"check_same_thread": False} if "sqlite" in config.DATABASE_URL else {}
-    ),
-    echo=False,  # Disable SQLAlchemy echo - use logging config instead
-)
+engine = create_db_engine(config.DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Async engine, created on first use so sync-only callers don't need the
+# async drivers installed
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker] = None
+
 # Redis setup
 redis_client = redis.from_url(config.REDIS_URL)
 
@@ -64,3 +298,59 @@ def get_session():
         yield session
     finally:
         session.close()
+
+
+@contextmanager
+def get_db_session():
+    """Transactional session for workers: commits on success, rolls back on error."""
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def get_async_engine() -> AsyncEngine:
+    """The shared async engine for ``DATABASE_URL``."""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(config.DATABASE_URL)
+        _async_sessionmaker = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+@asynccontextmanager
+async def get_async_db_session() -> AsyncIterator[AsyncSession]:
+    """Async counterpart of ``get_db_session`` for asyncio code paths.
+
+    Queries await the driver instead of blocking the event loop, so API
+    requests in flight keep progressing while a page is written. Sync
+    helpers can run inside it with ``await session.run_sync(fn, ...)``.
+    """
+    get_async_engine()
+    async with _async_sessionmaker() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections.
+
+    Connections belong to the event loop that opened them; call this before
+    closing a loop (``asyncio.run`` in the CLI, per-task loops in workers).
+    """
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_sessionmaker = None
@@ -8,6 +8,8 @@ from reddit_analyzer.models.post import Post
 from reddit_analyzer.models.comment import Comment
 from reddit_analyzer.models.collection_job import (
     CollectionJob,
+    CollectionCursor,
+    AuthorLookupFailure,
     APIRequest,
     DataQualityMetric,
     SystemMetric,
@@ -35,6 +37,8 @@ __all__ = [
     "Post",
     "Comment",
     "CollectionJob",
+    "CollectionCursor",
+    "AuthorLookupFailure",
     "APIRequest",
     "DataQualityMetric",
     "SystemMetric",
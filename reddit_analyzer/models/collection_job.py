@@ -1,4 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Float, JSON
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    Text,
+    Boolean,
+    Float,
+    JSON,
+    UniqueConstraint,
+)
 from sqlalchemy.sql import func
 from reddit_analyzer.database import Base
 
@@ -109,3 +119,45 @@ class CollectionSummary(Base):
 
     def __repr__(self):
         return f"<CollectionSummary(date={self.date}, subreddit={self.subreddit_name})>"
+
+
+class CollectionCursor(Base):
+    """Newest post seen per (subreddit, sort), so collection can resume there."""
+
+    __tablename__ = "collection_cursors"
+    __table_args__ = (
+        UniqueConstraint("subreddit_name", "sort", name="uq_collection_cursor"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    subreddit_name = Column(String(255), nullable=False)
+    sort = Column(String(20), nullable=False)
+    newest_fullname = Column(String(20))
+    newest_created_utc = Column(DateTime)
+    last_run_at = Column(DateTime)
+    last_run_items = Column(Integer, default=0)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return (
+            f"<CollectionCursor(subreddit={self.subreddit_name}, sort={self.sort}, "
+            f"newest={self.newest_fullname})>"
+        )
+
+
+class AuthorLookupFailure(Base):
+    """Author whose profile couldn't be fetched, so it isn't retried every run."""
+
+    __tablename__ = "author_lookup_failures"
+
+    username = Column(String(255), primary_key=True)
+    reason = Column(Text)
+    failed_at = Column(DateTime, nullable=False, index=True)
+    attempts = Column(Integer, default=1)
+
+    def __repr__(self):
+        return (
+            f"<AuthorLookupFailure(username={self.username}, "
+            f"failed_at={self.failed_at})>"
+        )
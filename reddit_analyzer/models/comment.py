@@ -1,6 +1,15 @@
 """Comment model."""
 
-from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    Boolean,
+    Text,
+    DateTime,
+    ForeignKey,
+    Index,
+)
 from sqlalchemy.orm import relationship
 from reddit_analyzer.database import Base
 from reddit_analyzer.models.base import TimestampMixin
@@ -10,6 +19,12 @@ class Comment(Base, TimestampMixin):
     """Reddit comment model."""
 
     __tablename__ = "comments"
+    __table_args__ = (
+        # Comments for a set of posts (Comment.post_id IN (...))
+        Index("ix_comments_post_created_utc", "post_id", "created_utc"),
+        # Per-user activity
+        Index("ix_comments_author_created_utc", "author_id", "created_utc"),
+    )
 
     id = Column(String(255), primary_key=True)
     post_id = Column(String(255), ForeignKey("posts.id"))
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from reddit_analyzer.database import Base
@@ -19,6 +20,16 @@ class Post(Base, TimestampMixin):
     """Reddit post model."""
 
     __tablename__ = "posts"
+    __table_args__ = (
+        # Subreddit-scoped time windows (analyze, viz, reports)
+        Index("ix_posts_subreddit_created_utc", "subreddit_id", "created_utc"),
+        Index("ix_posts_subreddit_created_at", "subreddit_id", "created_at"),
+        # Cross-subreddit windows and retention cleanup
+        Index("ix_posts_created_utc", "created_utc"),
+        Index("ix_posts_created_at", "created_at"),
+        # Per-user activity
+        Index("ix_posts_author_created_utc", "author_id", "created_utc"),
+    )
 
     id = Column(String(255), primary_key=True)
     title = Column(String(500), nullable=False)
@@ -0,0 +1,339 @@
+"""Reddit API client on aiohttp, calling the OAuth JSON endpoints directly."""
+
+import asyncio
+import base64
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from reddit_analyzer.config import get_config
+from reddit_analyzer.utils.logging import LoggerMixin
+from reddit_analyzer.core.rate_limiter import RateLimiter, RateLimitConfig
+from reddit_analyzer.services.listings import LISTING_PAGE_SIZE
+
+REDDIT_OAUTH_URL = "https://oauth.reddit.com"
+REDDIT_AUTH_URL = "https://www.reddit.com"
+
+
+def subreddit_from_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Subreddit ``about`` data in the shape of ``get_subreddit_info``."""
+    return {
+        "name": data["display_name"],
+        "display_name": data.get("display_name_prefixed"),
+        "description": data.get("description"),
+        "public_description": data.get("public_description"),
+        "subscribers": data.get("subscribers"),
+        "created_utc": datetime.fromtimestamp(data["created_utc"]).isoformat(),
+        "is_nsfw": data.get("over18", False),
+        "lang": data.get("lang"),
+        "submission_type": data.get("submission_type"),
+        "fetched_at": datetime.now().isoformat(),
+    }
+
+
+def post_from_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    """A ``t3`` listing child in the shape of ``get_subreddit_posts``."""
+    return {
+        "id": data["id"],
+        "title": data["title"],
+        "selftext": data.get("selftext", ""),
+        "url": data.get("url"),
+        "author": data.get("author") or "[deleted]",
+        "subreddit": data["subreddit"],
+        "score": data.get("score", 0),
+        "upvote_ratio": data.get("upvote_ratio"),
+        "num_comments": data.get("num_comments", 0),
+        "created_utc": datetime.fromtimestamp(data["created_utc"]).isoformat(),
+        "is_self": data.get("is_self", False),
+        "is_nsfw": data.get("over_18", False),
+        "is_locked": data.get("locked", False),
+        "distinguished": data.get("distinguished"),
+        "stickied": data.get("stickied", False),
+        "link_flair_text": data.get("link_flair_text"),
+        "post_hint": data.get("post_hint"),
+        "fetched_at": datetime.now().isoformat(),
+    }
+
+
+def comment_from_json(data: Dict[str, Any], post_id: str) -> Dict[str, Any]:
+    """A ``t1`` child in the shape of ``get_post_comments``."""
+    return {
+        "id": data["id"],
+        "post_id": post_id,
+        "parent_id": data.get("parent_id"),
+        "author": data.get("author") or "[deleted]",
+        "body": data["body"],
+        "score": data.get("score", 0),
+        "created_utc": datetime.fromtimestamp(data["created_utc"]).isoformat(),
+        "is_deleted": data["body"] in ["[deleted]", "[removed]"],
+        "distinguished": data.get("distinguished"),
+        "stickied": data.get("stickied", False),
+        "depth": data.get("depth", 0),
+        "controversiality": data.get("controversiality", 0),
+        "fetched_at": datetime.now().isoformat(),
+    }
+
+
+def user_from_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    """User ``about`` data in the shape of ``get_user_info``."""
+    comment_karma = data.get("comment_karma", 0)
+    link_karma = data.get("link_karma", 0)
+    return {
+        "username": data["name"],
+        "created_utc": datetime.fromtimestamp(data["created_utc"]).isoformat(),
+        "comment_karma": comment_karma,
+        "link_karma": link_karma,
+        "total_karma": comment_karma + link_karma,
+        "is_verified": data.get("verified", False),
+        "has_verified_email": data.get("has_verified_email"),
+        "is_gold": data.get("is_gold", False),
+        "is_mod": data.get("is_mod", False),
+        "fetched_at": datetime.now().isoformat(),
+    }
+
+
+class AsyncRedditHTTPClient(LoggerMixin):
+    """Reddit client that talks to the OAuth API over one aiohttp session.
+
+    Unlike PRAW behind ``run_in_executor``, requests don't take a thread
+    each, keep-alive connections are reused from a bounded pool, and every
+    listing is parsed from the JSON it arrived in, with no lazy follow-up
+    requests for attributes such as authors or subreddits. Results have
+    the same shape as ``EnhancedRedditClient``'s.
+
+    Uses the password grant when a username and password are configured
+    and an application-only token otherwise. ``oauth_url`` and ``auth_url``
+    can point at a stub server in tests.
+    """
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        oauth_url: str = REDDIT_OAUTH_URL,
+        auth_url: str = REDDIT_AUTH_URL,
+        max_connections: int = 10,
+        timeout: float = 30.0,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncRedditHTTPClient; "
+                "install the data-collection extra"
+            )
+
+        config = get_config()
+        self.client_id = client_id or config.REDDIT_CLIENT_ID
+        self.client_secret = client_secret or config.REDDIT_CLIENT_SECRET
+        self.user_agent = user_agent or config.REDDIT_USER_AGENT
+        self.username = username or config.REDDIT_USERNAME
+        self.password = password or config.REDDIT_PASSWORD
+        self.rate_limiter = rate_limiter or RateLimiter(RateLimitConfig())
+        self.oauth_url = oauth_url.rstrip("/")
+        self.auth_url = auth_url.rstrip("/")
+        self.max_connections = max_connections
+        self.timeout = timeout
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        # Created on first use so it binds to the running loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections, keepalive_timeout=60
+                ),
+                headers={"User-Agent": self.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncRedditHTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _access_token(self, force_refresh: bool = False) -> str:
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        async with self._token_lock:
+            # Refresh a minute early so in-flight requests don't race expiry
+            if (
+                force_refresh
+                or self._token is None
+                or time.time() >= self._token_expires_at - 60
+            ):
+                await self._fetch_token()
+            return self._token
+
+    def _basic_auth(self) -> str:
+        credentials = f"{self.client_id}:{self.client_secret}".encode()
+        return f"Basic {base64.b64encode(credentials).decode()}"
+
+    async def _fetch_token(self) -> None:
+        if self.username and self.password:
+            data = {
+                "grant_type": "password",
+                "username": self.username,
+                "password": self.password,
+            }
+        else:
+            data = {"grant_type": "client_credentials"}
+
+        async with self.session.post(
+            f"{self.auth_url}/api/v1/access_token",
+            data=data,
+            headers={"Authorization": self._basic_auth()},
+        ) as response:
+            response.raise_for_status()
+            payload = await response.json()
+
+        if "access_token" not in payload:
+            raise PermissionError(
+                f"Reddit authentication failed: {payload.get('error', payload)}"
+            )
+        self._token = payload["access_token"]
+        self._token_expires_at = time.time() + payload.get("expires_in", 3600)
+        self.logger.debug("Obtained Reddit OAuth token")
+
+    def _observe_rate_limits(self, headers) -> None:
+        """Feed Reddit's X-Ratelimit-* headers back into the rate limiter."""
+        try:
+            remaining = float(headers["X-Ratelimit-Remaining"])
+            reset = time.time() + float(headers["X-Ratelimit-Reset"])
+            used = float(headers.get("X-Ratelimit-Used", 0))
+        except (KeyError, ValueError):
+            return
+        self.rate_limiter.observe_limits(remaining, reset, used)
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET an OAuth API path and return its decoded JSON."""
+        params = {**(params or {}), "raw_json": 1}
+        for attempt in range(2):
+            await self.rate_limiter.wait_if_needed("reddit_api")
+            token = await self._access_token(force_refresh=attempt > 0)
+            async with self.session.get(
+                f"{self.oauth_url}{path}",
+                params=params,
+                headers={"Authorization": f"bearer {token}"},
+            ) as response:
+                self._observe_rate_limits(response.headers)
+                # An expired or revoked token gets one refresh and retry
+                if response.status == 401 and attempt == 0:
+                    continue
+                response.raise_for_status()
+                return await response.json()
+
+    async def get_subreddit_info(self, subreddit_name: str) -> Dict[str, Any]:
+        """Get subreddit information."""
+        payload = await self._get(f"/r/{subreddit_name}/about")
+        return subreddit_from_json(payload["data"])
+
+    async def get_subreddit_posts(
+        self,
+        subreddit_name: str,
+        sort: str = "hot",
+        limit: int = 100,
+        time_filter: str = "all",
+    ) -> List[Dict[str, Any]]:
+        """Get posts from a subreddit, paging 100 at a time."""
+        if sort not in ("hot", "new", "top", "rising"):
+            raise ValueError(f"Invalid sort method: {sort}")
+
+        posts: List[Dict[str, Any]] = []
+        after = None
+        while len(posts) < limit:
+            params = {"limit": min(LISTING_PAGE_SIZE, limit - len(posts))}
+            if sort == "top":
+                params["t"] = time_filter
+            if after:
+                params["after"] = after
+
+            payload = await self._get(f"/r/{subreddit_name}/{sort}", params)
+            listing = payload["data"]
+            for child in listing["children"]:
+                if child["kind"] != "t3":
+                    continue
+                try:
+                    posts.append(post_from_json(child["data"]))
+                except (KeyError, TypeError, ValueError) as e:
+                    self.logger.warning(
+                        f"Error processing post {child['data'].get('id')}: {e}"
+                    )
+
+            after = listing.get("after")
+            if not after or not listing["children"]:
+                break
+
+        return posts[:limit]
+
+    async def get_post_comments(
+        self,
+        post_id: str,
+        limit: Optional[int] = None,
+        depth: Optional[int] = None,
+        sort: str = "best",
+    ) -> List[Dict[str, Any]]:
+        """Get the comments returned with a post, flattened level by level.
+
+        ``depth`` caps reply depth on the server side. "Load more"
+        stubs are not expanded, matching ``replace_more(limit=0)``.
+        """
+        params: Dict[str, Any] = {"sort": sort}
+        if depth is not None:
+            params["depth"] = depth
+        if limit is not None:
+            params["limit"] = limit
+
+        payload = await self._get(f"/comments/{post_id}", params)
+        comment_data: List[Dict[str, Any]] = []
+
+        # Breadth-first, the order PRAW's CommentForest.list() uses
+        queue = deque(payload[1]["data"]["children"])
+        while queue:
+            child = queue.popleft()
+            if child["kind"] != "t1":
+                continue
+            data = child["data"]
+
+            if data.get("body") not in ["[deleted]", "[removed]"]:
+                try:
+                    comment_data.append(comment_from_json(data, post_id))
+                except (KeyError, TypeError, ValueError) as e:
+                    self.logger.warning(
+                        f"Error processing comment {data.get('id')}: {e}"
+                    )
+                    continue
+                if limit and len(comment_data) >= limit:
+                    break
+
+            replies = data.get("replies")
+            if replies:
+                queue.extend(replies["data"]["children"])
+
+        return comment_data
+
+    async def get_user_info(self, username: str) -> Dict[str, Any]:
+        """Get user information."""
+        payload = await self._get(f"/user/{username}/about")
+        return user_from_json(payload["data"])
@@ -0,0 +1,147 @@
+"""Resolve post and comment authors to User rows a batch at a time."""
+
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from reddit_analyzer.config import get_config
+from reddit_analyzer.core.rate_limiter import RateLimiter
+from reddit_analyzer.models.collection_job import AuthorLookupFailure
+from reddit_analyzer.models.user import User
+from reddit_analyzer.services.bulk_writer import BulkWriter
+from reddit_analyzer.utils.logging import LoggerMixin
+
+UNRESOLVABLE_AUTHORS = ("[deleted]", "[removed]")
+
+
+class AuthorResolver(LoggerMixin):
+    """Map author names to ``User`` rows with as few round trips as possible.
+
+    For each batch, users already stored are loaded with one ``IN`` query,
+    names that failed within ``negative_ttl`` seconds are skipped with a
+    second one, and the rest are fetched through ``fetch_user``. Failures
+    (suspended or deleted accounts) are recorded so later runs don't retry
+    them until the TTL passes. Without ``fetch_user``, missing users are
+    created from the name alone.
+
+    ``resolve`` fetches serially on purpose, each lookup waiting for a slot
+    from ``rate_limiter``: the sync ``fetch_user`` is bound to the CLI's
+    single ``praw.Reddit``, whose requests session PRAW documents as unsafe
+    to share across threads. Async callers get concurrent lookups by
+    pairing ``pending``/``record`` with
+    ``collection_scheduler.fetch_author_profiles``.
+
+    Users resolved once are remembered for the life of the resolver. The
+    caller commits.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        fetch_user: Optional[Callable[[str], Dict[str, Any]]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        negative_ttl: Optional[int] = None,
+    ):
+        config = get_config()
+        self.db = db
+        self.fetch_user = fetch_user
+        self.rate_limiter = rate_limiter
+        self.negative_ttl = (
+            config.AUTHOR_NEGATIVE_CACHE_TTL if negative_ttl is None else negative_ttl
+        )
+        self._users: Dict[str, Optional[User]] = {}
+        self.stats = {"queried": 0, "fetched": 0, "failed": 0, "negative_hits": 0}
+
+    def resolve(self, usernames: Iterable[Optional[str]]) -> Dict[str, Optional[User]]:
+        """Resolve a batch of names; unresolvable ones map to None."""
+        names = self._usable(usernames)
+        missing = self.pending(names)
+        if self.fetch_user is not None:
+            self._fetch(missing)
+        else:
+            self._add_users([{"username": name} for name in missing])
+        return {name: self._users[name] for name in names}
+
+    def pending(self, usernames: Iterable[Optional[str]]) -> List[str]:
+        """Load stored users and return the names that still need a lookup.
+
+        Names in the negative cache map to None and are left out. Together
+        with ``record`` this lets callers do the lookups themselves, e.g.
+        through an async client.
+        """
+        missing = [name for name in self._usable(usernames) if name not in self._users]
+        if not missing:
+            return []
+
+        self.stats["queried"] += len(missing)
+        for user in self.db.query(User).filter(User.username.in_(missing)):
+            self._users[user.username] = user
+        missing = [name for name in missing if name not in self._users]
+        if not missing:
+            return []
+
+        known_bad = self._recent_failures(missing)
+        self.stats["negative_hits"] += len(known_bad)
+        for name in known_bad:
+            self._users[name] = None
+        return [name for name in missing if name not in known_bad]
+
+    def record(
+        self, profiles: Dict[str, Dict[str, Any]], failures: Dict[str, str]
+    ) -> None:
+        """Store profiles fetched for ``pending`` names and note failed lookups."""
+        if failures:
+            self.stats["failed"] += len(failures)
+            BulkWriter(self.db).record_lookup_failures(failures)
+        for name in failures:
+            self._users[name] = None
+        self.stats["fetched"] += len(profiles)
+        # Keep the requested spelling; Reddit names are case-insensitive
+        self._add_users(
+            [{**profile, "username": name} for name, profile in profiles.items()]
+        )
+
+    @staticmethod
+    def _usable(usernames: Iterable[Optional[str]]) -> List[str]:
+        return [
+            name
+            for name in dict.fromkeys(usernames)
+            if name and name not in UNRESOLVABLE_AUTHORS
+        ]
+
+    def _recent_failures(self, names: List[str]) -> set:
+        cutoff = datetime.utcnow() - timedelta(seconds=self.negative_ttl)
+        rows = (
+            self.db.query(AuthorLookupFailure.username)
+            .filter(
+                AuthorLookupFailure.username.in_(names),
+                AuthorLookupFailure.failed_at >= cutoff,
+            )
+            .all()
+        )
+        return {row[0] for row in rows}
+
+    def _fetch(self, names: List[str]) -> None:
+        profiles, failures = {}, {}
+        for name in names:
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve("reddit_api")
+                if delay > 0:
+                    time.sleep(delay)
+            try:
+                profiles[name] = self.fetch_user(name)
+            except Exception as e:
+                self.logger.debug(f"Author lookup failed for {name}: {e}")
+                failures[name] = str(e)
+        self.record(profiles, failures)
+
+    def _add_users(self, profiles: List[Dict[str, Any]]) -> None:
+        """Insert users in bulk, then load them with one query."""
+        if not profiles:
+            return
+        BulkWriter(self.db).upsert_users(profiles)
+        names = [profile["username"] for profile in profiles]
+        for user in self.db.query(User).filter(User.username.in_(names)):
+            self._users[user.username] = user
@@ -0,0 +1,243 @@
+"""Set-based upserts of collected users, posts and comments."""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from reddit_analyzer.models import AuthorLookupFailure, Comment, Post, User
+from reddit_analyzer.models.user import UserRole
+from reddit_analyzer.utils.logging import LoggerMixin
+
+# Fields Reddit changes after creation; everything else is written once
+MUTABLE_POST_FIELDS = (
+    "selftext",
+    "score",
+    "upvote_ratio",
+    "num_comments",
+    "is_nsfw",
+    "is_locked",
+)
+MUTABLE_COMMENT_FIELDS = ("body", "score", "is_deleted")
+MUTABLE_USER_FIELDS = ("comment_karma", "link_karma", "is_verified")
+
+# Bound parameters per statement: SQLite builds before 3.32 allow 999
+_MAX_PARAMS = {"sqlite": 999, "postgresql": 30000}
+
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+@dataclass
+class UpsertResult:
+    """Counts and timing for one bulk write."""
+
+    inserted: int = 0
+    updated: int = 0
+    seconds: float = 0.0
+    inserted_ids: List[Any] = field(default_factory=list)
+
+    @property
+    def rows(self) -> int:
+        return self.inserted + self.updated
+
+    @property
+    def rows_per_second(self) -> float:
+        return round(self.rows / self.seconds, 1) if self.seconds else 0.0
+
+    def __iadd__(self, other: "UpsertResult") -> "UpsertResult":
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.seconds += other.seconds
+        self.inserted_ids.extend(other.inserted_ids)
+        return self
+
+
+def _as_datetime(value: Union[datetime, str, None]) -> Optional[datetime]:
+    # RedditClient returns datetimes, EnhancedRedditClient ISO strings
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class BulkWriter(LoggerMixin):
+    """Write pages of normalized client dicts with ``INSERT ... ON CONFLICT``.
+
+    Each page costs one ``IN`` query to tell inserts from updates plus one
+    statement per chunk of rows, instead of an existence query and an ORM
+    insert per row. Existing rows get their mutable fields refreshed, so
+    re-collecting a listing keeps scores and comment counts current.
+    Supports SQLite and PostgreSQL. The caller commits.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.dialect = db.get_bind().dialect.name
+        if self.dialect not in _INSERTS:
+            raise ValueError(f"Bulk upserts are not supported on {self.dialect}")
+
+    def upsert_users(self, users: Iterable[Dict[str, Any]]) -> UpsertResult:
+        """Insert users by username; profile fields update when present."""
+        rows = {}
+        for user in users:
+            row = {
+                "username": user["username"],
+                "role": UserRole.USER,  # Reddit users are regular users
+                "is_active": True,
+            }
+            for key in MUTABLE_USER_FIELDS:
+                if key in user:
+                    row[key] = user[key]
+            if "created_utc" in user:
+                row["created_utc"] = _as_datetime(user["created_utc"])
+            rows[row["username"]] = row
+        return self._upsert(
+            User, User.username, list(rows.values()), MUTABLE_USER_FIELDS
+        )
+
+    def record_lookup_failures(self, failures: Dict[str, str]) -> None:
+        """Upsert negative-cache entries, counting repeated failures.
+
+        An upsert rather than get-or-add, so concurrent collections that
+        hit the same missing author don't collide on the primary key.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {"username": name, "reason": reason[:500], "failed_at": now, "attempts": 1}
+            for name, reason in failures.items()
+        ]
+        table = AuthorLookupFailure.__table__
+        for chunk in self._chunks(rows, 4):
+            stmt = _INSERTS[self.dialect](table).values(chunk)
+            self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["username"],
+                    set_={
+                        "reason": stmt.excluded.reason,
+                        "failed_at": stmt.excluded.failed_at,
+                        "attempts": table.c.attempts + 1,
+                    },
+                )
+            )
+
+    def user_ids(self, usernames: Iterable[str]) -> Dict[str, int]:
+        """Map usernames to user ids in one query."""
+        names = list(set(usernames))
+        if not names:
+            return {}
+        rows = self.db.query(User.username, User.id).filter(User.username.in_(names))
+        return dict(rows.all())
+
+    def upsert_posts(
+        self,
+        posts: Sequence[Dict[str, Any]],
+        subreddit_id: int,
+        author_ids: Optional[Dict[str, int]] = None,
+    ) -> UpsertResult:
+        author_ids = author_ids or {}
+        rows = {
+            post["id"]: {
+                "id": post["id"],
+                "title": post["title"][:500],
+                "selftext": post.get("selftext"),
+                "url": post.get("url"),
+                "author_id": author_ids.get(post.get("author")),
+                "subreddit_id": subreddit_id,
+                "score": post.get("score", 0),
+                "upvote_ratio": post.get("upvote_ratio"),
+                "num_comments": post.get("num_comments", 0),
+                "created_utc": _as_datetime(post["created_utc"]),
+                "is_self": post.get("is_self", False),
+                "is_nsfw": post.get("is_nsfw", False),
+                "is_locked": post.get("is_locked", False),
+            }
+            for post in posts
+        }
+        return self._upsert(Post, Post.id, list(rows.values()), MUTABLE_POST_FIELDS)
+
+    def upsert_comments(
+        self,
+        comments: Sequence[Dict[str, Any]],
+        author_ids: Optional[Dict[str, int]] = None,
+    ) -> UpsertResult:
+        author_ids = author_ids or {}
+        rows = {
+            comment["id"]: {
+                "id": comment["id"],
+                "post_id": comment["post_id"],
+                # Top-level comments have the post as parent
+                "parent_id": (
+                    comment.get("parent_id")
+                    if comment.get("parent_id") != f"t3_{comment['post_id']}"
+                    else None
+                ),
+                "author_id": author_ids.get(comment.get("author")),
+                "body": comment.get("body"),
+                "score": comment.get("score", 0),
+                "created_utc": _as_datetime(comment["created_utc"]),
+                "is_deleted": comment.get("is_deleted", False),
+            }
+            for comment in comments
+        }
+        return self._upsert(
+            Comment, Comment.id, list(rows.values()), MUTABLE_COMMENT_FIELDS
+        )
+
+    def _upsert(
+        self,
+        model,
+        key_column,
+        rows: List[Dict[str, Any]],
+        mutable_fields: Sequence[str],
+    ) -> UpsertResult:
+        result = UpsertResult()
+        if not rows:
+            return result
+
+        started = time.perf_counter()
+        keys = [row[key_column.key] for row in rows]
+        existing = set()
+        for chunk in self._chunks(keys, 1):
+            existing.update(
+                value
+                for (value,) in self.db.query(key_column).filter(key_column.in_(chunk))
+            )
+
+        # Rows in one statement need the same columns; omitted ones keep
+        # their defaults on insert and their stored values on update
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        for columns, group in groups.items():
+            for chunk in self._chunks(group, len(columns)):
+                self.db.execute(
+                    self._statement(model, key_column, chunk, columns, mutable_fields)
+                )
+
+        result.inserted_ids = [key for key in keys if key not in existing]
+        result.inserted = len(result.inserted_ids)
+        result.updated = len(keys) - result.inserted
+        result.seconds = time.perf_counter() - started
+        self.logger.debug(
+            f"Upserted {model.__tablename__}: {result.inserted} inserted, "
+            f"{result.updated} updated ({result.rows_per_second} rows/s)"
+        )
+        return result
+
+    def _statement(self, model, key_column, rows, columns, mutable_fields):
+        stmt = _INSERTS[self.dialect](model.__table__).values(rows)
+        update = {
+            name: stmt.excluded[name] for name in mutable_fields if name in columns
+        }
+        if not update:
+            return stmt.on_conflict_do_nothing(index_elements=[key_column.key])
+        if "updated_at" in model.__table__.c:
+            update["updated_at"] = datetime.utcnow()
+        return stmt.on_conflict_do_update(index_elements=[key_column.key], set_=update)
+
+    def _chunks(self, items: List[Any], params_per_item: int) -> Iterable[List[Any]]:
+        size = max(1, _MAX_PARAMS[self.dialect] // max(params_per_item, 1))
+        for start in range(0, len(items), size):
+            yield items[start : start + size]
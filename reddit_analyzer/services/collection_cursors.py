@@ -0,0 +1,80 @@
+"""Per-subreddit high-water marks for incremental post collection."""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from sqlalchemy.orm import Session
+
+from reddit_analyzer.models.collection_job import CollectionCursor
+
+# Only "new" is strictly newest-first; hot/top/rising reorder known posts
+INCREMENTAL_SORTS = ("new",)
+
+
+def take_new_submissions(
+    submissions: Iterable[Any],
+    newest_fullname: Optional[str] = None,
+    newest_created_utc: Optional[datetime] = None,
+) -> List[Any]:
+    """Consume a newest-first listing up to the first already-collected post.
+
+    PRAW's listing generators fetch pages lazily, so stopping here means
+    pages beyond known content are never requested: a quiet subreddit
+    costs a single request. Besides the cursor post itself, anything
+    older than the cursor also stops the walk, so a deleted cursor post
+    doesn't cause a full re-download.
+    """
+    cutoff = newest_created_utc.timestamp() if newest_created_utc else None
+    fresh = []
+    for submission in submissions:
+        if newest_fullname and submission.fullname == newest_fullname:
+            break
+        if cutoff is not None and submission.created_utc < cutoff:
+            break
+        fresh.append(submission)
+    return fresh
+
+
+def get_cursor(
+    db: Session, subreddit_name: str, sort: str
+) -> Optional[CollectionCursor]:
+    return (
+        db.query(CollectionCursor)
+        .filter(
+            CollectionCursor.subreddit_name == subreddit_name.lower(),
+            CollectionCursor.sort == sort,
+        )
+        .first()
+    )
+
+
+def _as_datetime(value: Union[datetime, str]) -> datetime:
+    # RedditClient returns datetimes, EnhancedRedditClient ISO strings
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def advance_cursor(
+    db: Session, subreddit_name: str, sort: str, posts: List[Dict[str, Any]]
+) -> CollectionCursor:
+    """Move the cursor to the newest of ``posts`` and record the run.
+
+    The cursor never moves backwards. The caller commits.
+    """
+    cursor = get_cursor(db, subreddit_name, sort)
+    if cursor is None:
+        cursor = CollectionCursor(subreddit_name=subreddit_name.lower(), sort=sort)
+        db.add(cursor)
+
+    if posts:
+        newest = max(posts, key=lambda post: _as_datetime(post["created_utc"]))
+        newest_created = _as_datetime(newest["created_utc"])
+        if (
+            cursor.newest_created_utc is None
+            or newest_created >= cursor.newest_created_utc
+        ):
+            cursor.newest_fullname = f"t3_{newest['id']}"
+            cursor.newest_created_utc = newest_created
+
+    cursor.last_run_at = datetime.utcnow()
+    cursor.last_run_items = len(posts)
+    return cursor
@@ -0,0 +1,234 @@
+"""Collect many subreddits concurrently through one client and rate budget."""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from reddit_analyzer.config import get_config
+from reddit_analyzer.database import get_async_db_session
+from reddit_analyzer.models import Subreddit
+from reddit_analyzer.models.collection_job import CollectionCursor
+from reddit_analyzer.services.author_resolver import AuthorResolver
+from reddit_analyzer.services.bulk_writer import BulkWriter
+from reddit_analyzer.services.collection_cursors import (
+    INCREMENTAL_SORTS,
+    advance_cursor,
+    get_cursor,
+)
+from reddit_analyzer.services.enhanced_reddit_client import EnhancedRedditClient
+from reddit_analyzer.utils.logging import LoggerMixin
+
+
+def store_posts(
+    db: Session,
+    subreddit_name: str,
+    posts: List[Dict[str, Any]],
+    author_resolver: Optional[AuthorResolver] = None,
+) -> List[str]:
+    """Upsert a page of posts and return the ids of new ones. The caller commits.
+
+    Authors missing from ``author_resolver`` (by default one without a
+    fetcher) are stored by name only; pass a resolver that has ``record``ed
+    their profiles to store those too.
+    """
+    if not posts:
+        return []
+
+    # Watch-list names are lowercased; stored names are Reddit's display name
+    subreddit = (
+        db.query(Subreddit)
+        .filter(func.lower(Subreddit.name) == subreddit_name.lower())
+        .first()
+    )
+    if not subreddit:
+        name = posts[0].get("subreddit") or subreddit_name
+        subreddit = Subreddit(name=name, display_name=name)
+        db.add(subreddit)
+        db.flush()
+
+    author_resolver = author_resolver or AuthorResolver(db)
+    authors = author_resolver.resolve(post["author"] for post in posts)
+    author_ids = {name: user.id for name, user in authors.items() if user}
+    return BulkWriter(db).upsert_posts(posts, subreddit.id, author_ids).inserted_ids
+
+
+async def fetch_author_profiles(
+    client: EnhancedRedditClient,
+    usernames: List[str],
+    max_concurrency: Optional[int] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Look up profiles for ``AuthorResolver.record``: (profiles, failures).
+
+    Up to ``max_concurrency`` (default ``AUTHOR_FETCH_CONCURRENCY``)
+    lookups are in flight at once; the client's rate limiter paces them.
+    """
+    if max_concurrency is None:
+        max_concurrency = get_config().AUTHOR_FETCH_CONCURRENCY
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+    profiles: Dict[str, Dict[str, Any]] = {}
+    failures: Dict[str, str] = {}
+
+    async def lookup(name: str) -> None:
+        async with semaphore:
+            try:
+                profiles[name] = await client.get_user_info(name)
+            except Exception as e:
+                failures[name] = str(e)
+
+    await asyncio.gather(*(lookup(name) for name in usernames))
+    return profiles, failures
+
+
+class CollectionScheduler(LoggerMixin):
+    """Collect posts from a watch-list of subreddits in one event loop.
+
+    Up to ``max_concurrency`` subreddits are in progress at once, all
+    drawing on the client's rate limiter and cache, so while one
+    subreddit's rows are being written the next request is already
+    waiting for its slot and the budget is never left idle. Subreddits
+    are started stalest first, by the ``last_run_at`` of their cursor;
+    ones never collected go first.
+
+    Rows are written through ``AsyncSession``s, so storing one page doesn't
+    block the loop and stall the other subreddits' requests.
+    """
+
+    def __init__(
+        self,
+        client: EnhancedRedditClient,
+        max_concurrency: int = 8,
+        sort: str = "new",
+        post_limit: int = 100,
+        time_filter: str = "all",
+        session_factory: Callable[
+            [], AsyncContextManager[AsyncSession]
+        ] = get_async_db_session,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.sort = sort
+        self.post_limit = post_limit
+        self.time_filter = time_filter
+        self.session_factory = session_factory
+
+    async def order_by_staleness(self, subreddit_names: List[str]) -> List[str]:
+        """Deduplicate the watch-list and sort it least recently run first."""
+        names = list(dict.fromkeys(name.lower() for name in subreddit_names))
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(
+                    CollectionCursor.subreddit_name, CollectionCursor.last_run_at
+                ).where(
+                    CollectionCursor.subreddit_name.in_(names),
+                    CollectionCursor.sort == self.sort,
+                )
+            )
+            rows = result.all()
+        last_run = {name: last_run_at for name, last_run_at in rows}
+        # sorted() is stable, so ties keep watch-list order
+        return sorted(names, key=lambda name: last_run.get(name) or datetime.min)
+
+    async def run(self, subreddit_names: List[str]) -> Dict[str, Any]:
+        """Collect every subreddit on the watch-list and summarize the run."""
+        pending = deque(await self.order_by_staleness(subreddit_names))
+        results: Dict[str, Dict[str, Any]] = {}
+        started = time.monotonic()
+
+        async def worker():
+            while pending:
+                name = pending.popleft()
+                results[name] = await self._collect_one(name)
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(self.max_concurrency, len(pending))))
+        )
+
+        elapsed = time.monotonic() - started
+        fetched = sum(result["posts_fetched"] for result in results.values())
+        return {
+            "subreddits": results,
+            "total_posts_fetched": fetched,
+            "total_posts_stored": sum(
+                result["posts_stored"] for result in results.values()
+            ),
+            "failed": [name for name, result in results.items() if result["error"]],
+            "elapsed_seconds": round(elapsed, 2),
+            "posts_per_minute": round(fetched * 60 / elapsed, 1) if elapsed else 0.0,
+        }
+
+    async def _collect_one(self, subreddit_name: str) -> Dict[str, Any]:
+        started = time.monotonic()
+        result: Dict[str, Any] = {
+            "posts_fetched": 0,
+            "posts_stored": 0,
+            "error": None,
+        }
+        incremental = self.sort in INCREMENTAL_SORTS
+
+        try:
+            if incremental:
+                async with self.session_factory() as db:
+                    cursor = await db.run_sync(get_cursor, subreddit_name, self.sort)
+                    since = (
+                        (cursor.newest_fullname, cursor.newest_created_utc)
+                        if cursor
+                        else (None, None)
+                    )
+                posts = await self.client.get_new_posts_since(
+                    subreddit_name, *since, limit=self.post_limit
+                )
+            else:
+                posts = await self.client.get_subreddit_posts(
+                    subreddit_name,
+                    sort=self.sort,
+                    limit=self.post_limit,
+                    time_filter=self.time_filter,
+                    use_cache=False,
+                )
+
+            # Fetch unseen authors between sessions, not while holding one
+            authors = [post["author"] for post in posts]
+            async with self.session_factory() as db:
+                pending = await db.run_sync(
+                    lambda sync_db: AuthorResolver(sync_db).pending(authors)
+                )
+            profiles, failures = await fetch_author_profiles(self.client, pending)
+
+            async with self.session_factory() as db:
+                stored = await db.run_sync(
+                    self._store_page, subreddit_name, posts, profiles, failures
+                )
+
+            result["posts_fetched"] = len(posts)
+            result["posts_stored"] = len(stored)
+            result["new_post_ids"] = stored
+        except Exception as e:
+            self.logger.error(f"Failed to collect r/{subreddit_name}: {e}")
+            result["error"] = str(e)
+
+        result["duration_seconds"] = round(time.monotonic() - started, 2)
+        return result
+
+    def _store_page(
+        self,
+        db: Session,
+        subreddit_name: str,
+        posts: List[Dict[str, Any]],
+        profiles: Dict[str, Dict[str, Any]],
+        failures: Dict[str, str],
+    ) -> List[str]:
+        # Runs inside AsyncSession.run_sync; the driver I/O is still awaited
+        author_resolver = AuthorResolver(db)
+        author_resolver.record(profiles, failures)
+        stored = store_posts(db, subreddit_name, posts, author_resolver)
+        advance_cursor(db, subreddit_name, self.sort, posts)
+        return stored
@@ -0,0 +1,118 @@
+"""Budgeted expansion of "load more comments" stubs in PRAW comment trees."""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional
+
+from praw.const import API_PATH
+from praw.models import MoreComments
+
+# /api/morechildren accepts up to 100 comment ids per call
+MORECHILDREN_BATCH = 100
+
+
+@dataclass
+class MoreStub:
+    """A MoreComments stub with the context used to rank it."""
+
+    more: Any
+    depth: int
+    parent_score: int
+
+    @property
+    def value(self) -> float:
+        """Hidden comments, weighted by how well received the parent is.
+
+        The weight grows logarithmically so one viral parent doesn't
+        outrank every other branch of the thread.
+        """
+        return self.more.count * math.log2(2 + max(self.parent_score, 0))
+
+
+def collect_more_stubs(
+    comments: Iterable[Any],
+    submission_score: int,
+    max_depth: Optional[int] = None,
+    min_score: Optional[int] = None,
+) -> List[MoreStub]:
+    """Find the stubs worth expanding in an unexpanded comment forest.
+
+    Top-level stubs rank by the submission's score. Stubs below
+    ``max_depth``, under a comment scoring below ``min_score``, or of the
+    "continue this thread" kind (which needs a request per thread) are
+    left out, since their comments would be filtered anyway.
+    """
+    stubs: List[MoreStub] = []
+
+    def walk(items, depth, parent_score):
+        for item in items:
+            if isinstance(item, MoreComments):
+                if (
+                    item.count
+                    and item.children
+                    and (max_depth is None or depth <= max_depth)
+                ):
+                    stubs.append(MoreStub(item, depth, parent_score))
+                continue
+            if min_score is not None and item.score < min_score:
+                continue
+            walk(item.replies, depth + 1, item.score)
+
+    walk(comments, 0, submission_score)
+    return stubs
+
+
+def plan_morechildren_batches(
+    stubs: List[MoreStub], budget: int, batch_size: int = MORECHILDREN_BATCH
+) -> List[List[str]]:
+    """Pack the children of the most valuable stubs into at most ``budget`` calls.
+
+    One call can carry children from any stubs of the same submission, so
+    ids are packed in rank order and the lowest ranked may be cut off.
+    """
+    if budget <= 0:
+        return []
+
+    ranked = sorted(stubs, key=lambda stub: stub.value, reverse=True)
+    ids = list(dict.fromkeys(child for stub in ranked for child in stub.more.children))
+    ids = ids[: budget * batch_size]
+    return [ids[i : i + batch_size] for i in range(0, len(ids), batch_size)]
+
+
+def fetch_morechildren(reddit: Any, submission: Any, children: List[str]) -> List[Any]:
+    """Load one batch of comments with a single /api/morechildren call.
+
+    Comments come back flat, parents before their replies, with Reddit's
+    ``depth`` set; nested stubs in the response are dropped.
+    """
+    things = reddit.post(
+        API_PATH["morechildren"],
+        data={
+            "children": ",".join(children),
+            "link_id": submission.fullname,
+            "sort": submission.comment_sort,
+        },
+    )
+    return [thing for thing in things if not isinstance(thing, MoreComments)]
+
+
+def expand_more_comments(
+    reddit: Any,
+    submission: Any,
+    budget: int,
+    max_depth: Optional[int] = None,
+    min_score: Optional[int] = None,
+) -> List[Any]:
+    """Expand the best stubs of ``submission`` within ``budget`` requests.
+
+    Call before ``replace_more(limit=0)``, which discards the stubs.
+    """
+    if budget <= 0:
+        return []
+    stubs = collect_more_stubs(
+        submission.comments, submission.score, max_depth, min_score
+    )
+    expanded: List[Any] = []
+    for batch in plan_morechildren_batches(stubs, budget):
+        expanded.extend(fetch_morechildren(reddit, submission, batch))
+    return expanded
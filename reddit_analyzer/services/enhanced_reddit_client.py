@@ -1,24 +1,73 @@
 """Enhanced Reddit API client with rate limiting, caching, and advanced features."""
 
 import asyncio
+import functools
+import math
+import random
 import praw
 from typing import List, Optional, Dict, Any, AsyncGenerator, Callable
+from dataclasses import dataclass
 from datetime import datetime
 import time
 from contextlib import asynccontextmanager
+from uuid import uuid4
 
 from reddit_analyzer.config import get_config
 from reddit_analyzer.utils.logging import LoggerMixin
 from reddit_analyzer.core.rate_limiter import RateLimiter, RateLimitConfig
 from reddit_analyzer.core.request_queue import RequestQueue
 from reddit_analyzer.core.cache import get_cache
+from reddit_analyzer.core.info_batcher import InfoBatcher
+from reddit_analyzer.services.collection_cursors import take_new_submissions
+from reddit_analyzer.services.comment_expansion import expand_more_comments
+from reddit_analyzer.services.listings import LISTING_PAGE_SIZE, fetch_listing_page
+
+
+@dataclass
+class CacheRefreshConfig:
+    """How cached API responses are refreshed.
+
+    Cached entries carry their logical expiry and are kept for an extra
+    ``stale_grace`` seconds, during which the stale value is served while a
+    single background refresh runs. ``early_refresh_beta`` enables
+    probabilistic early refresh (XFetch) so hot keys don't all expire at
+    once; 0 disables it. With ``distributed_lock`` a short Redis lock makes
+    one worker fill a missing key while the others wait for it.
+    """
+
+    stale_grace: int = 300
+    early_refresh_beta: float = 1.0
+    distributed_lock: bool = False
+    lock_ttl: int = 30
+    lock_wait: float = 5.0
+    lock_poll_interval: float = 0.1
+
+
+# Marks cache entries written by _cached_request; anything else is a plain
+# value from an older client and is treated as fresh.
+CACHE_ENVELOPE_MARKER = "__swr__"
+
+
+def subreddit_tag(subreddit_name: str) -> str:
+    """Cache tag shared by every entry derived from one subreddit."""
+    return f"subreddit:{subreddit_name.lower()}"
 
 
 class EnhancedRedditClient(LoggerMixin):
     """Enhanced Reddit API client with rate limiting, caching, and pagination."""
 
-    def __init__(self, rate_limit_config: Optional[RateLimitConfig] = None):
-        """Initialize enhanced Reddit client."""
+    def __init__(
+        self,
+        rate_limit_config: Optional[RateLimitConfig] = None,
+        cache_refresh_config: Optional[CacheRefreshConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """Initialize enhanced Reddit client.
+
+        Pass ``rate_limiter`` to share a budget beyond this client, e.g. a
+        ``DistributedRateLimiter`` in Celery workers; otherwise an in-process
+        limiter is built from ``rate_limit_config``.
+        """
         self.logger.info("Initializing Enhanced Reddit client")
 
         config = get_config()
@@ -34,13 +83,20 @@ class EnhancedRedditClient(LoggerMixin):
         )
 
         # Initialize rate limiter
-        self.rate_limiter = RateLimiter(rate_limit_config or RateLimitConfig())
+        self.rate_limiter = rate_limiter or RateLimiter(
+            rate_limit_config or RateLimitConfig()
+        )
 
         # Initialize request queue
         self.request_queue = RequestQueue(max_concurrent=3)
 
         # Initialize cache
         self.cache = get_cache()
+        self.cache_refresh = cache_refresh_config or CacheRefreshConfig()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Coalesces fullname lookups into /api/info calls of up to 100 ids
+        self.info_batcher = InfoBatcher(self._fetch_info_batch)
 
         # Circuit breaker state
         self.circuit_breaker = {
@@ -66,8 +122,10 @@ class EnhancedRedditClient(LoggerMixin):
 
     async def stop(self):
         """Stop the enhanced client background services."""
+        await self.info_batcher.aclose()
         await self.request_queue.stop_workers()
-        self.cache.close()
+        await self.rate_limiter.aclose()
+        await self.cache.aclose()
         self.logger.info("Enhanced Reddit client stopped")
 
     @asynccontextmanager
@@ -82,12 +140,15 @@ class EnhancedRedditClient(LoggerMixin):
 
         try:
             yield
+            self._observe_rate_limits()
             # Success - reset circuit breaker if it was half-open
             if self.circuit_breaker["state"] == "half-open":
                 self.circuit_breaker["state"] = "closed"
                 self.circuit_breaker["failure_count"] = 0
 
         except Exception as e:
+            # Failed responses (e.g. 429s) still carry rate limit headers
+            self._observe_rate_limits()
             self.circuit_breaker["failure_count"] += 1
             self.circuit_breaker["last_failure_time"] = time.time()
 
@@ -100,28 +161,190 @@ class EnhancedRedditClient(LoggerMixin):
 
             raise e
 
+    def _observe_rate_limits(self):
+        """Feed Reddit's reported budget back into the rate limiter."""
+        try:
+            limits = self.reddit.auth.limits
+        except Exception:
+            # PRAW has no limits until its first request completes
+            return
+        if not isinstance(limits, dict):
+            return
+
+        self.rate_limiter.observe_limits(
+            limits.get("remaining"),
+            limits.get("reset_timestamp"),
+            limits.get("used"),
+        )
+
     async def _cached_request(
-        self, cache_key: str, cache_ttl: int, request_func: Callable, *args, **kwargs
+        self,
+        cache_key: str,
+        cache_ttl: int,
+        request_func: Callable,
+        *args,
+        tags: Optional[List[str]] = None,
+        **kwargs,
     ) -> Any:
-        """Execute a request with caching."""
+        """Execute a request with caching, coalescing and stale-while-revalidate."""
+        fetch = functools.partial(request_func, *args, **kwargs)
+        fill = (cache_key, cache_ttl, fetch, tags)
+
         # Try cache first
-        cached_result = await self.cache.get(cache_key)
-        if cached_result is not None:
-            self.logger.debug(f"Cache hit for key: {cache_key}")
-            return cached_result
+        entry = await self.cache.get(cache_key)
+        if entry is not None:
+            if not self._is_cache_envelope(entry):
+                self.logger.debug(f"Cache hit for key: {cache_key}")
+                return entry
+
+            now = time.time()
+            if now >= entry["expires_at"]:
+                self.logger.debug(f"Serving stale value for key: {cache_key}")
+                self._schedule_refresh(*fill)
+            elif self._should_refresh_early(entry, now):
+                self.logger.debug(f"Early refresh for key: {cache_key}")
+                self._schedule_refresh(*fill)
+            else:
+                self.logger.debug(f"Cache hit for key: {cache_key}")
+            return entry["value"]
+
+        # Coalesce concurrent misses for the same key into one upstream call
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = self._start_fill(*fill, background=False)
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _is_cache_envelope(entry: Any) -> bool:
+        return isinstance(entry, dict) and entry.get(CACHE_ENVELOPE_MARKER) == 1
+
+    def _should_refresh_early(self, entry: Dict[str, Any], now: float) -> bool:
+        """XFetch: refresh with rising probability as expiry approaches."""
+        beta = self.cache_refresh.early_refresh_beta
+        if beta <= 0:
+            return False
+        delta = entry.get("delta", 0.0)
+        # 1 - random() is in (0, 1], so the log is always defined
+        jitter = -delta * beta * math.log(1.0 - random.random())
+        return now + jitter >= entry["expires_at"]
+
+    def _schedule_refresh(
+        self,
+        cache_key: str,
+        cache_ttl: int,
+        fetch: Callable,
+        tags: Optional[List[str]] = None,
+    ):
+        if cache_key not in self._inflight:
+            self._start_fill(cache_key, cache_ttl, fetch, tags, background=True)
+
+    def _start_fill(
+        self,
+        cache_key: str,
+        cache_ttl: int,
+        fetch: Callable,
+        tags: Optional[List[str]],
+        background: bool,
+    ) -> asyncio.Task:
+        task = asyncio.ensure_future(
+            self._fill_cache(cache_key, cache_ttl, fetch, tags, background)
+        )
+        self._inflight[cache_key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            self._inflight.pop(cache_key, None)
+            if background and not finished.cancelled() and finished.exception():
+                self.logger.warning(
+                    f"Background refresh failed for {cache_key}: "
+                    f"{finished.exception()}"
+                )
 
+        task.add_done_callback(_done)
+        return task
+
+    async def _fill_cache(
+        self,
+        cache_key: str,
+        cache_ttl: int,
+        fetch: Callable,
+        tags: Optional[List[str]],
+        background: bool,
+    ) -> Any:
+        """Fetch a value and store it, holding the cross-worker lock if enabled."""
+        if not self.cache_refresh.distributed_lock:
+            return await self._fetch_and_store(cache_key, cache_ttl, fetch, tags)
+
+        lock_key = f"lock:{cache_key}"
+        token = uuid4().hex
+        acquired = await self.cache.set(
+            lock_key, token, ttl=self.cache_refresh.lock_ttl, nx=True
+        )
+
+        if not acquired:
+            if background:
+                # Another worker is already refreshing this key
+                return None
+            value = await self._wait_for_fill(cache_key)
+            if value is not None:
+                return value
+            # The lock holder is slow or died; fetch it ourselves
+            return await self._fetch_and_store(cache_key, cache_ttl, fetch, tags)
+
+        try:
+            return await self._fetch_and_store(cache_key, cache_ttl, fetch, tags)
+        finally:
+            if await self.cache.get(lock_key) == token:
+                await self.cache.delete(lock_key)
+
+    async def _wait_for_fill(self, cache_key: str) -> Optional[Any]:
+        deadline = time.monotonic() + self.cache_refresh.lock_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.cache_refresh.lock_poll_interval)
+            entry = await self.cache.get(cache_key)
+            if entry is None:
+                continue
+            if not self._is_cache_envelope(entry):
+                return entry
+            if time.time() < entry["expires_at"]:
+                return entry["value"]
+        return None
+
+    async def _fetch_and_store(
+        self,
+        cache_key: str,
+        cache_ttl: int,
+        fetch: Callable,
+        tags: Optional[List[str]] = None,
+    ) -> Any:
         # Execute request with rate limiting and circuit breaker
         await self.rate_limiter.wait_if_needed("reddit_api")
 
+        started = time.monotonic()
         async with self.circuit_breaker_context():
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, request_func, *args, **kwargs
-            )
-
-        # Cache the result
-        await self.cache.set(cache_key, result, ttl=cache_ttl)
+            result = await asyncio.get_event_loop().run_in_executor(None, fetch)
+        delta = time.monotonic() - started
+
+        # Cache the result, keeping it past expiry for the stale grace window
+        entry = {
+            CACHE_ENVELOPE_MARKER: 1,
+            "value": result,
+            "expires_at": time.time() + cache_ttl,
+            "delta": delta,
+        }
+        await self.cache.set(
+            cache_key,
+            entry,
+            ttl=cache_ttl + self.cache_refresh.stale_grace,
+            tags=tags,
+        )
         return result
 
+    async def invalidate_subreddit(self, subreddit_name: str) -> int:
+        """Drop every cached listing, comment tree and info entry for a subreddit."""
+        deleted = await self.cache.invalidate_tags(subreddit_tag(subreddit_name))
+        self.logger.info(f"Invalidated {deleted} cache entries for r/{subreddit_name}")
+        return deleted
+
     async def get_subreddit_info(
         self, subreddit_name: str, use_cache: bool = True, cache_ttl: int = 3600
     ) -> Dict[str, Any]:
@@ -129,24 +352,15 @@ class EnhancedRedditClient(LoggerMixin):
         cache_key = f"subreddit_info:{subreddit_name}"
 
         def _get_subreddit_info():
-            subreddit = self.reddit.subreddit(subreddit_name)
-            return {
-                "name": subreddit.display_name,
-                "display_name": subreddit.display_name_prefixed,
-                "description": subreddit.description,
-                "public_description": subreddit.public_description,
-                "subscribers": subreddit.subscribers,
-                "created_utc": datetime.fromtimestamp(
-                    subreddit.created_utc
-                ).isoformat(),
-                "is_nsfw": subreddit.over18,
-                "lang": subreddit.lang,
-                "submission_type": subreddit.submission_type,
-                "fetched_at": datetime.now().isoformat(),
-            }
+            return self._subreddit_to_dict(self.reddit.subreddit(subreddit_name))
 
         if use_cache:
-            return await self._cached_request(cache_key, cache_ttl, _get_subreddit_info)
+            return await self._cached_request(
+                cache_key,
+                cache_ttl,
+                _get_subreddit_info,
+                tags=[subreddit_tag(subreddit_name)],
+            )
         else:
             await self.rate_limiter.wait_if_needed("reddit_api")
             async with self.circuit_breaker_context():
@@ -184,29 +398,7 @@ class EnhancedRedditClient(LoggerMixin):
             post_data = []
             for post in posts:
                 try:
-                    post_dict = {
-                        "id": post.id,
-                        "title": post.title,
-                        "selftext": post.selftext,
-                        "url": post.url,
-                        "author": post.author.name if post.author else "[deleted]",
-                        "subreddit": post.subreddit.display_name,
-                        "score": post.score,
-                        "upvote_ratio": post.upvote_ratio,
-                        "num_comments": post.num_comments,
-                        "created_utc": datetime.fromtimestamp(
-                            post.created_utc
-                        ).isoformat(),
-                        "is_self": post.is_self,
-                        "is_nsfw": post.over_18,
-                        "is_locked": post.locked,
-                        "distinguished": post.distinguished,
-                        "stickied": post.stickied,
-                        "link_flair_text": post.link_flair_text,
-                        "post_hint": getattr(post, "post_hint", None),
-                        "fetched_at": datetime.now().isoformat(),
-                    }
-                    post_data.append(post_dict)
+                    post_data.append(self._post_to_dict(post))
                 except Exception as e:
                     self.logger.warning(f"Error processing post {post.id}: {e}")
                     continue
@@ -214,12 +406,132 @@ class EnhancedRedditClient(LoggerMixin):
             return post_data
 
         if use_cache:
-            return await self._cached_request(cache_key, cache_ttl, _get_posts)
+            return await self._cached_request(
+                cache_key, cache_ttl, _get_posts, tags=[subreddit_tag(subreddit_name)]
+            )
         else:
             await self.rate_limiter.wait_if_needed("reddit_api")
             async with self.circuit_breaker_context():
                 return await asyncio.get_event_loop().run_in_executor(None, _get_posts)
 
+    async def iter_subreddit_posts(
+        self,
+        subreddit_name: str,
+        sort: str = "hot",
+        limit: int = 1000,
+        time_filter: str = "all",
+        use_cache: bool = True,
+        cache_ttl: int = 900,  # 15 minutes
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Yield posts a page (up to 100) at a time as each page arrives.
+
+        The next page is requested while the caller processes the current
+        one, and each page is cached under its own key, so at most two
+        pages are held in memory regardless of ``limit``.
+        """
+        remaining = limit
+        next_page = asyncio.ensure_future(
+            self._fetch_posts_page(
+                subreddit_name,
+                sort,
+                min(LISTING_PAGE_SIZE, remaining),
+                None,
+                time_filter,
+                use_cache,
+                cache_ttl,
+            )
+        )
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                posts = page["posts"]
+                remaining -= len(posts)
+
+                if page["after"] and remaining > 0:
+                    next_page = asyncio.ensure_future(
+                        self._fetch_posts_page(
+                            subreddit_name,
+                            sort,
+                            min(LISTING_PAGE_SIZE, remaining),
+                            page["after"],
+                            time_filter,
+                            use_cache,
+                            cache_ttl,
+                        )
+                    )
+                if posts:
+                    yield posts
+        finally:
+            # The caller stopped early; don't leave a prefetch running
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _fetch_posts_page(
+        self,
+        subreddit_name: str,
+        sort: str,
+        page_size: int,
+        after: Optional[str],
+        time_filter: str,
+        use_cache: bool,
+        cache_ttl: int,
+    ) -> Dict[str, Any]:
+        cache_key = (
+            f"posts:{subreddit_name}:{sort}:{time_filter}:"
+            f"page:{page_size}:{after or 'first'}"
+        )
+
+        def _get_page():
+            submissions, next_after = fetch_listing_page(
+                self.reddit.subreddit(subreddit_name),
+                sort,
+                page_size,
+                after,
+                time_filter,
+            )
+            posts = []
+            for post in submissions:
+                try:
+                    posts.append(self._post_to_dict(post))
+                except Exception as e:
+                    self.logger.warning(f"Error processing post {post.id}: {e}")
+            return {"posts": posts, "after": next_after}
+
+        if use_cache:
+            return await self._cached_request(
+                cache_key, cache_ttl, _get_page, tags=[subreddit_tag(subreddit_name)]
+            )
+        await self.rate_limiter.wait_if_needed("reddit_api")
+        async with self.circuit_breaker_context():
+            return await asyncio.get_event_loop().run_in_executor(None, _get_page)
+
+    async def get_new_posts_since(
+        self,
+        subreddit_name: str,
+        newest_fullname: Optional[str] = None,
+        newest_created_utc: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Get posts newer than a collection cursor, newest first.
+
+        Pages through ``new`` only until reaching the cursor, so a quiet
+        subreddit costs one request. Never cached, since the point is to
+        see what arrived since the last run.
+        """
+
+        def _get_new_posts():
+            submissions = take_new_submissions(
+                self.reddit.subreddit(subreddit_name).new(limit=limit),
+                newest_fullname,
+                newest_created_utc,
+            )
+            return [self._post_to_dict(post) for post in submissions]
+
+        await self.rate_limiter.wait_if_needed("reddit_api")
+        async with self.circuit_breaker_context():
+            return await asyncio.get_event_loop().run_in_executor(None, _get_new_posts)
+
     async def get_post_comments(
         self,
         post_id: str,
@@ -228,9 +540,24 @@ class EnhancedRedditClient(LoggerMixin):
         sort: str = "best",
         use_cache: bool = True,
         cache_ttl: int = 1800,  # 30 minutes
+        subreddit_name: Optional[str] = None,
+        expand_budget: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Get comments for a specific post with depth control."""
-        cache_key = f"comments:{post_id}:{limit}:{depth}:{sort}"
+        """Get comments for a specific post with depth control.
+
+        ``expand_budget`` is the number of requests spent loading "more
+        comments" stubs, most valuable first, up to 100 comments each;
+        it defaults to ``depth``, or none without one.
+
+        Pass ``subreddit_name`` to tag the cached tree with its subreddit so
+        ``invalidate_subreddit`` drops it too.
+        """
+        if expand_budget is None:
+            expand_budget = depth or 0
+        cache_key = f"comments:{post_id}:{limit}:{depth}:{sort}:{expand_budget}"
+        tags = [f"post:{post_id}"]
+        if subreddit_name:
+            tags.append(subreddit_tag(subreddit_name))
 
         def _get_comments():
             submission = self.reddit.submission(id=post_id)
@@ -238,14 +565,12 @@ class EnhancedRedditClient(LoggerMixin):
             # Set comment sort
             submission.comment_sort = sort
 
-            # Handle more comments based on depth
-            if depth is not None:
-                submission.comments.replace_more(limit=depth)
-            else:
-                submission.comments.replace_more(limit=0)
+            # Expand the most valuable stubs in batches, then drop the rest
+            expanded = expand_more_comments(self.reddit, submission, expand_budget)
+            submission.comments.replace_more(limit=0)
 
             comment_data = []
-            comments_list = submission.comments.list()
+            comments_list = submission.comments.list() + expanded
 
             for comment in comments_list:
                 try:
@@ -253,26 +578,7 @@ class EnhancedRedditClient(LoggerMixin):
                         "[deleted]",
                         "[removed]",
                     ]:
-                        comment_dict = {
-                            "id": comment.id,
-                            "post_id": post_id,
-                            "parent_id": comment.parent_id,
-                            "author": (
-                                comment.author.name if comment.author else "[deleted]"
-                            ),
-                            "body": comment.body,
-                            "score": comment.score,
-                            "created_utc": datetime.fromtimestamp(
-                                comment.created_utc
-                            ).isoformat(),
-                            "is_deleted": comment.body in ["[deleted]", "[removed]"],
-                            "distinguished": comment.distinguished,
-                            "stickied": comment.stickied,
-                            "depth": comment.depth if hasattr(comment, "depth") else 0,
-                            "controversiality": comment.controversiality,
-                            "fetched_at": datetime.now().isoformat(),
-                        }
-                        comment_data.append(comment_dict)
+                        comment_data.append(self._comment_to_dict(comment, post_id))
 
                         if limit and len(comment_data) >= limit:
                             break
@@ -283,7 +589,9 @@ class EnhancedRedditClient(LoggerMixin):
             return comment_data
 
         if use_cache:
-            return await self._cached_request(cache_key, cache_ttl, _get_comments)
+            return await self._cached_request(
+                cache_key, cache_ttl, _get_comments, tags=tags
+            )
         else:
             await self.rate_limiter.wait_if_needed("reddit_api")
             async with self.circuit_breaker_context():
@@ -291,6 +599,50 @@ class EnhancedRedditClient(LoggerMixin):
                     None, _get_comments
                 )
 
+    async def get_info(
+        self, fullnames: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Look up posts (t3_), comments (t1_), subreddits (t5_) and users (t2_).
+
+        Lookups from all concurrent callers are batched into calls of up to
+        100 fullnames, so refreshing the scores of 10k stored posts costs
+        about 100 requests. Fullnames Reddit doesn't return map to None.
+        Results are not cached, since this is meant for refreshing.
+        """
+        return await self.info_batcher.load_many(fullnames)
+
+    async def _fetch_info_batch(self, fullnames: List[str]) -> Dict[str, Any]:
+        """Resolve one batch from the info batcher.
+
+        Users aren't served by /api/info, so t2_ fullnames go to
+        /api/user_data_by_account_ids in a second call.
+        """
+        user_ids = [name for name in fullnames if name.startswith("t2_")]
+        thing_ids = [name for name in fullnames if not name.startswith("t2_")]
+
+        def _get_things():
+            return {
+                thing.fullname: self._thing_to_dict(thing)
+                for thing in self.reddit.info(fullnames=thing_ids)
+            }
+
+        def _get_users():
+            return {
+                redditor.fullname: self._partial_redditor_to_dict(redditor)
+                for redditor in self.reddit.redditors.partial_redditors(user_ids)
+            }
+
+        results = {}
+        for ids, fetch in ((thing_ids, _get_things), (user_ids, _get_users)):
+            if not ids:
+                continue
+            await self.rate_limiter.wait_if_needed("reddit_api")
+            async with self.circuit_breaker_context():
+                results.update(
+                    await asyncio.get_event_loop().run_in_executor(None, fetch)
+                )
+        return results
+
     async def get_user_info(
         self, username: str, use_cache: bool = True, cache_ttl: int = 3600
     ) -> Dict[str, Any]:
@@ -313,7 +665,9 @@ class EnhancedRedditClient(LoggerMixin):
             }
 
         if use_cache:
-            return await self._cached_request(cache_key, cache_ttl, _get_user_info)
+            return await self._cached_request(
+                cache_key, cache_ttl, _get_user_info, tags=[f"user:{username}"]
+            )
         else:
             await self.rate_limiter.wait_if_needed("reddit_api")
             async with self.circuit_breaker_context():
@@ -321,6 +675,83 @@ class EnhancedRedditClient(LoggerMixin):
                     None, _get_user_info
                 )
 
+    @staticmethod
+    def _subreddit_to_dict(subreddit) -> Dict[str, Any]:
+        return {
+            "name": subreddit.display_name,
+            "display_name": subreddit.display_name_prefixed,
+            "description": subreddit.description,
+            "public_description": subreddit.public_description,
+            "subscribers": subreddit.subscribers,
+            "created_utc": datetime.fromtimestamp(subreddit.created_utc).isoformat(),
+            "is_nsfw": subreddit.over18,
+            "lang": subreddit.lang,
+            "submission_type": subreddit.submission_type,
+            "fetched_at": datetime.now().isoformat(),
+        }
+
+    @staticmethod
+    def _post_to_dict(post) -> Dict[str, Any]:
+        return {
+            "id": post.id,
+            "title": post.title,
+            "selftext": post.selftext,
+            "url": post.url,
+            "author": post.author.name if post.author else "[deleted]",
+            "subreddit": post.subreddit.display_name,
+            "score": post.score,
+            "upvote_ratio": post.upvote_ratio,
+            "num_comments": post.num_comments,
+            "created_utc": datetime.fromtimestamp(post.created_utc).isoformat(),
+            "is_self": post.is_self,
+            "is_nsfw": post.over_18,
+            "is_locked": post.locked,
+            "distinguished": post.distinguished,
+            "stickied": post.stickied,
+            "link_flair_text": post.link_flair_text,
+            "post_hint": getattr(post, "post_hint", None),
+            "fetched_at": datetime.now().isoformat(),
+        }
+
+    @staticmethod
+    def _comment_to_dict(comment, post_id: str) -> Dict[str, Any]:
+        return {
+            "id": comment.id,
+            "post_id": post_id,
+            "parent_id": comment.parent_id,
+            "author": comment.author.name if comment.author else "[deleted]",
+            "body": comment.body,
+            "score": comment.score,
+            "created_utc": datetime.fromtimestamp(comment.created_utc).isoformat(),
+            "is_deleted": comment.body in ["[deleted]", "[removed]"],
+            "distinguished": comment.distinguished,
+            "stickied": comment.stickied,
+            "depth": comment.depth if hasattr(comment, "depth") else 0,
+            "controversiality": comment.controversiality,
+            "fetched_at": datetime.now().isoformat(),
+        }
+
+    @staticmethod
+    def _partial_redditor_to_dict(redditor) -> Dict[str, Any]:
+        return {
+            "username": redditor.name,
+            "created_utc": datetime.fromtimestamp(redditor.created_utc).isoformat(),
+            "comment_karma": redditor.comment_karma,
+            "link_karma": redditor.link_karma,
+            "total_karma": redditor.comment_karma + redditor.link_karma,
+            "fetched_at": datetime.now().isoformat(),
+        }
+
+    def _thing_to_dict(self, thing) -> Dict[str, Any]:
+        if isinstance(thing, praw.models.Submission):
+            return self._post_to_dict(thing)
+        if isinstance(thing, praw.models.Comment):
+            # link_id is the parent post's fullname, e.g. t3_abc123
+            return self._comment_to_dict(thing, thing.link_id.split("_", 1)[-1])
+        if isinstance(thing, praw.models.Subreddit):
+            return self._subreddit_to_dict(thing)
+        raise ValueError(f"Unsupported info result: {thing.fullname}")
+
     async def stream_subreddit_posts(
         self,
         subreddit_name: str,
@@ -405,10 +836,13 @@ class EnhancedRedditClient(LoggerMixin):
                 # Get subreddit info
                 subreddit_info = await self.get_subreddit_info(subreddit_name)
 
-                # Get posts
-                posts = await self.get_subreddit_posts(
-                    subreddit_name, limit=posts_per_subreddit
-                )
+                # Get posts (copied, since cached listings may be shared)
+                posts = [
+                    dict(post)
+                    for post in await self.get_subreddit_posts(
+                        subreddit_name, limit=posts_per_subreddit
+                    )
+                ]
 
                 comments_collected = 0
                 if collect_comments:
@@ -417,7 +851,9 @@ class EnhancedRedditClient(LoggerMixin):
                     ]:  # Limit comment collection to first 10 posts
                         try:
                             post_comments = await self.get_post_comments(
-                                post["id"], limit=max_comments_per_post
+                                post["id"],
+                                limit=max_comments_per_post,
+                                subreddit_name=subreddit_name,
                             )
                             post["comments"] = post_comments
                             comments_collected += len(post_comments)
@@ -455,6 +891,7 @@ class EnhancedRedditClient(LoggerMixin):
             "rate_limiter_status": self.rate_limiter.get_status(),
             "request_queue_status": self.request_queue.get_status(),
             "cache_stats": self.cache.get_stats(),
+            "info_batcher": self.info_batcher.get_stats(),
             "circuit_breaker": self.circuit_breaker,
             "timestamp": datetime.now().isoformat(),
         }
@@ -0,0 +1,31 @@
+"""Page-at-a-time access to PRAW subreddit listings."""
+
+from typing import Any, List, Optional, Tuple
+
+LISTING_PAGE_SIZE = 100  # Reddit's maximum for listing endpoints
+LISTING_SORTS = ("hot", "new", "top", "rising")
+
+
+def fetch_listing_page(
+    subreddit: Any,
+    sort: str,
+    page_size: int = LISTING_PAGE_SIZE,
+    after: Optional[str] = None,
+    time_filter: str = "all",
+) -> Tuple[List[Any], Optional[str]]:
+    """Fetch one page of a listing with a single request.
+
+    Returns the submissions and the ``after`` fullname of the next page,
+    or None once the listing is exhausted.
+    """
+    if sort not in LISTING_SORTS:
+        raise ValueError(f"Invalid sort method: {sort}")
+
+    kwargs = {"limit": page_size, "params": {"after": after} if after else {}}
+    if sort == "top":
+        kwargs["time_filter"] = time_filter
+    submissions = list(getattr(subreddit, sort)(**kwargs))
+
+    # A short page means Reddit has nothing further
+    next_after = submissions[-1].fullname if len(submissions) == page_size else None
+    return submissions, next_after
@@ -1,11 +1,15 @@
 """Reddit API client using PRAW."""
 
 import praw
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
 
 from reddit_analyzer.config import get_config
+from reddit_analyzer.core.rate_limiter import RateLimiter, RateLimitConfig
 from reddit_analyzer.utils.logging import LoggerMixin
+from reddit_analyzer.services.collection_cursors import take_new_submissions
+from reddit_analyzer.services.comment_expansion import expand_more_comments
+from reddit_analyzer.services.listings import LISTING_PAGE_SIZE, fetch_listing_page
 
 config = get_config()
 
@@ -29,6 +33,10 @@ class RedditClient(LoggerMixin):
             password=config.REDDIT_PASSWORD,
         )
 
+        # Paces requests made outside PRAW's own listing pagination, such as
+        # author lookups, by the budget Reddit reports
+        self.rate_limiter = RateLimiter(RateLimitConfig(adaptive=True))
+
         # Test authentication
         try:
             # This will raise an exception if authentication fails
@@ -80,24 +88,7 @@ class RedditClient(LoggerMixin):
             else:
                 raise ValueError(f"Invalid sort method: {sort}")
 
-            post_data = []
-            for post in posts:
-                post_dict = {
-                    "id": post.id,
-                    "title": post.title,
-                    "selftext": post.selftext,
-                    "url": post.url,
-                    "author": post.author.name if post.author else "[deleted]",
-                    "subreddit": post.subreddit.display_name,
-                    "score": post.score,
-                    "upvote_ratio": post.upvote_ratio,
-                    "num_comments": post.num_comments,
-                    "created_utc": datetime.fromtimestamp(post.created_utc),
-                    "is_self": post.is_self,
-                    "is_nsfw": post.over_18,
-                    "is_locked": post.locked,
-                }
-                post_data.append(post_dict)
+            post_data = [self._post_to_dict(post) for post in posts]
 
             self.logger.info(f"Fetched {len(post_data)} posts from r/{subreddit_name}")
             return post_data
@@ -106,12 +97,96 @@ class RedditClient(LoggerMixin):
             self.logger.error(f"Error fetching posts from r/{subreddit_name}: {e}")
             raise
 
+    def iter_subreddit_posts(
+        self,
+        subreddit_name: str,
+        sort: str = "hot",
+        limit: int = 100,
+        time_filter: str = "all",
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield posts a page (up to 100) at a time, one request per page.
+
+        Unlike ``get_subreddit_posts`` the listing is never held in memory
+        as a whole, and callers can store each page before the next is
+        requested.
+        """
+        subreddit = self.reddit.subreddit(subreddit_name)
+        after = None
+        remaining = limit
+        while remaining > 0:
+            try:
+                submissions, after = fetch_listing_page(
+                    subreddit,
+                    sort,
+                    min(LISTING_PAGE_SIZE, remaining),
+                    after,
+                    time_filter,
+                )
+            except Exception as e:
+                self.logger.error(f"Error fetching posts from r/{subreddit_name}: {e}")
+                raise
+
+            remaining -= len(submissions)
+            if submissions:
+                yield [self._post_to_dict(post) for post in submissions]
+            if after is None:
+                break
+
+    def get_new_posts_since(
+        self,
+        subreddit_name: str,
+        newest_fullname: Optional[str] = None,
+        newest_created_utc: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Get posts newer than a collection cursor, newest first.
+
+        Pages through ``new`` only until reaching the cursor, so a quiet
+        subreddit costs one request. Without a cursor this is
+        ``get_subreddit_posts(sort="new")``.
+        """
+        try:
+            submissions = take_new_submissions(
+                self.reddit.subreddit(subreddit_name).new(limit=limit),
+                newest_fullname,
+                newest_created_utc,
+            )
+            post_data = [self._post_to_dict(post) for post in submissions]
+
+            self.logger.info(
+                f"Fetched {len(post_data)} new posts from r/{subreddit_name}"
+            )
+            return post_data
+
+        except Exception as e:
+            self.logger.error(f"Error fetching new posts from r/{subreddit_name}: {e}")
+            raise
+
+    @staticmethod
+    def _post_to_dict(post) -> Dict[str, Any]:
+        return {
+            "id": post.id,
+            "title": post.title,
+            "selftext": post.selftext,
+            "url": post.url,
+            "author": post.author.name if post.author else "[deleted]",
+            "subreddit": post.subreddit.display_name,
+            "score": post.score,
+            "upvote_ratio": post.upvote_ratio,
+            "num_comments": post.num_comments,
+            "created_utc": datetime.fromtimestamp(post.created_utc),
+            "is_self": post.is_self,
+            "is_nsfw": post.over_18,
+            "is_locked": post.locked,
+        }
+
     def get_post_comments(
         self,
         post_id: str,
         limit: int = 50,
         depth: int = 3,
         min_score: Optional[int] = None,
+        expand_budget: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get comments for a specific post with enhanced options.
 
@@ -120,6 +195,8 @@ class RedditClient(LoggerMixin):
             limit: Maximum number of comments to fetch
             depth: Maximum comment tree depth
             min_score: Minimum comment score to include
+            expand_budget: Requests to spend on "load more" stubs, up to 100
+                comments each (default: ``depth``)
 
         Returns:
             List of comment dictionaries with depth information
@@ -129,7 +206,15 @@ class RedditClient(LoggerMixin):
 
             # Configure comment extraction
             submission.comment_limit = limit
-            submission.comments.replace_more(limit=depth * 10)  # Expand based on depth
+            # Expand the most valuable stubs in batches, then drop the rest
+            expanded = expand_more_comments(
+                self.reddit,
+                submission,
+                depth if expand_budget is None else expand_budget,
+                max_depth=depth,
+                min_score=min_score,
+            )
+            submission.comments.replace_more(limit=0)
 
             comment_data = []
 
@@ -145,19 +230,9 @@ class RedditClient(LoggerMixin):
                 if min_score is not None and comment.score < min_score:
                     return
 
-                comment_dict = {
-                    "id": comment.id,
-                    "post_id": post_id,
-                    "parent_id": comment.parent_id,
-                    "author": (comment.author.name if comment.author else "[deleted]"),
-                    "body": comment.body,
-                    "score": comment.score,
-                    "created_utc": datetime.fromtimestamp(comment.created_utc),
-                    "edited": bool(comment.edited),
-                    "is_deleted": comment.body == "[deleted]",
-                    "depth": current_depth,
-                }
-                comment_data.append(comment_dict)
+                comment_data.append(
+                    self._comment_to_dict(comment, post_id, current_depth)
+                )
 
                 # Process replies
                 if hasattr(comment, "replies"):
@@ -172,6 +247,22 @@ class RedditClient(LoggerMixin):
                     break
                 process_comment(comment)
 
+            # Expanded comments arrive flat, parents first; keep those whose
+            # parent made it in, as the tree walk would have
+            included = {f"t1_{c['id']}" for c in comment_data}
+            included.add(submission.fullname)
+            for comment in expanded:
+                if len(comment_data) >= limit:
+                    break
+                if comment.parent_id not in included or comment.depth > depth:
+                    continue
+                if min_score is not None and comment.score < min_score:
+                    continue
+                comment_data.append(
+                    self._comment_to_dict(comment, post_id, comment.depth)
+                )
+                included.add(comment.fullname)
+
             self.logger.info(
                 f"Fetched {len(comment_data)} comments for post {post_id} "
                 f"(max depth: {max(c['depth'] for c in comment_data) if comment_data else 0})"
@@ -182,6 +273,21 @@ class RedditClient(LoggerMixin):
             self.logger.error(f"Error fetching comments for post {post_id}: {e}")
             raise
 
+    @staticmethod
+    def _comment_to_dict(comment, post_id: str, depth: int) -> Dict[str, Any]:
+        return {
+            "id": comment.id,
+            "post_id": post_id,
+            "parent_id": comment.parent_id,
+            "author": (comment.author.name if comment.author else "[deleted]"),
+            "body": comment.body,
+            "score": comment.score,
+            "created_utc": datetime.fromtimestamp(comment.created_utc),
+            "edited": bool(comment.edited),
+            "is_deleted": comment.body == "[deleted]",
+            "depth": depth,
+        }
+
     def get_all_comments(
         self, subreddit_name: str, limit: int = 1000, time_filter: str = "all"
     ) -> List[Dict[str, Any]]:
@@ -250,6 +356,22 @@ class RedditClient(LoggerMixin):
         except Exception as e:
             self.logger.error(f"Error fetching user info for {username}: {e}")
             raise
+        finally:
+            self._observe_rate_limits()
+
+    def _observe_rate_limits(self):
+        """Feed Reddit's reported budget back into the rate limiter."""
+        try:
+            limits = self.reddit.auth.limits
+        except Exception:
+            # PRAW has no limits until its first request completes
+            return
+        if isinstance(limits, dict):
+            self.rate_limiter.observe_limits(
+                limits.get("remaining"),
+                limits.get("reset_timestamp"),
+                limits.get("used"),
+            )
 
     def test_connection(self) -> bool:
         """Test Reddit API connection."""
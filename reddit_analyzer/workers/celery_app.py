@@ -18,6 +18,7 @@ celery_app.conf.update(
     # Task routing
     task_routes={
         "app.workers.tasks.collect_subreddit_posts": {"queue": "data_collection"},
+        "app.workers.tasks.collect_subreddits": {"queue": "data_collection"},
         "app.workers.tasks.collect_post_comments": {"queue": "data_collection"},
         "app.workers.tasks.collect_user_data": {"queue": "data_collection"},
         "app.workers.tasks.validate_collected_data": {"queue": "validation"},
@@ -6,21 +6,70 @@ from typing import Dict, List, Any
 import structlog
 
 from reddit_analyzer.workers.celery_app import celery_app
-from reddit_analyzer.services.enhanced_reddit_client import EnhancedRedditClient
+from reddit_analyzer.core.cache import get_sync_cache
+from reddit_analyzer.services.enhanced_reddit_client import (
+    EnhancedRedditClient,
+    subreddit_tag,
+)
 from reddit_analyzer.core.rate_limiter import RateLimitConfig
-from reddit_analyzer.database import get_db_session
-from reddit_analyzer.models import Post, Comment, User, Subreddit
+from reddit_analyzer.core.distributed_rate_limiter import (
+    DistributedRateLimiter,
+    RedisRateLimitStore,
+)
+from reddit_analyzer.config import get_settings
+from reddit_analyzer.database import dispose_async_engine, get_db_session
+from reddit_analyzer.models import Post, Comment, User
+from reddit_analyzer.services.collection_cursors import (
+    INCREMENTAL_SORTS,
+    advance_cursor,
+    get_cursor,
+)
+from reddit_analyzer.services.author_resolver import AuthorResolver
+from reddit_analyzer.services.collection_scheduler import (
+    CollectionScheduler,
+    fetch_author_profiles,
+    store_posts,
+)
 
 # Configure structured logging
 logger = structlog.get_logger(__name__)
 
 
 def get_reddit_client() -> EnhancedRedditClient:
-    """Get configured Reddit client instance."""
+    """Get configured Reddit client instance.
+
+    The rate limit is the budget for the whole worker fleet, shared through
+    Redis so concurrent workers do not each spend the full API quota.
+    """
     rate_config = RateLimitConfig(
-        requests_per_minute=60, burst_limit=10, backoff_factor=2.0, max_retries=3
+        requests_per_minute=60,
+        burst_limit=10,
+        backoff_factor=2.0,
+        max_retries=3,
+        adaptive=True,
+    )
+    rate_limiter = DistributedRateLimiter(
+        rate_config, RedisRateLimitStore(get_settings().REDIS_URL)
+    )
+    return EnhancedRedditClient(rate_config, rate_limiter=rate_limiter)
+
+
+def invalidate_subreddit_cache(subreddit_name: str) -> int:
+    """Drop cached listings and info for a subreddit after storing new posts.
+
+    Task code outside the event loop goes through the blocking
+    ``SyncRedisCache``; with the disk backend there is no shared cache to
+    clear.
+    """
+    if get_settings().CACHE_BACKEND.lower() != "redis":
+        return 0
+    deleted = get_sync_cache().invalidate_tags(subreddit_tag(subreddit_name))
+    logger.info(
+        "Invalidated cached subreddit entries",
+        subreddit=subreddit_name,
+        deleted=deleted,
     )
-    return EnhancedRedditClient(rate_config)
+    return deleted
 
 
 @celery_app.task(bind=True, max_retries=3)
@@ -53,6 +102,10 @@ def collect_subreddit_posts(
         sort_method = collection_config.get("sorting", "hot")
         time_filter = collection_config.get("time_filter", "all")
         collect_comments = collection_config.get("collect_comments", False)
+        # With sort "new", only fetch posts newer than the last run's newest
+        incremental = sort_method in INCREMENTAL_SORTS and collection_config.get(
+            "incremental", True
+        )
 
         # Update progress
         self.update_state(
@@ -73,15 +126,27 @@ def collect_subreddit_posts(
             loop.run_until_complete(client.start())
 
             # Collect posts
-            posts = loop.run_until_complete(
-                client.get_subreddit_posts(
-                    subreddit_name=subreddit_name,
-                    sort=sort_method,
-                    limit=limit,
-                    time_filter=time_filter,
-                    use_cache=False,  # Don't use cache for scheduled collections
+            if incremental:
+                with get_db_session() as db:
+                    cursor = get_cursor(db, subreddit_name, sort_method)
+                    since = (
+                        (cursor.newest_fullname, cursor.newest_created_utc)
+                        if cursor
+                        else (None, None)
+                    )
+                posts = loop.run_until_complete(
+                    client.get_new_posts_since(subreddit_name, *since, limit=limit)
+                )
+            else:
+                posts = loop.run_until_complete(
+                    client.get_subreddit_posts(
+                        subreddit_name=subreddit_name,
+                        sort=sort_method,
+                        limit=limit,
+                        time_filter=time_filter,
+                        use_cache=False,  # Don't use cache for scheduled collections
+                    )
                 )
-            )
 
             # Update progress
             self.update_state(
@@ -94,84 +159,26 @@ def collect_subreddit_posts(
                 },
             )
 
-            # Store posts to database
-            stored_count = 0
+            # Upsert the page in bulk; existing posts get fresh scores
             with get_db_session() as db:
-                for post_data in posts:
-                    try:
-                        # Check if post already exists
-                        existing_post = (
-                            db.query(Post)
-                            .filter(Post.reddit_id == post_data["id"])
-                            .first()
-                        )
-
-                        if not existing_post:
-                            # Get or create subreddit
-                            subreddit = (
-                                db.query(Subreddit)
-                                .filter(Subreddit.name == subreddit_name)
-                                .first()
-                            )
-
-                            if not subreddit:
-                                subreddit = Subreddit(
-                                    name=subreddit_name, display_name=subreddit_name
-                                )
-                                db.add(subreddit)
-                                db.flush()
-
-                            # Get or create user
-                            user = None
-                            if post_data["author"] != "[deleted]":
-                                user = (
-                                    db.query(User)
-                                    .filter(User.username == post_data["author"])
-                                    .first()
-                                )
-
-                                if not user:
-                                    user = User(username=post_data["author"])
-                                    db.add(user)
-                                    db.flush()
-
-                            # Create post
-                            post = Post(
-                                reddit_id=post_data["id"],
-                                title=post_data["title"],
-                                selftext=post_data["selftext"],
-                                url=post_data["url"],
-                                score=post_data["score"],
-                                upvote_ratio=post_data["upvote_ratio"],
-                                num_comments=post_data["num_comments"],
-                                created_utc=datetime.fromisoformat(
-                                    post_data["created_utc"].replace("Z", "+00:00")
-                                ),
-                                is_self=post_data["is_self"],
-                                is_nsfw=post_data["is_nsfw"],
-                                is_locked=post_data["is_locked"],
-                                subreddit_id=subreddit.id,
-                                user_id=user.id if user else None,
-                            )
-                            db.add(post)
-                            stored_count += 1
-
-                            # Schedule comment collection if requested
-                            if collect_comments:
-                                collect_post_comments.delay(
-                                    post_data["id"],
-                                    collection_config.get("comment_config", {}),
-                                )
-
-                    except Exception as e:
-                        logger.error(
-                            "Error storing post",
-                            post_id=post_data.get("id"),
-                            error=str(e),
-                        )
-                        continue
-
-                db.commit()
+                author_resolver = AuthorResolver(db)
+                pending = author_resolver.pending(post["author"] for post in posts)
+                author_resolver.record(
+                    *loop.run_until_complete(fetch_author_profiles(client, pending))
+                )
+                new_post_ids = store_posts(db, subreddit_name, posts, author_resolver)
+                if incremental:
+                    advance_cursor(db, subreddit_name, sort_method, posts)
+            stored_count = len(new_post_ids)
+            if new_post_ids:
+                invalidate_subreddit_cache(subreddit_name)
+
+            # Schedule comment collection if requested
+            if collect_comments:
+                for post_id in new_post_ids:
+                    collect_post_comments.delay(
+                        post_id, collection_config.get("comment_config", {})
+                    )
 
             # Update progress
             self.update_state(
@@ -225,6 +232,85 @@ def collect_subreddit_posts(
         }
 
 
+@celery_app.task(bind=True, max_retries=1)
+def collect_subreddits(
+    self, subreddit_names: List[str], collection_config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Collect posts from a watch-list of subreddits in a single task.
+
+    One client, event loop and rate limiter serve the whole list, instead
+    of one ``collect_subreddit_posts`` task per subreddit.
+    """
+    try:
+        logger.info(
+            "Starting multi-subreddit collection",
+            subreddits=len(subreddit_names),
+            task_id=self.request.id,
+            config=collection_config,
+        )
+
+        client = get_reddit_client()
+        scheduler = CollectionScheduler(
+            client,
+            max_concurrency=collection_config.get("max_concurrency", 8),
+            sort=collection_config.get("sorting", "new"),
+            post_limit=collection_config.get("post_limit", 100),
+            time_filter=collection_config.get("time_filter", "all"),
+        )
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(client.start())
+            summary = loop.run_until_complete(scheduler.run(subreddit_names))
+        finally:
+            loop.run_until_complete(client.stop())
+            loop.run_until_complete(dispose_async_engine())
+            loop.close()
+
+        for name, result in summary["subreddits"].items():
+            if result.get("new_post_ids"):
+                invalidate_subreddit_cache(name)
+
+        if collection_config.get("collect_comments", False):
+            for result in summary["subreddits"].values():
+                for post_id in result.get("new_post_ids", []):
+                    collect_post_comments.delay(
+                        post_id, collection_config.get("comment_config", {})
+                    )
+
+        result = {
+            "status": "success",
+            "subreddits": len(summary["subreddits"]),
+            "failed": summary["failed"],
+            "posts_collected": summary["total_posts_fetched"],
+            "posts_stored": summary["total_posts_stored"],
+            "posts_per_minute": summary["posts_per_minute"],
+            "collection_time": datetime.now().isoformat(),
+            "task_id": self.request.id,
+        }
+
+        logger.info("Multi-subreddit collection completed", result=result)
+        return result
+
+    except Exception as exc:
+        logger.error(
+            "Multi-subreddit collection failed",
+            error=str(exc),
+            task_id=self.request.id,
+        )
+
+        if self.request.retries < self.max_retries:
+            raise self.retry(countdown=60, exc=exc)
+
+        return {
+            "status": "failed",
+            "error": str(exc),
+            "task_id": self.request.id,
+        }
+
+
 @celery_app.task(bind=True, max_retries=3)
 def collect_post_comments(
     self, post_id: str, comment_config: Dict[str, Any]
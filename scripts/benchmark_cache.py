@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent cache reads: async RedisCache vs. the blocking client.
+
+Populates a set of keys shaped like cached subreddit listings, then issues
+the same number of concurrent ``get`` calls from coroutines through
+
+* ``SyncRedisCache`` - the blocking client the cache used to wrap, where
+  every call holds the event loop for a full round trip, and
+* ``RedisCache`` - the ``redis.asyncio`` backend with a shared pool.
+
+Requires a reachable Redis (``REDIS_URL``). Keys are written under a
+dedicated prefix and removed afterwards.
+
+Usage:
+    python scripts/benchmark_cache.py --keys 200 --concurrency 50 --rounds 5
+"""
+
+import argparse
+import asyncio
+import time
+
+from reddit_analyzer.core.cache import CacheConfig, RedisCache, SyncRedisCache
+
+
+def build_payload(index: int) -> list:
+    """Build a listing-sized payload for one key."""
+    return [
+        {
+            "id": f"p{index}_{n}",
+            "title": f"Benchmark post {n}",
+            "selftext": "lorem ipsum " * 20,
+            "score": n,
+            "num_comments": n * 2,
+        }
+        for n in range(25)
+    ]
+
+
+async def run_sync(cache: SyncRedisCache, keys: list, concurrency: int) -> float:
+    """Concurrent coroutines calling the blocking client."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(key):
+        async with semaphore:
+            return cache.get(key)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch(key) for key in keys))
+    return time.perf_counter() - start
+
+
+async def run_async(cache: RedisCache, keys: list, concurrency: int) -> float:
+    """Concurrent coroutines calling the non-blocking client."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(key):
+        async with semaphore:
+            return await cache.get(key)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch(key) for key in keys))
+    return time.perf_counter() - start
+
+
+async def main_async(args) -> None:
+    config = CacheConfig(
+        key_prefix="reddit_analyzer_bench", max_connections=args.concurrency
+    )
+    sync_cache = SyncRedisCache(config)
+    async_cache = RedisCache(config)
+
+    keys = [f"bench:{i}" for i in range(args.keys)]
+    sync_cache.set_many({key: build_payload(i) for i, key in enumerate(keys)})
+
+    try:
+        results = {"sync": [], "async": []}
+        for _ in range(args.rounds):
+            results["sync"].append(await run_sync(sync_cache, keys, args.concurrency))
+            results["async"].append(
+                await run_async(async_cache, keys, args.concurrency)
+            )
+
+        print(
+            f"{args.keys} keys x {args.rounds} rounds, concurrency {args.concurrency}"
+        )
+        for name, timings in results.items():
+            best = min(timings)
+            print(
+                f"  {name:>5}: best {best * 1000:8.1f} ms "
+                f"({args.keys / best:10.0f} gets/s)"
+            )
+        print(f"  speedup: {min(results['sync']) / min(results['async']):.2f}x")
+
+    finally:
+        sync_cache.flush_pattern("bench:*")
+        sync_cache.close()
+        await async_cache.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Micro-benchmark cache codecs on post listing and comment tree payloads.
+
+Reports encode/decode time and bytes-on-wire for every installed
+serializer/compressor pair. Payloads are read from a collected SQLite
+database (``scripts/collect_test_data.py`` writes one to
+``tests/fixtures/test_data.db``); synthetic payloads of the same shape are
+used when no database is available.
+
+Usage:
+    python scripts/benchmark_cache_codecs.py --db tests/fixtures/test_data.db
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import string
+import timeit
+from datetime import datetime, timedelta
+
+from reddit_analyzer.core.cache import (
+    COMPRESSORS,
+    SERIALIZERS,
+    encode_value,
+    decode_value,
+)
+
+DEFAULT_DB = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "test_data.db"
+)
+
+
+def load_payloads(db_path: str, limit: int) -> dict:
+    """Load a post listing and a comment tree from a collected database."""
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    try:
+        posts = [
+            dict(row)
+            for row in connection.execute(
+                "SELECT id, title, selftext, url, score, upvote_ratio, "
+                "num_comments, created_utc, is_self, is_nsfw, is_locked "
+                "FROM posts ORDER BY created_utc DESC LIMIT ?",
+                (limit,),
+            )
+        ]
+        busiest = connection.execute(
+            "SELECT post_id FROM comments GROUP BY post_id "
+            "ORDER BY COUNT(*) DESC LIMIT 1"
+        ).fetchone()
+        comments = (
+            [
+                dict(row)
+                for row in connection.execute(
+                    "SELECT id, post_id, parent_id, body, score, created_utc, "
+                    "is_deleted FROM comments WHERE post_id = ?",
+                    (busiest["post_id"],),
+                )
+            ]
+            if busiest
+            else []
+        )
+    finally:
+        connection.close()
+
+    return {"post listing": posts, "comment tree": comments}
+
+
+def synthetic_payloads(limit: int) -> dict:
+    """Build payloads shaped like EnhancedRedditClient results."""
+    rng = random.Random(42)
+    now = datetime.now()
+
+    def words(count):
+        return " ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+            for _ in range(count)
+        )
+
+    posts = [
+        {
+            "id": f"t{i:05d}",
+            "title": words(rng.randint(5, 15)),
+            "selftext": words(rng.randint(0, 120)),
+            "url": f"https://www.reddit.com/r/python/comments/t{i:05d}/",
+            "author": f"user_{rng.randint(1, 500)}",
+            "subreddit": "python",
+            "score": rng.randint(0, 5000),
+            "upvote_ratio": round(rng.random(), 2),
+            "num_comments": rng.randint(0, 800),
+            "created_utc": (now - timedelta(minutes=i * 7)).isoformat(),
+            "is_self": True,
+            "is_nsfw": False,
+            "is_locked": False,
+            "distinguished": None,
+            "stickied": False,
+            "link_flair_text": None,
+            "post_hint": None,
+            "fetched_at": now.isoformat(),
+        }
+        for i in range(limit)
+    ]
+    comments = [
+        {
+            "id": f"c{i:06d}",
+            "post_id": "t00000",
+            "parent_id": f"t1_c{rng.randint(0, max(i - 1, 0)):06d}",
+            "author": f"user_{rng.randint(1, 500)}",
+            "body": words(rng.randint(3, 80)),
+            "score": rng.randint(-20, 900),
+            "created_utc": (now - timedelta(seconds=i * 30)).isoformat(),
+            "is_deleted": False,
+            "depth": rng.randint(0, 6),
+            "controversiality": 0,
+            "fetched_at": now.isoformat(),
+        }
+        for i in range(limit * 5)
+    ]
+    return {"post listing": posts, "comment tree": comments}
+
+
+def benchmark(payload, serializer: str, compressor: str, number: int) -> tuple:
+    encoded = encode_value(payload, serializer, compressor, compress_threshold=1024)
+    encode_time = timeit.timeit(
+        lambda: encode_value(payload, serializer, compressor, compress_threshold=1024),
+        number=number,
+    )
+    decode_time = timeit.timeit(lambda: decode_value(encoded), number=number)
+    return len(encoded), encode_time / number, decode_time / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=DEFAULT_DB, help="Collected SQLite database")
+    parser.add_argument("--limit", type=int, default=100, help="Posts per listing")
+    parser.add_argument("--number", type=int, default=200, help="Iterations")
+    args = parser.parse_args()
+
+    if os.path.exists(args.db):
+        payloads = load_payloads(args.db, args.limit)
+        source = args.db
+    else:
+        payloads = synthetic_payloads(args.limit)
+        source = "synthetic"
+
+    print(f"Payload source: {source}")
+    for name, payload in payloads.items():
+        if not payload:
+            continue
+        print(f"\n{name} ({len(payload)} items)")
+        print(f"{'codec':<18}{'bytes':>10}{'encode us':>12}{'decode us':>12}")
+        for serializer in SERIALIZERS:
+            for compressor in COMPRESSORS:
+                size, encode_s, decode_s = benchmark(
+                    payload, serializer, compressor, args.number
+                )
+                print(
+                    f"{serializer + '+' + compressor:<18}{size:>10}"
+                    f"{encode_s * 1e6:>12.1f}{decode_s * 1e6:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
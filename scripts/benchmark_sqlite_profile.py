@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Benchmark SQLite ingest and read throughput with and without the pragma profile.
+
+Creates a fresh database file for each mode and
+
+* ingests synthetic posts through ``BulkWriter`` a page at a time,
+  committing after every page the way ``data collect`` does,
+* replays the hot read shapes (a subreddit's newest posts, per-subreddit
+  score aggregates) on their own, and
+* runs the same reads from background threads while a second ingest
+  writes, counting reads that failed on a locked database.
+
+"default" is SQLite's rollback journal with ``synchronous=FULL``;
+"profile" applies ``sqlite_performance_pragmas`` (WAL, NORMAL, page
+cache, mmap, in-memory temp store, busy timeout).
+
+Usage:
+    python scripts/benchmark_sqlite_profile.py --posts 20000 --readers 4
+"""
+
+import argparse
+import os
+import random
+import string
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from reddit_analyzer.database import Base, create_db_engine
+from reddit_analyzer.models import Post, Subreddit
+from reddit_analyzer.services.bulk_writer import BulkWriter
+
+SUBREDDITS = ["python", "datascience", "machinelearning", "programming"]
+
+
+def synthetic_pages(count: int, page_size: int, offset: int = 0):
+    """Yield pages of post dicts shaped like RedditClient results."""
+    rng = random.Random(42 + offset)
+    now = datetime.now()
+
+    def words(n):
+        return " ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+            for _ in range(n)
+        )
+
+    page = []
+    for i in range(offset, offset + count):
+        page.append(
+            {
+                "id": f"t{i:07d}",
+                "title": words(rng.randint(5, 15)),
+                "selftext": words(rng.randint(0, 120)),
+                "url": f"https://www.reddit.com/comments/t{i:07d}/",
+                "author": None,
+                "score": rng.randint(0, 5000),
+                "upvote_ratio": round(rng.random(), 2),
+                "num_comments": rng.randint(0, 800),
+                "created_utc": now - timedelta(minutes=i),
+                "is_self": True,
+                "is_nsfw": False,
+                "is_locked": False,
+            }
+        )
+        if len(page) == page_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def ingest(Session, subreddit_ids, count, page_size, offset=0) -> float:
+    """Upsert ``count`` posts page by page; return rows per second."""
+    started = time.perf_counter()
+    for number, page in enumerate(synthetic_pages(count, page_size, offset)):
+        with Session() as db:
+            BulkWriter(db).upsert_posts(
+                page, subreddit_ids[number % len(subreddit_ids)]
+            )
+            db.commit()
+    return count / (time.perf_counter() - started)
+
+
+def read_once(Session, subreddit_id) -> None:
+    with Session() as db:
+        db.query(Post).filter(Post.subreddit_id == subreddit_id).order_by(
+            Post.created_utc.desc()
+        ).limit(100).all()
+        db.query(Post.subreddit_id, func.count(Post.id), func.avg(Post.score)).group_by(
+            Post.subreddit_id
+        ).all()
+
+
+def run(path: str, profile: bool, args) -> dict:
+    engine = create_db_engine(f"sqlite:///{path}", sqlite_profile=profile)
+    Session = sessionmaker(bind=engine)
+    Base.metadata.create_all(engine)
+    with Session() as db:
+        subreddits = [Subreddit(name=name, display_name=name) for name in SUBREDDITS]
+        db.add_all(subreddits)
+        db.commit()
+        subreddit_ids = [subreddit.id for subreddit in subreddits]
+    with engine.connect() as conn:
+        journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+
+    ingest_rate = ingest(Session, subreddit_ids, args.posts, args.page_size)
+
+    started = time.perf_counter()
+    for i in range(args.reads):
+        read_once(Session, subreddit_ids[i % len(subreddit_ids)])
+    read_rate = args.reads / (time.perf_counter() - started)
+
+    # Reads competing with a concurrent collection
+    stop = threading.Event()
+    counts = {"reads": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def reader(index):
+        while not stop.is_set():
+            try:
+                read_once(Session, subreddit_ids[index % len(subreddit_ids)])
+                key = "reads"
+            except OperationalError:
+                key = "locked"
+            with lock:
+                counts[key] += 1
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    contended_ingest = ingest(
+        Session, subreddit_ids, args.posts // 2, args.page_size, offset=args.posts
+    )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    return {
+        "journal": journal_mode,
+        "ingest": ingest_rate,
+        "reads": read_rate,
+        "contended ingest": contended_ingest,
+        "contended reads": counts["reads"] / elapsed,
+        "locked": counts["locked"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=20000, help="Posts to ingest")
+    parser.add_argument("--page-size", type=int, default=100, help="Posts per commit")
+    parser.add_argument("--reads", type=int, default=500, help="Read iterations")
+    parser.add_argument(
+        "--readers", type=int, default=4, help="Reader threads during ingest"
+    )
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for mode, profile in (("default", False), ("profile", True)):
+            results[mode] = run(os.path.join(directory, f"{mode}.db"), profile, args)
+
+    print(
+        f"{'mode':<10}{'journal':>9}{'ingest rows/s':>15}{'reads/s':>10}"
+        f"{'contended rows/s':>18}{'contended reads/s':>19}{'locked':>8}"
+    )
+    for mode, result in results.items():
+        print(
+            f"{mode:<10}{result['journal']:>9}{result['ingest']:>15.0f}"
+            f"{result['reads']:>10.0f}{result['contended ingest']:>18.0f}"
+            f"{result['contended reads']:>19.0f}{result['locked']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,15 @@
 import os
 import glob
 import pytest
+import pytest_asyncio
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 # Import all models first to ensure they're registered with Base
 from reddit_analyzer.models import Base
+from reddit_analyzer.database import create_async_db_engine
 
 # Import fixtures from fixtures directory
 
@@ -68,6 +71,22 @@ def db_session(test_db):
     return test_db
 
 
+@pytest_asyncio.fixture
+async def async_session_factory(tmp_path):
+    """Async session factory over a fresh aiosqlite database file.
+
+    A file rather than ``:memory:`` so concurrent sessions get their own
+    connections, as they would in production.
+    """
+    engine = create_async_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    try:
+        yield async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
 def pytest_sessionfinish(session, exitstatus):
     """Clean up coverage files after test session completes."""
     # Get the root directory of the project
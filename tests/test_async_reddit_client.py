@@ -0,0 +1,267 @@
+"""Tests for the aiohttp Reddit client against a local stub server."""
+
+import pytest
+import pytest_asyncio
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from reddit_analyzer.core.rate_limiter import RateLimiter, RateLimitConfig  # noqa: E402
+from reddit_analyzer.services.async_reddit_client import (  # noqa: E402
+    AsyncRedditHTTPClient,
+)
+
+
+def _post(post_id, **overrides):
+    data = {
+        "id": post_id,
+        "title": f"Post {post_id}",
+        "selftext": "",
+        "url": f"https://reddit.com/{post_id}",
+        "author": "alice",
+        "subreddit": "python",
+        "score": 10,
+        "upvote_ratio": 0.9,
+        "num_comments": 2,
+        "created_utc": 1640995200,
+        "is_self": True,
+        "over_18": False,
+        "locked": False,
+        "distinguished": None,
+        "stickied": False,
+        "link_flair_text": None,
+    }
+    data.update(overrides)
+    return {"kind": "t3", "data": data}
+
+
+def _comment(comment_id, parent_id, depth, replies=None, body="text"):
+    return {
+        "kind": "t1",
+        "data": {
+            "id": comment_id,
+            "parent_id": parent_id,
+            "author": "bob",
+            "body": body,
+            "score": 1,
+            "created_utc": 1640995200,
+            "distinguished": None,
+            "stickied": False,
+            "depth": depth,
+            "controversiality": 0,
+            "replies": (
+                {"kind": "Listing", "data": {"children": replies}} if replies else ""
+            ),
+        },
+    }
+
+
+class StubReddit:
+    """Minimal stand-in for Reddit's OAuth and API hosts."""
+
+    def __init__(self):
+        self.token_requests = 0
+        self.reject_next_token = False
+        self.requests = []
+        self.client_ports = set()
+        self.posts = [_post(f"p{i}", score=i) for i in range(250)]
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/api/v1/access_token", self.access_token)
+        app.router.add_get("/r/{name}/about", self.subreddit_about)
+        app.router.add_get("/r/{name}/{sort}", self.listing)
+        app.router.add_get("/comments/{post_id}", self.comments)
+        app.router.add_get("/user/{name}/about", self.user_about)
+        app.middlewares.append(self.record)
+        return app
+
+    @web.middleware
+    async def record(self, request, handler):
+        self.client_ports.add(request.transport.get_extra_info("peername")[1])
+        if request.path != "/api/v1/access_token":
+            self.requests.append(request)
+            expected = f"bearer token-{self.token_requests}"
+            if request.headers.get("Authorization") != expected:
+                return web.json_response({"error": 401}, status=401)
+            if self.reject_next_token:
+                self.reject_next_token = False
+                return web.json_response({"error": 401}, status=401)
+        return await handler(request)
+
+    async def access_token(self, request):
+        self.token_requests += 1
+        form = await request.post()
+        assert form["grant_type"] == "password"
+        return web.json_response(
+            {"access_token": f"token-{self.token_requests}", "expires_in": 3600}
+        )
+
+    async def subreddit_about(self, request):
+        return web.json_response(
+            {
+                "kind": "t5",
+                "data": {
+                    "display_name": request.match_info["name"],
+                    "display_name_prefixed": f"r/{request.match_info['name']}",
+                    "subscribers": 1000,
+                    "created_utc": 1640995200,
+                    "over18": False,
+                },
+            },
+            headers={
+                "X-Ratelimit-Remaining": "595.0",
+                "X-Ratelimit-Reset": "300",
+                "X-Ratelimit-Used": "5",
+            },
+        )
+
+    async def listing(self, request):
+        limit = int(request.query["limit"])
+        start = 0
+        if "after" in request.query:
+            start = int(request.query["after"].removeprefix("t3_p")) + 1
+        children = self.posts[start : start + limit]
+        after = f"t3_{children[-1]['data']['id']}" if children else None
+        if start + limit >= len(self.posts):
+            after = None
+        return web.json_response(
+            {"kind": "Listing", "data": {"children": children, "after": after}}
+        )
+
+    async def comments(self, request):
+        post_id = request.match_info["post_id"]
+        tree = [
+            _comment(
+                "c1",
+                f"t3_{post_id}",
+                0,
+                replies=[
+                    _comment("c3", "t1_c1", 1),
+                    {"kind": "more", "data": {"children": ["c9"]}},
+                ],
+            ),
+            _comment("c2", f"t3_{post_id}", 0, body="[deleted]"),
+        ]
+        return web.json_response(
+            [
+                {"kind": "Listing", "data": {"children": [_post(post_id)]}},
+                {"kind": "Listing", "data": {"children": tree}},
+            ]
+        )
+
+    async def user_about(self, request):
+        return web.json_response(
+            {
+                "kind": "t2",
+                "data": {
+                    "name": request.match_info["name"],
+                    "created_utc": 1640995200,
+                    "comment_karma": 5,
+                    "link_karma": 7,
+                },
+            }
+        )
+
+
+class TestAsyncRedditHTTPClient:
+    """Test the aiohttp transport end to end."""
+
+    @pytest_asyncio.fixture
+    async def stub(self):
+        stub = StubReddit()
+        runner = web.AppRunner(stub.app())
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        stub.url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        yield stub
+        await runner.cleanup()
+
+    @pytest_asyncio.fixture
+    async def client(self, stub):
+        client = AsyncRedditHTTPClient(
+            client_id="test_id",
+            client_secret="test_secret",
+            user_agent="test_agent",
+            username="test_user",
+            password="test_pass",
+            rate_limiter=RateLimiter(
+                RateLimitConfig(requests_per_minute=6000, burst_limit=1000)
+            ),
+            oauth_url=stub.url,
+            auth_url=stub.url,
+        )
+        yield client
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_subreddit_info(self, client, stub):
+        """Subreddit info parses into the PRAW client's shape."""
+        result = await client.get_subreddit_info("python")
+
+        assert result["name"] == "python"
+        assert result["display_name"] == "r/python"
+        assert result["subscribers"] == 1000
+        assert result["is_nsfw"] is False
+        assert stub.requests[0].query["raw_json"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_are_observed(self, client):
+        """X-Ratelimit headers update the limiter's view of the budget."""
+        await client.get_subreddit_info("python")
+
+        assert client.rate_limiter.observed_remaining == 595.0
+
+    @pytest.mark.asyncio
+    async def test_posts_are_paginated(self, client, stub):
+        """Listings are fetched 100 at a time and follow the after cursor."""
+        posts = await client.get_subreddit_posts("python", sort="new", limit=250)
+
+        assert [post["id"] for post in posts] == [f"p{i}" for i in range(250)]
+        assert [request.query["limit"] for request in stub.requests] == [
+            "100",
+            "100",
+            "50",
+        ]
+        assert posts[0]["author"] == "alice"
+        assert posts[0]["subreddit"] == "python"
+        assert posts[5]["score"] == 5
+
+    @pytest.mark.asyncio
+    async def test_comments_are_flattened(self, client):
+        """Comment trees flatten breadth-first, skipping deleted and more stubs."""
+        comments = await client.get_post_comments("abc123")
+
+        assert [comment["id"] for comment in comments] == ["c1", "c3"]
+        assert comments[1]["parent_id"] == "t1_c1"
+        assert comments[1]["depth"] == 1
+        assert all(comment["post_id"] == "abc123" for comment in comments)
+
+    @pytest.mark.asyncio
+    async def test_get_user_info(self, client):
+        """User info includes total karma."""
+        result = await client.get_user_info("spez")
+
+        assert result["username"] == "spez"
+        assert result["total_karma"] == 12
+
+    @pytest.mark.asyncio
+    async def test_token_and_connection_are_reused(self, client, stub):
+        """One token and one keep-alive connection serve sequential calls."""
+        for _ in range(5):
+            await client.get_user_info("spez")
+
+        assert stub.token_requests == 1
+        assert len(stub.client_ports) == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_is_refreshed(self, client, stub):
+        """A 401 triggers one token refresh and a retry."""
+        await client.get_user_info("spez")
+        stub.reject_next_token = True
+
+        result = await client.get_user_info("spez")
+
+        assert result["username"] == "spez"
+        assert stub.token_requests == 2
@@ -0,0 +1,101 @@
+"""Tests for batched author resolution."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from reddit_analyzer.models import AuthorLookupFailure, User
+from reddit_analyzer.services.author_resolver import AuthorResolver
+
+
+def _profile(username):
+    return {
+        "username": username,
+        "created_utc": datetime(2020, 1, 1),
+        "comment_karma": 10,
+        "link_karma": 5,
+        "is_verified": False,
+    }
+
+
+class TestAuthorResolver:
+    """Test resolving a batch of author names to users."""
+
+    def test_existing_users_need_no_fetch(self, db_session):
+        """Stored users are loaded without touching the API."""
+        db_session.add_all([User(username="alice"), User(username="bob")])
+        db_session.commit()
+        fetch_user = Mock(side_effect=_profile)
+
+        authors = AuthorResolver(db_session, fetch_user).resolve(
+            ["alice", "bob", "alice", "[deleted]", None]
+        )
+
+        assert set(authors) == {"alice", "bob"}
+        assert authors["alice"].username == "alice"
+        fetch_user.assert_not_called()
+
+    def test_missing_users_fetched_serially_under_rate_limit(self, db_session):
+        """Profiles are fetched one at a time, each after a limiter slot."""
+        calls = []
+        rate_limiter = Mock()
+        rate_limiter.reserve.side_effect = lambda endpoint: calls.append("slot") or 0
+
+        def fetch_user(name):
+            calls.append(threading.get_ident())
+            return _profile(name)
+
+        resolver = AuthorResolver(db_session, fetch_user, rate_limiter)
+        authors = resolver.resolve([f"user{i}" for i in range(4)])
+        db_session.commit()
+
+        # PRAW instances are not thread-safe, so no worker threads
+        assert calls == ["slot", threading.get_ident()] * 4
+        assert all(user is not None for user in authors.values())
+        assert db_session.query(User).count() == 4
+        assert resolver.stats["fetched"] == 4
+
+    def test_failed_lookups_are_negatively_cached(self, db_session):
+        """A suspended account isn't retried until the TTL passes."""
+        fetch_user = Mock(side_effect=Exception("403 Forbidden"))
+
+        authors = AuthorResolver(db_session, fetch_user).resolve(["suspended"])
+        db_session.commit()
+        assert authors == {"suspended": None}
+
+        # A later run skips the account
+        AuthorResolver(db_session, fetch_user).resolve(["suspended"])
+        assert fetch_user.call_count == 1
+
+        # Once the entry expires it is tried again
+        failure = db_session.get(AuthorLookupFailure, "suspended")
+        failure.failed_at = datetime.utcnow() - timedelta(days=30)
+        db_session.commit()
+        AuthorResolver(db_session, fetch_user, negative_ttl=3600).resolve(["suspended"])
+
+        assert fetch_user.call_count == 2
+        assert db_session.get(AuthorLookupFailure, "suspended").attempts == 2
+
+    def test_fetches_wait_for_rate_limit_slots(self, db_session, monkeypatch):
+        """The delay handed out by the limiter is slept before each fetch."""
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        rate_limiter = Mock()
+        rate_limiter.reserve.side_effect = [0.0, 0.5, 1.0]
+
+        AuthorResolver(
+            db_session, Mock(side_effect=_profile), rate_limiter=rate_limiter
+        ).resolve(["a", "b", "c"])
+
+        assert rate_limiter.reserve.call_count == 3
+        assert sleeps == [0.5, 1.0]
+
+    def test_without_fetch_creates_bare_users(self, db_session):
+        """With no fetcher, unknown names become users without profiles."""
+        resolver = AuthorResolver(db_session)
+
+        authors = resolver.resolve(["new_user"])
+
+        assert authors["new_user"].username == "new_user"
+        assert authors["new_user"].comment_karma == 0
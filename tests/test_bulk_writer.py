@@ -0,0 +1,147 @@
+"""Tests for set-based upserts of collected data."""
+
+from datetime import datetime
+
+import pytest
+
+from reddit_analyzer.models import Comment, Post, Subreddit, User
+from reddit_analyzer.services.bulk_writer import BulkWriter, UpsertResult
+
+
+def _post(post_id, score=10, **overrides):
+    post = {
+        "id": post_id,
+        "title": f"Post {post_id}",
+        "selftext": "body",
+        "url": f"https://reddit.com/{post_id}",
+        "author": "alice",
+        "score": score,
+        "upvote_ratio": 0.9,
+        "num_comments": 3,
+        "created_utc": datetime(2024, 1, 1),
+        "is_self": True,
+        "is_nsfw": False,
+        "is_locked": False,
+    }
+    post.update(overrides)
+    return post
+
+
+def _comment(comment_id, post_id="p1", parent_id=None, score=1):
+    return {
+        "id": comment_id,
+        "post_id": post_id,
+        "parent_id": parent_id or f"t3_{post_id}",
+        "author": "alice",
+        "body": f"Comment {comment_id}",
+        "score": score,
+        "created_utc": "2024-01-01T12:00:00Z",
+    }
+
+
+@pytest.fixture
+def subreddit(db_session):
+    subreddit = Subreddit(name="python", display_name="Python")
+    db_session.add(subreddit)
+    db_session.commit()
+    return subreddit
+
+
+class TestBulkWriter:
+    """Test inserting and refreshing pages of collected rows."""
+
+    def test_upsert_posts_counts_inserts_and_updates(self, db_session, subreddit):
+        """A second page with overlapping ids reports the overlap as updates."""
+        writer = BulkWriter(db_session)
+
+        first = writer.upsert_posts([_post("p1"), _post("p2")], subreddit.id)
+        second = writer.upsert_posts([_post("p2"), _post("p3")], subreddit.id)
+        db_session.commit()
+
+        assert (first.inserted, first.updated) == (2, 0)
+        assert (second.inserted, second.updated) == (1, 1)
+        assert second.inserted_ids == ["p3"]
+        assert db_session.query(Post).count() == 3
+
+    def test_existing_posts_get_mutable_fields_refreshed(self, db_session, subreddit):
+        """Scores change on re-collection; the title stays as first stored."""
+        writer = BulkWriter(db_session)
+        writer.upsert_posts([_post("p1", score=10)], subreddit.id)
+        writer.upsert_posts(
+            [_post("p1", score=250, num_comments=40, title="Edited")], subreddit.id
+        )
+        db_session.commit()
+
+        post = db_session.get(Post, "p1")
+        db_session.refresh(post)
+        assert post.score == 250
+        assert post.num_comments == 40
+        assert post.title == "Post p1"
+
+    def test_upsert_posts_links_authors(self, db_session, subreddit):
+        """Author names map to ids; unknown authors are left empty."""
+        user = User(username="alice")
+        db_session.add(user)
+        db_session.commit()
+
+        BulkWriter(db_session).upsert_posts(
+            [_post("p1"), _post("p2", author="[deleted]")],
+            subreddit.id,
+            {"alice": user.id},
+        )
+        db_session.commit()
+
+        assert db_session.get(Post, "p1").author_id == user.id
+        assert db_session.get(Post, "p2").author_id is None
+
+    def test_upsert_comments(self, db_session, subreddit):
+        """Top-level comments lose their post parent; bodies are refreshed."""
+        writer = BulkWriter(db_session)
+        writer.upsert_posts([_post("p1")], subreddit.id)
+        writer.upsert_comments([_comment("c1"), _comment("c2", parent_id="t1_c1")])
+        result = writer.upsert_comments([{**_comment("c1"), "body": "[removed]"}])
+        db_session.commit()
+
+        assert (result.inserted, result.updated) == (0, 1)
+        c1 = db_session.get(Comment, "c1")
+        db_session.refresh(c1)
+        assert c1.parent_id is None
+        assert c1.body == "[removed]"
+        assert db_session.get(Comment, "c2").parent_id == "t1_c1"
+
+    def test_upsert_users_keeps_profile_without_new_fields(self, db_session):
+        """Name-only rows don't wipe karma fetched earlier."""
+        writer = BulkWriter(db_session)
+        writer.upsert_users(
+            [{"username": "alice", "comment_karma": 10, "link_karma": 5}]
+        )
+        result = writer.upsert_users(
+            [{"username": "alice"}, {"username": "bob", "link_karma": 7}]
+        )
+        db_session.commit()
+
+        assert (result.inserted, result.updated) == (1, 1)
+        ids = writer.user_ids(["alice", "bob"])
+        alice = db_session.get(User, ids["alice"])
+        assert alice.comment_karma == 10
+        assert db_session.get(User, ids["bob"]).link_karma == 7
+
+    def test_large_pages_are_chunked(self, db_session, subreddit):
+        """Pages larger than one statement's parameter limit still land."""
+        posts = [_post(f"p{i}") for i in range(500)]
+
+        result = BulkWriter(db_session).upsert_posts(posts, subreddit.id)
+        db_session.commit()
+
+        assert result.inserted == 500
+        assert db_session.query(Post).count() == 500
+
+    def test_result_throughput(self):
+        """Results add up and report rows per second."""
+        total = UpsertResult(inserted=3, updated=1, seconds=2.0)
+        total += UpsertResult(inserted=1, updated=3, seconds=2.0, inserted_ids=["x"])
+
+        assert total.rows == 8
+        assert total.rows_per_second == 2.0
+        assert total.inserted_ids == ["x"]
+        assert UpsertResult().rows_per_second == 0.0
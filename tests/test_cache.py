@@ -1,8 +1,47 @@
 """Tests for Redis cache functionality."""
 
 import pytest
-from unittest.mock import Mock, patch
-from reddit_analyzer.core.cache import RedisCache, CacheConfig
+import redis
+from unittest.mock import AsyncMock, Mock, patch
+from reddit_analyzer.core.cache import (
+    RedisCache,
+    SyncRedisCache,
+    CacheConfig,
+    LocalCache,
+    SERIALIZERS,
+    COMPRESSORS,
+    CODEC_TAG_BASE,
+    encode_value,
+    decode_value,
+)
+
+
+def _mock_async_client():
+    """Create a Redis client mock whose commands are awaitable."""
+    client = Mock()
+    for command in (
+        "get",
+        "set",
+        "delete",
+        "exists",
+        "ttl",
+        "expire",
+        "incrby",
+        "mget",
+        "unlink",
+    ):
+        setattr(client, command, AsyncMock())
+    return client
+
+
+def _async_iter(items):
+    """Stand in for redis.asyncio's scan_iter/sscan_iter generators."""
+
+    async def _iterate(*args, **kwargs):
+        for item in items:
+            yield item
+
+    return Mock(side_effect=_iterate)
 
 
 class TestRedisCache:
@@ -11,10 +50,13 @@ class TestRedisCache:
     @pytest.fixture
     def mock_redis(self):
         """Create a mock Redis client."""
-        with patch("app.core.cache.redis.from_url") as mock_redis_client:
-            mock_client = Mock()
-            mock_redis_client.return_value = mock_client
-            mock_client.ping.return_value = True
+        with (
+            patch("reddit_analyzer.core.cache.aioredis.from_url") as mock_async,
+            patch("reddit_analyzer.core.cache.redis.from_url") as mock_sync,
+        ):
+            mock_client = _mock_async_client()
+            mock_async.return_value = mock_client
+            mock_sync.return_value = mock_client
             yield mock_client
 
     @pytest.fixture
@@ -30,8 +72,8 @@ class TestRedisCache:
     @pytest.fixture
     def redis_cache(self, mock_redis, cache_config):
         """Create Redis cache instance for testing."""
-        with patch("app.core.cache.get_settings") as mock_settings:
-            mock_settings.return_value.redis_url = "redis://localhost:6379/1"
+        with patch("reddit_analyzer.core.cache.get_settings") as mock_settings:
+            mock_settings.return_value.REDIS_URL = "redis://localhost:6379/1"
             cache = RedisCache(cache_config)
             return cache
 
@@ -107,7 +149,7 @@ class TestRedisCache:
     async def test_cache_set_many(self, redis_cache, mock_redis):
         """Test batch set operation."""
         mock_pipeline = Mock()
-        mock_pipeline.execute.return_value = [True, True, True]
+        mock_pipeline.execute = AsyncMock(return_value=[True, True, True])
         mock_redis.pipeline.return_value = mock_pipeline
 
         mapping = {"key1": {"data": 1}, "key2": {"data": 2}, "key3": {"data": 3}}
@@ -118,11 +160,96 @@ class TestRedisCache:
     @pytest.mark.asyncio
     async def test_cache_flush_pattern(self, redis_cache, mock_redis):
         """Test pattern-based cache clearing."""
-        mock_redis.keys.return_value = ["test_cache:key1", "test_cache:key2"]
-        mock_redis.delete.return_value = 2
+        mock_redis.scan_iter = _async_iter([b"test_cache:key1", b"test_cache:key2"])
+        mock_redis.unlink.return_value = 2
 
         result = await redis_cache.flush_pattern("*")
         assert result == 2
+        mock_redis.scan_iter.assert_called_once_with(match="test_cache:*", count=500)
+        mock_redis.unlink.assert_called_once_with(
+            b"test_cache:key1", b"test_cache:key2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_flush_pattern_batches(self, redis_cache, mock_redis):
+        """Matches are unlinked in scan_batch_size chunks."""
+        redis_cache.config.scan_batch_size = 2
+        mock_redis.scan_iter = _async_iter([b"k1", b"k2", b"k3"])
+        mock_redis.unlink.side_effect = lambda *keys: len(keys)
+
+        assert await redis_cache.flush_pattern("*") == 3
+        assert mock_redis.unlink.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_flush_pattern_falls_back_to_delete(
+        self, redis_cache, mock_redis
+    ):
+        """Servers without UNLINK fall back to DEL."""
+        mock_redis.scan_iter = _async_iter([b"test_cache:key1"])
+        mock_redis.unlink.side_effect = redis.ResponseError("unknown command")
+        mock_redis.delete.return_value = 1
+
+        assert await redis_cache.flush_pattern("*") == 1
+        mock_redis.delete.assert_called_once_with(b"test_cache:key1")
+
+    @pytest.mark.asyncio
+    async def test_cache_set_with_tags(self, redis_cache, mock_redis):
+        """Tagged writes index the logical key in each tag set."""
+        mock_pipeline = Mock()
+        mock_pipeline.execute = AsyncMock(return_value=[True, 1, True])
+        mock_redis.pipeline.return_value = mock_pipeline
+
+        result = await redis_cache.set(
+            "posts:python:hot", [1], ttl=300, tags=["subreddit:python"]
+        )
+
+        assert result is True
+        mock_pipeline.sadd.assert_called_once_with(
+            "test_cache:tag:subreddit:python", "posts:python:hot"
+        )
+        mock_pipeline.expire.assert_called_once_with(
+            "test_cache:tag:subreddit:python", 86400
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_invalidate_tags(self, redis_cache, mock_redis):
+        """Invalidating a tag unlinks its keys and the tag set itself."""
+        mock_redis.sscan_iter = _async_iter(
+            [b"posts:python:hot", b"subreddit_info:python"]
+        )
+        mock_redis.unlink.return_value = 3
+
+        result = await redis_cache.invalidate_tags("subreddit:python")
+
+        assert result == 2
+        mock_redis.unlink.assert_called_once_with(
+            "test_cache:posts:python:hot",
+            "test_cache:subreddit_info:python",
+            "test_cache:tag:subreddit:python",
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_counts_only_existing_keys(
+        self, redis_cache, mock_redis
+    ):
+        """Every batch is counted from UNLINK, so expired keys don't count."""
+        redis_cache.config.scan_batch_size = 2
+        mock_redis.sscan_iter = _async_iter([b"a", b"b", b"c"])
+        # "b" already expired; the last call also removes the tag set
+        mock_redis.unlink.side_effect = [1, 2]
+
+        result = await redis_cache.invalidate_tags("subreddit:python")
+
+        assert result == 2
+        assert mock_redis.unlink.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_unknown_tag(self, redis_cache, mock_redis):
+        """A tag with no keys deletes nothing."""
+        mock_redis.sscan_iter = _async_iter([])
+        mock_redis.unlink.return_value = 0
+
+        assert await redis_cache.invalidate_tags("subreddit:none") == 0
 
     def test_cache_key_generation(self, redis_cache):
         """Test cache key generation and hashing."""
@@ -171,7 +298,8 @@ class TestRedisCache:
         mock_redis.get.return_value = b'{"timestamp": 1234567890, "test": true}'
         mock_redis.delete.return_value = 1
 
-        health_result = await redis_cache.health_check()
+        with patch("reddit_analyzer.core.cache.time.time", return_value=1234567890):
+            health_result = await redis_cache.health_check()
 
         assert health_result["status"] == "healthy"
         assert "response_time_ms" in health_result
@@ -190,3 +318,294 @@ class TestRedisCache:
             # Compression was applied
             deserialized = redis_cache._deserialize_value(serialized)
             assert deserialized == large_data
+
+
+class TestLocalCache:
+    """Test the in-process L1 cache."""
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted first."""
+        cache = LocalCache(max_entries=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Entries expire after the smaller of the L1 and caller TTL."""
+        cache = LocalCache(max_entries=10, ttl=60)
+        with patch("reddit_analyzer.core.cache.time.monotonic", return_value=100.0):
+            cache.set("short", "value", ttl=5)
+            cache.set("long", "value", ttl=3600)
+
+        with patch("reddit_analyzer.core.cache.time.monotonic", return_value=106.0):
+            assert cache.get("short") is None
+            assert cache.get("long") == "value"
+
+        with patch("reddit_analyzer.core.cache.time.monotonic", return_value=161.0):
+            assert cache.get("long") is None
+
+        assert cache.get_stats()["expirations"] == 2
+
+    def test_delete_pattern(self):
+        """Glob patterns invalidate matching keys only."""
+        cache = LocalCache()
+        cache.set("posts:python:hot", [1])
+        cache.set("posts:rust:hot", [2])
+        cache.set("subreddit_info:python", {})
+
+        assert cache.delete_pattern("posts:*") == 2
+        assert cache.get("subreddit_info:python") == {}
+
+
+class TestRedisCacheLocalTier:
+    """Test RedisCache with the L1 cache enabled."""
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Create a mock Redis client."""
+        with (
+            patch("reddit_analyzer.core.cache.aioredis.from_url") as mock_async,
+            patch("reddit_analyzer.core.cache.redis.from_url") as mock_sync,
+        ):
+            mock_client = _mock_async_client()
+            mock_async.return_value = mock_client
+            mock_sync.return_value = mock_client
+            yield mock_client
+
+    @pytest.fixture
+    def cache(self, mock_redis):
+        """Create a Redis cache with a local tier."""
+        with patch("reddit_analyzer.core.cache.get_settings") as mock_settings:
+            mock_settings.return_value.REDIS_URL = "redis://localhost:6379/1"
+            return RedisCache(
+                CacheConfig(local_cache_enabled=True, local_cache_max_entries=10)
+            )
+
+    @pytest.mark.asyncio
+    async def test_get_served_from_local_tier(self, cache, mock_redis):
+        """A second read of the same key does not touch Redis."""
+        mock_redis.get.return_value = b'{"name": "python"}'
+
+        assert await cache.get("subreddit_info:python") == {"name": "python"}
+        assert await cache.get("subreddit_info:python") == {"name": "python"}
+
+        assert mock_redis.get.call_count == 1
+        stats = cache.local_cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_populates_and_delete_invalidates(self, cache, mock_redis):
+        """Writes populate L1 and deletes invalidate it."""
+        mock_redis.set.return_value = True
+        mock_redis.delete.return_value = 1
+        mock_redis.get.return_value = None
+
+        await cache.set("key", {"v": 1})
+        assert await cache.get("key") == {"v": 1}
+        mock_redis.get.assert_not_called()
+
+        await cache.delete("key")
+        assert await cache.get("key") is None
+        mock_redis.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_many_only_fetches_missing(self, cache, mock_redis):
+        """Batch reads only ask Redis for keys missing from L1."""
+        cache.local_cache.set("key1", {"data": 1})
+        mock_redis.mget.return_value = [b'{"data": 2}']
+
+        result = await cache.get_many(["key1", "key2"])
+
+        assert result == {"key1": {"data": 1}, "key2": {"data": 2}}
+        mock_redis.mget.assert_called_once_with(["reddit_analyzer:key2"])
+
+    @pytest.mark.asyncio
+    async def test_flush_pattern_invalidates_local(self, cache, mock_redis):
+        """Pattern flushes also drop matching L1 entries."""
+        mock_redis.scan_iter = _async_iter([])
+        cache.local_cache.set("posts:python:hot", [1])
+
+        await cache.flush_pattern("posts:*")
+
+        assert cache.local_cache.get("posts:python:hot") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_drops_local_entries(self, cache, mock_redis):
+        """Tag invalidation also clears the tagged keys from L1."""
+        mock_redis.sscan_iter = _async_iter([b"posts:python:hot"])
+        mock_redis.unlink.return_value = 2
+        cache.local_cache.set("posts:python:hot", [1])
+        cache.local_cache.set("posts:rust:hot", [2])
+
+        await cache.invalidate_tags("subreddit:python")
+
+        assert cache.local_cache.get("posts:python:hot") is None
+        assert cache.local_cache.get("posts:rust:hot") == [2]
+
+    def test_stats_include_local_tier(self, cache, mock_redis):
+        """L1 counters are reported alongside Redis stats."""
+        mock_redis.info.return_value = {"keyspace_hits": 1}
+
+        stats = cache.get_stats()
+
+        assert "local_cache" in stats
+        assert stats["local_cache"]["max_entries"] == 10
+
+
+class TestRedisCacheConnections:
+    """Test connection pool handling of the async and sync clients."""
+
+    @pytest.fixture
+    def settings(self):
+        """Patch settings used to build the clients."""
+        with patch("reddit_analyzer.core.cache.get_settings") as mock_settings:
+            mock_settings.return_value.REDIS_URL = "redis://localhost:6379/1"
+            yield mock_settings
+
+    @pytest.mark.asyncio
+    async def test_pool_is_shared_within_a_loop(self, settings):
+        """All coroutines on one loop share a single pooled client."""
+        cache = RedisCache(CacheConfig(max_connections=7))
+        with patch("reddit_analyzer.core.cache.aioredis.from_url") as mock_from_url:
+            mock_from_url.return_value = _mock_async_client()
+            first = cache.redis_client
+            second = cache.redis_client
+
+        assert first is second
+        mock_from_url.assert_called_once()
+        assert mock_from_url.call_args.kwargs["max_connections"] == 7
+
+    def test_pool_is_rebuilt_for_a_new_loop(self, settings):
+        """A new event loop gets a new client instead of a dead one."""
+        import asyncio
+
+        cache = RedisCache()
+
+        async def grab_client():
+            return cache.redis_client
+
+        with patch("reddit_analyzer.core.cache.aioredis.from_url") as mock_from_url:
+            mock_from_url.side_effect = lambda *args, **kwargs: Mock()
+            first = asyncio.run(grab_client())
+            second = asyncio.run(grab_client())
+
+        assert first is not second
+        # The first loop closed without aclose(); its client isn't kept
+        assert list(cache._clients.values()) == [second]
+
+    def test_aclose_closes_the_pool_of_its_own_loop(self, settings):
+        """Each loop's pool is closed on that loop; others are left working."""
+        import asyncio
+
+        cache = RedisCache()
+        clients = []
+
+        def new_client(*args, **kwargs):
+            client = _mock_async_client()
+            client.aclose = AsyncMock()
+            clients.append(client)
+            return client
+
+        async def grab_client():
+            return cache.redis_client
+
+        async def grab_and_close():
+            client = cache.redis_client
+            await cache.aclose()
+            return client
+
+        other_loop = asyncio.new_event_loop()
+        try:
+            with patch(
+                "reddit_analyzer.core.cache.aioredis.from_url", side_effect=new_client
+            ):
+                first = other_loop.run_until_complete(grab_client())
+                closed = asyncio.run(grab_and_close())
+                again = other_loop.run_until_complete(grab_client())
+                other_loop.run_until_complete(cache.aclose())
+        finally:
+            other_loop.close()
+
+        assert len(clients) == 2
+        assert again is first
+        closed.aclose.assert_awaited_once()
+        first.aclose.assert_awaited_once()
+        assert cache._clients == {}
+
+    def test_sync_facade_uses_same_encoding(self, settings):
+        """Values written by the sync facade are readable by the async cache."""
+        with patch("reddit_analyzer.core.cache.redis.from_url") as mock_from_url:
+            mock_client = Mock()
+            mock_from_url.return_value = mock_client
+            sync_cache = SyncRedisCache()
+
+        mock_client.set.return_value = True
+        assert sync_cache.set("key", {"a": 1}) is True
+        stored = mock_client.set.call_args.args[1]
+
+        assert RedisCache()._deserialize_value(stored) == {"a": 1}
+        mock_client.get.return_value = stored
+        assert sync_cache.get("key") == {"a": 1}
+
+
+class TestCacheCodecs:
+    """Test tagged serialization codecs."""
+
+    @pytest.fixture
+    def listing(self):
+        """A listing-sized payload that compresses well."""
+        return [
+            {"id": f"p{i}", "title": "Post title " * 5, "score": i, "tags": None}
+            for i in range(50)
+        ]
+
+    @pytest.mark.parametrize("serializer", ["json", "orjson", "msgpack"])
+    @pytest.mark.parametrize("compressor", ["none", "gzip", "zstd", "lz4"])
+    def test_round_trip(self, serializer, compressor, listing):
+        """Every available codec combination decodes what it encodes."""
+        if serializer not in SERIALIZERS or compressor not in COMPRESSORS:
+            pytest.skip(f"{serializer}/{compressor} not installed")
+
+        encoded = encode_value(listing, serializer, compressor, compress_threshold=0)
+
+        header = encoded[0]
+        assert header >> 4 == CODEC_TAG_BASE >> 4
+        assert (header >> 2) & 3 == SERIALIZERS[serializer].codec_id
+        assert decode_value(encoded) == listing
+
+    def test_threshold_skips_compression(self, listing):
+        """Payloads under the threshold are stored uncompressed."""
+        encoded = encode_value(listing, "json", "gzip", compress_threshold=10**6)
+
+        assert encoded[0] & 3 == 0
+        assert decode_value(encoded) == listing
+
+    def test_legacy_entries_are_readable(self):
+        """Values written before codecs existed still decode."""
+        import gzip
+
+        assert decode_value(b'{"a": 1}') == {"a": 1}
+        assert decode_value(b"GZIP:" + gzip.compress(b"[1, 2]")) == [1, 2]
+
+    def test_msgpack_preserves_datetimes(self):
+        """msgpack round-trips datetime values instead of stringifying them."""
+        if "msgpack" not in SERIALIZERS:
+            pytest.skip("msgpack not installed")
+        from datetime import datetime
+
+        value = {"created_utc": datetime(2024, 5, 1, 12, 30)}
+
+        assert decode_value(encode_value(value, "msgpack", "none")) == value
+
+    def test_unknown_codec_rejected(self):
+        """Misconfigured codecs fail at construction, not on first write."""
+        with patch("reddit_analyzer.core.cache.get_settings"):
+            with pytest.raises(ValueError):
+                RedisCache(CacheConfig(serializer="pickle"))
@@ -0,0 +1,103 @@
+"""Tests for incremental collection cursors."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from reddit_analyzer.services.collection_cursors import (
+    advance_cursor,
+    get_cursor,
+    take_new_submissions,
+)
+
+
+def _submission(post_id, created_utc):
+    return SimpleNamespace(fullname=f"t3_{post_id}", created_utc=created_utc)
+
+
+class CountingListing:
+    """A newest-first listing that records how many items were consumed."""
+
+    def __init__(self, submissions):
+        self.submissions = submissions
+        self.consumed = 0
+
+    def __iter__(self):
+        for submission in self.submissions:
+            self.consumed += 1
+            yield submission
+
+
+class TestTakeNewSubmissions:
+    """Test stopping a listing walk at known content."""
+
+    def test_stops_at_cursor_post(self):
+        """Nothing at or after the cursor post is consumed."""
+        listing = CountingListing(
+            [_submission(f"p{i}", 1000.0 - i) for i in range(300)]
+        )
+
+        fresh = take_new_submissions(listing, "t3_p3", datetime.fromtimestamp(997.0))
+
+        assert [s.fullname for s in fresh] == ["t3_p0", "t3_p1", "t3_p2"]
+        assert listing.consumed == 4
+
+    def test_stops_at_older_post_when_cursor_deleted(self):
+        """A deleted cursor post falls back to the cursor's timestamp."""
+        listing = CountingListing(
+            [_submission("p0", 1002.0), _submission("p1", 1001.0)]
+            + [_submission(f"old{i}", 990.0 - i) for i in range(100)]
+        )
+
+        fresh = take_new_submissions(
+            listing, "t3_deleted", datetime.fromtimestamp(1000.0)
+        )
+
+        assert [s.fullname for s in fresh] == ["t3_p0", "t3_p1"]
+        assert listing.consumed == 3
+
+    def test_without_cursor_takes_everything(self):
+        """The first run collects the whole listing."""
+        listing = [_submission(f"p{i}", 1000.0 - i) for i in range(5)]
+
+        assert len(take_new_submissions(listing)) == 5
+
+
+class TestCollectionCursor:
+    """Test cursor persistence."""
+
+    def test_advance_creates_and_moves_forward(self, test_db):
+        """The cursor tracks the newest post and never moves backwards."""
+        advance_cursor(
+            test_db,
+            "Python",
+            "new",
+            [
+                {"id": "a", "created_utc": datetime(2024, 1, 1, 12)},
+                {"id": "b", "created_utc": datetime(2024, 1, 1, 13)},
+            ],
+        )
+        test_db.commit()
+
+        cursor = get_cursor(test_db, "python", "new")
+        assert cursor.newest_fullname == "t3_b"
+        assert cursor.last_run_items == 2
+
+        # ISO strings from EnhancedRedditClient work too; older posts don't rewind
+        advance_cursor(
+            test_db, "python", "new", [{"id": "c", "created_utc": "2024-01-01T10:00"}]
+        )
+        test_db.commit()
+
+        cursor = get_cursor(test_db, "python", "new")
+        assert cursor.newest_fullname == "t3_b"
+        assert cursor.newest_created_utc == datetime(2024, 1, 1, 13)
+        assert cursor.last_run_items == 1
+
+    def test_cursors_are_per_sort(self, test_db):
+        """Each (subreddit, sort) pair has its own cursor."""
+        advance_cursor(
+            test_db, "python", "new", [{"id": "a", "created_utc": datetime(2024, 1, 1)}]
+        )
+        test_db.commit()
+
+        assert get_cursor(test_db, "python", "hot") is None
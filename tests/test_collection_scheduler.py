@@ -0,0 +1,255 @@
+"""Tests for the multi-subreddit collection scheduler."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from reddit_analyzer.models import AuthorLookupFailure, Post, Subreddit, User
+from reddit_analyzer.models.collection_job import CollectionCursor
+from reddit_analyzer.services.collection_scheduler import (
+    CollectionScheduler,
+    fetch_author_profiles,
+    store_posts,
+)
+
+
+def _post(post_id, subreddit, created_utc):
+    return {
+        "id": post_id,
+        "title": f"Post {post_id}",
+        "selftext": "",
+        "url": f"https://reddit.com/{post_id}",
+        "author": "test_user",
+        "subreddit": subreddit,
+        "score": 1,
+        "upvote_ratio": 1.0,
+        "num_comments": 0,
+        "created_utc": created_utc.isoformat(),
+        "is_self": True,
+        "is_nsfw": False,
+        "is_locked": False,
+    }
+
+
+class FakeClient:
+    """Serves canned listings and records request concurrency."""
+
+    def __init__(self, posts_by_subreddit, delay=0.01, profiles=None):
+        self.posts_by_subreddit = posts_by_subreddit
+        self.profiles = profiles or {}
+        self.user_lookups = []
+        self.lookups_in_flight = 0
+        self.max_lookups_in_flight = 0
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_new_posts_since(
+        self, subreddit_name, newest_fullname=None, newest_created_utc=None, limit=100
+    ):
+        self.calls.append(subreddit_name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            posts = self.posts_by_subreddit[subreddit_name]
+            if isinstance(posts, Exception):
+                raise posts
+            return posts[:limit]
+        finally:
+            self.in_flight -= 1
+
+    async def get_user_info(self, username):
+        self.user_lookups.append(username)
+        self.lookups_in_flight += 1
+        self.max_lookups_in_flight = max(
+            self.max_lookups_in_flight, self.lookups_in_flight
+        )
+        try:
+            await asyncio.sleep(self.delay)
+            if username not in self.profiles:
+                raise RuntimeError("404 Not Found")
+            return self.profiles[username]
+        finally:
+            self.lookups_in_flight -= 1
+
+
+class TestCollectionScheduler:
+    """Test interleaved collection across subreddits."""
+
+    @pytest.fixture
+    def session_factory(self, async_session_factory):
+        @asynccontextmanager
+        async def factory():
+            async with async_session_factory() as db:
+                try:
+                    yield db
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    raise
+
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_orders_by_staleness(self, session_factory):
+        """Never-collected subreddits first, then least recently run."""
+        now = datetime.utcnow()
+        async with session_factory() as db:
+            db.add_all(
+                [
+                    CollectionCursor(
+                        subreddit_name="fresh", sort="new", last_run_at=now
+                    ),
+                    CollectionCursor(
+                        subreddit_name="stale",
+                        sort="new",
+                        last_run_at=now - timedelta(hours=2),
+                    ),
+                ]
+            )
+        scheduler = CollectionScheduler(FakeClient({}), session_factory=session_factory)
+
+        order = await scheduler.order_by_staleness(["Fresh", "stale", "never", "fresh"])
+
+        assert order == ["never", "stale", "fresh"]
+
+    @pytest.mark.asyncio
+    async def test_collects_concurrently_and_stores(
+        self, async_session_factory, session_factory
+    ):
+        """Subreddits overlap up to max_concurrency and every post is stored."""
+        created = datetime(2024, 1, 1)
+        client = FakeClient(
+            {
+                f"sub{i}": [_post(f"s{i}p{j}", f"sub{i}", created) for j in range(3)]
+                for i in range(6)
+            }
+        )
+        scheduler = CollectionScheduler(
+            client, max_concurrency=3, session_factory=session_factory
+        )
+
+        summary = await scheduler.run([f"sub{i}" for i in range(6)])
+
+        assert client.max_in_flight == 3
+        assert summary["total_posts_stored"] == 18
+        async with async_session_factory() as db:
+            assert await db.scalar(select(func.count(Post.id))) == 18
+            cursor = await db.scalar(
+                select(CollectionCursor).filter_by(subreddit_name="sub0")
+            )
+        assert cursor.newest_fullname.startswith("t3_s0p")
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_stop_others(self, session_factory):
+        """A failing subreddit is reported and the rest still run."""
+        created = datetime(2024, 1, 1)
+        client = FakeClient(
+            {
+                "broken": RuntimeError("403 Forbidden"),
+                "ok": [_post("p1", "ok", created)],
+            }
+        )
+        scheduler = CollectionScheduler(client, session_factory=session_factory)
+
+        summary = await scheduler.run(["broken", "ok"])
+
+        assert summary["failed"] == ["broken"]
+        assert summary["subreddits"]["ok"]["posts_stored"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reuses_subreddit_stored_by_collect(
+        self, async_session_factory, session_factory
+    ):
+        """collect-many on a lowercased name joins the row data collect made."""
+        async with session_factory() as db:
+            # data collect stores Reddit's display name
+            db.add(Subreddit(name="Python", display_name="r/Python"))
+        created = datetime(2024, 1, 1)
+        client = FakeClient({"python": [_post("p1", "Python", created)]})
+        scheduler = CollectionScheduler(client, session_factory=session_factory)
+
+        summary = await scheduler.run(["python"])
+
+        assert summary["total_posts_stored"] == 1
+        async with async_session_factory() as db:
+            subreddits = (await db.scalars(select(Subreddit))).all()
+            post = await db.get(Post, "p1")
+        assert [subreddit.name for subreddit in subreddits] == ["Python"]
+        assert post.subreddit_id == subreddits[0].id
+
+    @pytest.mark.asyncio
+    async def test_fetches_unseen_authors(self, async_session_factory, session_factory):
+        """New authors get profiles; failed lookups are negatively cached."""
+        created = datetime(2024, 1, 1)
+        client = FakeClient(
+            {
+                "python": [
+                    {**_post("p1", "python", created), "author": "alice"},
+                    {**_post("p2", "python", created), "author": "ghost"},
+                ]
+            },
+            profiles={
+                "alice": {
+                    "username": "alice",
+                    "created_utc": "2020-01-01T00:00:00",
+                    "link_karma": 42,
+                }
+            },
+        )
+        scheduler = CollectionScheduler(client, session_factory=session_factory)
+
+        await scheduler.run(["python"])
+
+        assert sorted(client.user_lookups) == ["alice", "ghost"]
+        async with async_session_factory() as db:
+            alice = await db.scalar(select(User).filter_by(username="alice"))
+            ghost = await db.get(AuthorLookupFailure, "ghost")
+            p1 = await db.get(Post, "p1")
+            p2 = await db.get(Post, "p2")
+        assert alice.link_karma == 42
+        assert p1.author_id == alice.id
+        assert ghost.attempts == 1
+        assert p2.author_id is None
+
+    @pytest.mark.asyncio
+    async def test_author_lookups_are_concurrent_and_bounded(self):
+        """Profiles are fetched in parallel, never more than the limit at once."""
+        names = [f"user{i}" for i in range(10)]
+        client = FakeClient({}, profiles={name: {"username": name} for name in names})
+
+        profiles, failures = await fetch_author_profiles(
+            client, names + ["ghost"], max_concurrency=3
+        )
+
+        assert client.max_lookups_in_flight == 3
+        assert sorted(profiles) == sorted(names)
+        assert list(failures) == ["ghost"]
+
+    def test_store_posts_uses_display_name(self, db_session):
+        """New rows take the display name so a later collect finds them."""
+        created = datetime(2024, 1, 1)
+        store_posts(db_session, "python", [_post("p1", "Python", created)])
+        store_posts(db_session, "PYTHON", [_post("p2", "Python", created)])
+        db_session.commit()
+
+        assert [s.name for s in db_session.query(Subreddit).all()] == ["Python"]
+
+    def test_store_posts_skips_existing(self, db_session):
+        """Only posts not already stored are added."""
+        created = datetime(2024, 1, 1)
+        store_posts(db_session, "python", [_post("p1", "python", created)])
+        db_session.commit()
+
+        stored = store_posts(
+            db_session,
+            "python",
+            [_post("p1", "python", created), _post("p2", "python", created)],
+        )
+
+        assert stored == ["p2"]
@@ -0,0 +1,118 @@
+"""Tests for budgeted MoreComments expansion."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from praw.models import MoreComments
+
+from reddit_analyzer.services.comment_expansion import (
+    collect_more_stubs,
+    expand_more_comments,
+    plan_morechildren_batches,
+)
+
+
+def _more(count, children, parent_id="t3_post"):
+    return MoreComments(
+        None, {"count": count, "children": children, "parent_id": parent_id}
+    )
+
+
+def _comment(comment_id, score, replies=(), parent_id="t3_post", depth=0):
+    return SimpleNamespace(
+        id=comment_id,
+        fullname=f"t1_{comment_id}",
+        parent_id=parent_id,
+        score=score,
+        depth=depth,
+        replies=list(replies),
+    )
+
+
+class TestCollectMoreStubs:
+    """Test finding and ranking stubs in an unexpanded tree."""
+
+    def test_skips_stubs_under_filtered_parents(self):
+        """Stubs below a low-score parent or max_depth are not worth a request."""
+        forest = [
+            _comment("good", 50, [_more(10, ["g1"], "t1_good")]),
+            _comment("bad", -5, [_more(40, ["b1"], "t1_bad")]),
+            _comment("deep", 5, [_comment("d2", 5, [_more(3, ["d3"], "t1_d2")])]),
+            _more(0, [], "t1_x"),  # "continue this thread"
+        ]
+
+        stubs = collect_more_stubs(forest, 100, max_depth=1, min_score=0)
+
+        assert [stub.more.children for stub in stubs] == [["g1"]]
+        assert stubs[0].depth == 1
+        assert stubs[0].parent_score == 50
+
+    def test_value_prefers_large_well_scored_branches(self):
+        """A bigger subtree under a better parent ranks first."""
+        forest = [
+            _comment("low", 1, [_more(20, ["l1"], "t1_low")]),
+            _comment("high", 500, [_more(20, ["h1"], "t1_high")]),
+            _comment("small", 500, [_more(2, ["s1"], "t1_small")]),
+        ]
+
+        stubs = collect_more_stubs(forest, 10)
+        ranked = sorted(stubs, key=lambda stub: stub.value, reverse=True)
+
+        assert [stub.more.children[0] for stub in ranked] == ["h1", "l1", "s1"]
+
+
+class TestPlanMorechildrenBatches:
+    """Test packing children ids into a request budget."""
+
+    def test_packs_children_across_stubs(self):
+        """Ids from several stubs share calls of up to 100."""
+        stubs = collect_more_stubs(
+            [
+                _more(150, [f"a{i}" for i in range(150)]),
+                _more(80, [f"b{i}" for i in range(80)]),
+            ],
+            10,
+        )
+
+        batches = plan_morechildren_batches(stubs, budget=2)
+
+        assert [len(batch) for batch in batches] == [100, 100]
+        assert batches[0][0] == "a0"
+        # The lower ranked stub is cut off at the budget
+        assert batches[1][-1] == "b49"
+
+    def test_zero_budget(self):
+        stubs = collect_more_stubs([_more(5, ["a"])], 10)
+
+        assert plan_morechildren_batches(stubs, budget=0) == []
+
+
+class TestExpandMoreComments:
+    """Test issuing the planned /api/morechildren calls."""
+
+    def test_one_call_per_batch(self):
+        """250 hidden comments within budget cost three calls, not one per stub."""
+        forest = [
+            _comment(f"c{i}", 10, [_more(25, [f"c{i}r{j}" for j in range(25)])])
+            for i in range(10)
+        ]
+        submission = SimpleNamespace(
+            comments=forest, score=100, fullname="t3_post", comment_sort="best"
+        )
+        reddit = Mock()
+        reddit.post.side_effect = lambda path, data: [
+            _comment(child, 1) for child in data["children"].split(",")
+        ] + [_more(3, ["nested"])]
+
+        expanded = expand_more_comments(reddit, submission, budget=5)
+
+        assert reddit.post.call_count == 3
+        assert len(expanded) == 250
+        assert reddit.post.call_args.kwargs["data"]["link_id"] == "t3_post"
+
+    def test_no_budget_makes_no_calls(self):
+        reddit = Mock()
+        submission = SimpleNamespace(comments=[_more(5, ["a"])], score=1)
+
+        assert expand_more_comments(reddit, submission, budget=0) == []
+        reddit.post.assert_not_called()
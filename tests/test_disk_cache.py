@@ -0,0 +1,176 @@
+"""Tests for the embedded SQLite cache backend."""
+
+import pytest
+from unittest.mock import patch
+from reddit_analyzer.core.cache import CacheBackend, CacheConfig, get_cache
+from reddit_analyzer.core.disk_cache import DiskCache
+
+
+class TestDiskCache:
+    """Test disk cache functionality."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path):
+        return str(tmp_path / "cache" / "test_cache.db")
+
+    @pytest.fixture
+    def disk_cache(self, cache_path):
+        cache = DiskCache(CacheConfig(default_ttl=300), path=cache_path)
+        yield cache
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_set_get_delete(self, disk_cache):
+        """Values round-trip through the file and can be deleted."""
+        value = {"test": "data", "items": list(range(500))}
+
+        assert await disk_cache.set("key", value) is True
+        assert await disk_cache.get("key") == value
+        assert await disk_cache.exists("key") is True
+
+        assert await disk_cache.delete("key") is True
+        assert await disk_cache.get("key") is None
+        assert await disk_cache.delete("key") is False
+
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, disk_cache, cache_path):
+        """A new process opening the same file sees earlier entries."""
+        await disk_cache.set("subreddit_info:python", {"name": "python"})
+        await disk_cache.aclose()
+
+        reopened = DiskCache(CacheConfig(), path=cache_path)
+        try:
+            assert await reopened.get("subreddit_info:python") == {"name": "python"}
+        finally:
+            reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, disk_cache):
+        """Expired entries are misses and are removed on read."""
+        with patch("reddit_analyzer.core.disk_cache.time.time", return_value=1000.0):
+            await disk_cache.set("key", "value", ttl=10)
+            assert await disk_cache.ttl("key") == 10
+
+        with patch("reddit_analyzer.core.disk_cache.time.time", return_value=1011.0):
+            assert await disk_cache.get("key") is None
+            assert await disk_cache.ttl("key") == -2
+
+        assert disk_cache.get_stats()["expirations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_nx_and_xx(self, disk_cache):
+        """NX only creates, XX only replaces, like the Redis flags."""
+        assert await disk_cache.set("lock", "a", nx=True) is True
+        assert await disk_cache.set("lock", "b", nx=True) is False
+        assert await disk_cache.get("lock") == "a"
+
+        assert await disk_cache.set("missing", "x", xx=True) is False
+        assert await disk_cache.set("lock", "c", xx=True) is True
+        assert await disk_cache.get("lock") == "c"
+
+    @pytest.mark.asyncio
+    async def test_increment(self, disk_cache):
+        """Counters start from zero and keep their expiry."""
+        assert await disk_cache.increment("counter") == 1
+        assert await disk_cache.increment("counter", 5) == 6
+        assert await disk_cache.get("counter") == 6
+
+    @pytest.mark.asyncio
+    async def test_get_many_set_many(self, disk_cache):
+        """Batch operations skip missing keys."""
+        await disk_cache.set_many({"key1": {"data": 1}, "key2": {"data": 2}})
+
+        result = await disk_cache.get_many(["key1", "key2", "key3"])
+
+        assert result == {"key1": {"data": 1}, "key2": {"data": 2}}
+
+    @pytest.mark.asyncio
+    async def test_flush_pattern(self, disk_cache):
+        """Glob patterns delete matching keys only."""
+        await disk_cache.set("posts:python:hot", [1])
+        await disk_cache.set("posts:rust:hot", [2])
+        await disk_cache.set("user_info:spez", {})
+
+        assert await disk_cache.flush_pattern("posts:*") == 2
+        assert await disk_cache.get("user_info:spez") == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags(self, disk_cache):
+        """Tag invalidation drops every key registered under the tag."""
+        await disk_cache.set("posts:python:hot", [1], tags=["subreddit:python"])
+        await disk_cache.set_many(
+            {"comments:a": [], "comments:b": []}, tags=["subreddit:python"]
+        )
+        await disk_cache.set("posts:rust:hot", [2], tags=["subreddit:rust"])
+
+        assert await disk_cache.invalidate_tags("subreddit:python") == 3
+        assert await disk_cache.get("posts:python:hot") is None
+        assert await disk_cache.get("posts:rust:hot") == [2]
+
+    @pytest.mark.asyncio
+    async def test_size_bounded_lru_eviction(self, cache_path):
+        """Writes past the byte budget evict least recently used entries."""
+        config = CacheConfig(compressor="none", disk_max_bytes=4000)
+        cache = DiskCache(config, path=cache_path)
+        try:
+            with patch("reddit_analyzer.core.disk_cache.time.time") as clock:
+                for i in range(3):
+                    clock.return_value = 1000.0 + i
+                    await cache.set(f"key{i}", "x" * 1000)
+
+                # Touch key0 so key1 becomes the least recently used
+                clock.return_value = 1010.0
+                assert await cache.get("key0") is not None
+
+                clock.return_value = 1020.0
+                await cache.set("key3", "x" * 1000)
+                await cache.set("key4", "x" * 1000)
+
+                assert await cache.exists("key1") is False
+                assert await cache.exists("key0") is True
+                assert await cache.exists("key4") is True
+
+            stats = cache.get_stats()
+            assert stats["evictions"] >= 1
+            assert stats["size_bytes"] <= config.disk_max_bytes
+        finally:
+            cache.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check(self, disk_cache):
+        """The shared health check exercises set/get/delete."""
+        health = await disk_cache.health_check()
+
+        assert health["status"] == "healthy"
+        assert health["data_integrity"] is True
+
+    def test_get_cache_selects_backend(self, cache_path):
+        """CACHE_BACKEND=disk builds a DiskCache without touching Redis."""
+        with (
+            patch("reddit_analyzer.core.cache.get_settings") as mock_settings,
+            patch("reddit_analyzer.core.cache._cache_instance", None),
+        ):
+            settings = mock_settings.return_value
+            settings.CACHE_BACKEND = "disk"
+            settings.CACHE_PATH = cache_path
+            settings.CACHE_MAX_SIZE_MB = 16
+            settings.CACHE_SERIALIZER = "json"
+            settings.CACHE_COMPRESSOR = "gzip"
+            settings.CACHE_COMPRESS_THRESHOLD = 1024
+
+            cache = get_cache()
+
+            assert isinstance(cache, DiskCache)
+            assert isinstance(cache, CacheBackend)
+            assert cache.path == cache_path
+            assert cache.config.disk_max_bytes == 16 * 1024 * 1024
+
+    def test_incomplete_backend_cannot_be_built(self):
+        """A backend missing part of the interface fails at construction."""
+
+        class GetOnlyCache(CacheBackend):
+            async def get(self, key):
+                return None
+
+        with pytest.raises(TypeError, match="abstract"):
+            GetOnlyCache()
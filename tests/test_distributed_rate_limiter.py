@@ -0,0 +1,204 @@
+"""Tests for the Redis-backed distributed rate limiter."""
+
+import pytest
+import redis
+from unittest.mock import AsyncMock, Mock, patch
+from reddit_analyzer.core.distributed_rate_limiter import (
+    DistributedRateLimiter,
+    MemoryRateLimitStore,
+    RedisRateLimitStore,
+)
+from reddit_analyzer.core.rate_limiter import RateLimitConfig
+
+
+class FakeClock:
+    """Manually advanced clock for the in-memory store."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDistributedRateLimiter:
+    """Test fleet-wide budgeting with the in-memory store."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def config(self):
+        return RateLimitConfig(requests_per_minute=60, burst_limit=10)
+
+    @pytest.fixture
+    def workers(self, clock, config):
+        """Four limiters sharing one store, like four Celery workers."""
+        store = MemoryRateLimitStore(clock=clock)
+        return [
+            DistributedRateLimiter(config, store, worker_id=f"worker-{i}")
+            for i in range(4)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_burst_is_shared_across_workers(self, workers):
+        """The burst limit caps the fleet, not each worker."""
+        granted = 0
+        for _ in range(5):
+            for limiter in workers:
+                granted += await limiter.acquire("reddit_api")
+
+        assert granted == 10
+
+    @pytest.mark.asyncio
+    async def test_fleet_never_exceeds_budget(self, workers, clock, config):
+        """All workers together stay within the configured rate plus one burst."""
+        granted = 0
+        for _ in range(6000):
+            for limiter in workers:
+                granted += await limiter.acquire("reddit_api")
+            clock.now += 0.1
+
+        # Ten minutes at 60 req/min
+        assert 600 <= granted <= 600 + config.burst_limit
+
+    @pytest.mark.asyncio
+    async def test_budget_is_split_fairly(self, workers, clock):
+        """A greedy worker cannot starve the others."""
+        greedy, *others = workers
+        for limiter in others:
+            await limiter.acquire("reddit_api")
+
+        counts = {limiter.worker_id: 0 for limiter in workers}
+        for _ in range(1200):
+            for _ in range(10):
+                counts[greedy.worker_id] += await greedy.acquire("reddit_api")
+            for limiter in others:
+                counts[limiter.worker_id] += await limiter.acquire("reddit_api")
+            clock.now += 0.5
+
+        # Ten minutes at 60 req/min across 4 active workers is ~150 each
+        assert all(145 <= count <= 160 for count in counts.values())
+
+    @pytest.mark.asyncio
+    async def test_idle_workers_release_their_share(self, workers, clock):
+        """Workers silent for worker_ttl stop counting toward the split."""
+        for limiter in workers:
+            await limiter.acquire("reddit_api")
+        await workers[0].acquire("reddit_api")
+        assert workers[0].get_status("reddit_api")["active_workers"] == 4
+
+        clock.now += 31
+        await workers[0].acquire("reddit_api")
+
+        assert workers[0].get_status("reddit_api")["active_workers"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_if_needed_sleeps_once(self, workers):
+        """Blocked callers reserve a slot and sleep exactly once."""
+        for _ in range(10):
+            await workers[0].wait_if_needed("reddit_api")
+
+        with patch(
+            "reddit_analyzer.core.distributed_rate_limiter.asyncio.sleep",
+            new=AsyncMock(),
+        ) as mock_sleep:
+            await workers[1].wait_if_needed("reddit_api")
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] > 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_limit(self, config):
+        """An unreachable store degrades to a local limiter, not an outage."""
+        store = Mock()
+        store.reserve = AsyncMock(side_effect=redis.ConnectionError("down"))
+        limiter = DistributedRateLimiter(config, store, worker_id="worker-0")
+
+        granted = [await limiter.acquire("reddit_api") for _ in range(11)]
+
+        assert granted.count(True) == config.burst_limit
+
+    @pytest.mark.asyncio
+    async def test_reset_shared(self, workers):
+        """Resetting clears the shared state for every worker."""
+        for _ in range(10):
+            await workers[0].acquire("reddit_api")
+        assert await workers[1].acquire("reddit_api") is False
+
+        await workers[1].reset_shared("reddit_api")
+
+        assert await workers[2].acquire("reddit_api") is True
+
+    @pytest.mark.asyncio
+    async def test_adaptive_budget_applies_fleet_wide(self, clock):
+        """A reported budget replaces the static limits in the shared store."""
+        config = RateLimitConfig(requests_per_minute=10, burst_limit=3, adaptive=True)
+        limiter = DistributedRateLimiter(
+            config, MemoryRateLimitStore(clock=clock), worker_id="worker-0"
+        )
+
+        with (
+            patch(
+                "reddit_analyzer.core.distributed_rate_limiter.time.time",
+                return_value=clock.now,
+            ),
+            patch(
+                "reddit_analyzer.core.rate_limiter.time.time", return_value=clock.now
+            ),
+        ):
+            limiter.observe_limits(remaining=610, reset_timestamp=clock.now + 60)
+            granted = [await limiter.acquire("reddit_api") for _ in range(50)]
+
+        assert all(granted)
+
+
+class TestRedisRateLimitStore:
+    """Run the Lua script against an in-memory Redis server."""
+
+    @pytest.fixture
+    def fake_redis(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        client = fakeredis.aioredis.FakeRedis()
+        with patch(
+            "reddit_analyzer.core.distributed_rate_limiter.aioredis.from_url",
+            return_value=client,
+        ):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_script_shares_budget(self, fake_redis):
+        """Limiters on one Redis share the burst and split the budget."""
+        store = RedisRateLimitStore("redis://localhost:6379/0")
+        config = RateLimitConfig(requests_per_minute=60, burst_limit=10)
+        workers = [
+            DistributedRateLimiter(config, store, worker_id=f"worker-{i}")
+            for i in range(4)
+        ]
+
+        granted = 0
+        for _ in range(5):
+            for limiter in workers:
+                granted += await limiter.acquire("reddit_api")
+
+        assert granted == 10
+        status = workers[0].get_status("reddit_api")
+        assert status["active_workers"] == 4
+        assert status["remaining_requests"] == 50
+
+    @pytest.mark.asyncio
+    async def test_script_reserve_returns_delay(self, fake_redis):
+        """Committed reservations queue behind the burst with exact delays."""
+        store = RedisRateLimitStore("redis://localhost:6379/0")
+        config = RateLimitConfig(requests_per_minute=60, burst_limit=10)
+
+        delays = [
+            (await store.reserve("reddit_api", config, "worker-0", 30, True)).delay
+            for _ in range(12)
+        ]
+
+        assert delays[:10] == [0.0] * 10
+        assert 0.9 < delays[10] <= 1.0
+        assert 1.9 < delays[11] <= 2.0
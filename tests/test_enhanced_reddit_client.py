@@ -1,8 +1,14 @@
 """Tests for enhanced Reddit client functionality."""
 
+import asyncio
+import praw
 import pytest
+import time
 from unittest.mock import Mock, patch, AsyncMock
-from reddit_analyzer.services.enhanced_reddit_client import EnhancedRedditClient
+from reddit_analyzer.services.enhanced_reddit_client import (
+    CACHE_ENVELOPE_MARKER,
+    EnhancedRedditClient,
+)
 from reddit_analyzer.core.rate_limiter import RateLimitConfig
 
 
@@ -12,7 +18,9 @@ class TestEnhancedRedditClient:
     @pytest.fixture
     def mock_reddit(self):
         """Create a mock PRAW Reddit instance."""
-        with patch("app.services.enhanced_reddit_client.praw.Reddit") as mock_reddit:
+        with patch(
+            "reddit_analyzer.services.enhanced_reddit_client.praw.Reddit"
+        ) as mock_reddit:
             mock_instance = Mock()
             mock_reddit.return_value = mock_instance
 
@@ -24,7 +32,9 @@ class TestEnhancedRedditClient:
     @pytest.fixture
     def mock_config(self):
         """Mock configuration."""
-        with patch("app.services.enhanced_reddit_client.get_config") as mock_config:
+        with patch(
+            "reddit_analyzer.services.enhanced_reddit_client.get_config"
+        ) as mock_config:
             config = Mock()
             config.REDDIT_CLIENT_ID = "test_id"
             config.REDDIT_CLIENT_SECRET = "test_secret"
@@ -39,19 +49,22 @@ class TestEnhancedRedditClient:
     @pytest.fixture
     def mock_cache(self):
         """Mock cache."""
-        with patch("app.services.enhanced_reddit_client.get_cache") as mock_cache:
+        with patch(
+            "reddit_analyzer.services.enhanced_reddit_client.get_cache"
+        ) as mock_cache:
             cache = Mock()
             cache.get = AsyncMock(return_value=None)
             cache.set = AsyncMock(return_value=True)
             cache.health_check = AsyncMock(return_value={"status": "healthy"})
             cache.get_stats.return_value = {"keyspace_hits": 100}
             cache.close.return_value = None
+            cache.aclose = AsyncMock(return_value=None)
 
             mock_cache.return_value = cache
             yield cache
 
     @pytest.fixture
-    async def reddit_client(self, mock_reddit, mock_config, mock_cache):
+    def reddit_client(self, mock_reddit, mock_config, mock_cache):
         """Create enhanced Reddit client for testing."""
         rate_config = RateLimitConfig(requests_per_minute=10, burst_limit=3)
         client = EnhancedRedditClient(rate_config)
@@ -216,6 +229,7 @@ class TestEnhancedRedditClient:
         # Simulate failures to trigger circuit breaker
         reddit_client.circuit_breaker["failure_count"] = 5
         reddit_client.circuit_breaker["state"] = "open"
+        reddit_client.circuit_breaker["last_failure_time"] = time.time()
 
         # Test that circuit breaker prevents requests when open
         with pytest.raises(Exception, match="Circuit breaker is open"):
@@ -295,3 +309,258 @@ class TestEnhancedRedditClient:
         assert "cache" in health_status
         assert "rate_limiter" in health_status
         assert "request_queue" in health_status
+
+    @pytest.mark.asyncio
+    async def test_cached_request_coalesces_concurrent_misses(
+        self, reddit_client, mock_cache
+    ):
+        """Concurrent misses for one key make a single upstream call."""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"name": "python"}
+
+        results = await asyncio.gather(
+            *(
+                reddit_client._cached_request("subreddit_info:python", 60, fetch)
+                for _ in range(5)
+            )
+        )
+
+        assert len(calls) == 1
+        assert results == [{"name": "python"}] * 5
+        stored = mock_cache.set.call_args.args[1]
+        assert stored["value"] == {"name": "python"}
+        assert mock_cache.set.call_args.kwargs["ttl"] == (
+            60 + reddit_client.cache_refresh.stale_grace
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_request_serves_stale_while_refreshing(
+        self, reddit_client, mock_cache
+    ):
+        """Expired entries are served while one background refresh runs."""
+        mock_cache.get.return_value = {
+            CACHE_ENVELOPE_MARKER: 1,
+            "value": "stale",
+            "expires_at": time.time() - 1,
+            "delta": 0.1,
+        }
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return "fresh"
+
+        first = await reddit_client._cached_request("posts:python", 60, fetch)
+        second = await reddit_client._cached_request("posts:python", 60, fetch)
+        await asyncio.gather(*reddit_client._inflight.values())
+
+        assert first == second == "stale"
+        assert len(calls) == 1
+        assert mock_cache.set.call_args.args[1]["value"] == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_cached_request_fresh_hit_skips_fetch(
+        self, reddit_client, mock_cache
+    ):
+        """Fresh entries are returned without refreshing."""
+        reddit_client.cache_refresh.early_refresh_beta = 0
+        mock_cache.get.return_value = {
+            CACHE_ENVELOPE_MARKER: 1,
+            "value": "cached",
+            "expires_at": time.time() + 60,
+            "delta": 0.1,
+        }
+        fetch = Mock()
+
+        result = await reddit_client._cached_request("posts:python", 60, fetch)
+
+        assert result == "cached"
+        assert reddit_client._inflight == {}
+        fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_request_waits_for_lock_holder(
+        self, reddit_client, mock_cache
+    ):
+        """A worker that loses the fill lock waits for the holder's value."""
+        reddit_client.cache_refresh.distributed_lock = True
+        reddit_client.cache_refresh.lock_poll_interval = 0.01
+        mock_cache.set.return_value = False  # lock held by another worker
+        mock_cache.get.side_effect = [
+            None,
+            None,
+            {
+                CACHE_ENVELOPE_MARKER: 1,
+                "value": "filled elsewhere",
+                "expires_at": time.time() + 60,
+                "delta": 0.1,
+            },
+        ]
+        fetch = Mock()
+
+        result = await reddit_client._cached_request("posts:python", 60, fetch)
+
+        assert result == "filled elsewhere"
+        fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_entries_are_tagged_by_subreddit(
+        self, reddit_client, mock_reddit, mock_cache
+    ):
+        """Cache fills register the entry under its subreddit tag."""
+        mock_subreddit = Mock()
+        mock_subreddit.created_utc = 1640995200
+        mock_reddit.subreddit.return_value = mock_subreddit
+
+        await reddit_client.get_subreddit_info("Python")
+
+        assert mock_cache.set.call_args.kwargs["tags"] == ["subreddit:python"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_subreddit(self, reddit_client, mock_cache):
+        """Invalidating a subreddit drops its tag in the cache."""
+        mock_cache.invalidate_tags = AsyncMock(return_value=4)
+
+        assert await reddit_client.invalidate_subreddit("Python") == 4
+        mock_cache.invalidate_tags.assert_called_once_with("subreddit:python")
+
+    @pytest.mark.asyncio
+    async def test_rate_limits_observed_after_calls(
+        self, reddit_client, mock_reddit, mock_cache
+    ):
+        """Reddit's reported budget is fed back to the limiter after a call."""
+        mock_subreddit = Mock()
+        mock_subreddit.created_utc = 1640995200
+        mock_reddit.subreddit.return_value = mock_subreddit
+        mock_reddit.auth.limits = {
+            "remaining": 512.0,
+            "reset_timestamp": time.time() + 300,
+            "used": 88,
+        }
+
+        await reddit_client.get_subreddit_info("test", use_cache=False)
+
+        assert reddit_client.rate_limiter.observed_remaining == 512.0
+
+    @pytest.mark.asyncio
+    async def test_get_info_batches_lookups(
+        self, reddit_client, mock_reddit, mock_cache
+    ):
+        """Posts and users are fetched in one call per kind, not one per id."""
+        posts = []
+        for i in range(150):
+            post = Mock(
+                id=f"p{i}", fullname=f"t3_p{i}", score=i, created_utc=1640995200
+            )
+            post.__class__ = praw.models.Submission
+            posts.append(post)
+        mock_reddit.info.side_effect = lambda fullnames: [
+            post for post in posts if post.fullname in fullnames
+        ]
+
+        redditor = Mock(
+            fullname="t2_u1", created_utc=1640995200, comment_karma=5, link_karma=7
+        )
+        redditor.name = "spez"
+        mock_reddit.redditors.partial_redditors.return_value = [redditor]
+        reddit_client.rate_limiter.wait_if_needed = AsyncMock()
+
+        fullnames = [post.fullname for post in posts] + ["t2_u1", "t3_missing"]
+        results = await reddit_client.get_info(fullnames)
+
+        # 152 lookups: two /api/info calls and one user lookup
+        assert mock_reddit.info.call_count == 2
+        mock_reddit.redditors.partial_redditors.assert_called_once_with(["t2_u1"])
+        assert results["t3_p42"]["score"] == 42
+        assert results["t2_u1"]["total_karma"] == 12
+        assert results["t3_missing"] is None
+        mock_cache.set.assert_not_called()
+
+    def _listing(self, count):
+        posts = []
+        for i in range(count):
+            post = Mock(id=f"p{i}", fullname=f"t3_p{i}", created_utc=1640995200)
+            post.author.name = "test_user"
+            posts.append(post)
+
+        def new(limit, params):
+            start = 0
+            if params.get("after"):
+                start = int(params["after"][len("t3_p") :]) + 1
+            return posts[start : start + limit]
+
+        return new
+
+    @pytest.mark.asyncio
+    async def test_iter_subreddit_posts_yields_pages(
+        self, reddit_client, mock_reddit, mock_cache
+    ):
+        """Each page is one request, continuing from the previous page."""
+        mock_subreddit = Mock()
+        mock_subreddit.new.side_effect = self._listing(250)
+        mock_reddit.subreddit.return_value = mock_subreddit
+        reddit_client.rate_limiter.wait_if_needed = AsyncMock()
+
+        pages = [
+            page
+            async for page in reddit_client.iter_subreddit_posts(
+                "test", sort="new", limit=230, use_cache=False
+            )
+        ]
+
+        assert [len(page) for page in pages] == [100, 100, 30]
+        assert pages[1][0]["id"] == "p100"
+        afters = [
+            call.kwargs["params"].get("after")
+            for call in mock_subreddit.new.call_args_list
+        ]
+        assert afters == [None, "t3_p99", "t3_p199"]
+
+    @pytest.mark.asyncio
+    async def test_iter_subreddit_posts_caches_each_page(
+        self, reddit_client, mock_reddit, mock_cache
+    ):
+        """Pages are cached under keys that include their position."""
+        mock_subreddit = Mock()
+        mock_subreddit.new.side_effect = self._listing(150)
+        mock_reddit.subreddit.return_value = mock_subreddit
+        reddit_client.rate_limiter.wait_if_needed = AsyncMock()
+
+        pages = [
+            page
+            async for page in reddit_client.iter_subreddit_posts(
+                "test", sort="new", limit=500
+            )
+        ]
+
+        assert [len(page) for page in pages] == [100, 50]
+        keys = [call.args[0] for call in mock_cache.set.call_args_list]
+        assert keys == [
+            "posts:test:new:all:page:100:first",
+            "posts:test:new:all:page:100:t3_p99",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_iter_subreddit_posts_stops_early(
+        self, reddit_client, mock_reddit, mock_cache
+    ):
+        """Breaking out of the loop cancels the prefetched page."""
+        mock_subreddit = Mock()
+        mock_subreddit.new.side_effect = self._listing(1000)
+        mock_reddit.subreddit.return_value = mock_subreddit
+        reddit_client.rate_limiter.wait_if_needed = AsyncMock()
+
+        pages = reddit_client.iter_subreddit_posts(
+            "test", sort="new", limit=1000, use_cache=False
+        )
+        async for page in pages:
+            break
+        await pages.aclose()
+        await asyncio.sleep(0)
+
+        # The first page plus at most the one prefetched behind it
+        assert mock_subreddit.new.call_count <= 2
@@ -0,0 +1,106 @@
+"""Tests for batched fullname lookups."""
+
+import asyncio
+import pytest
+from reddit_analyzer.core.info_batcher import InfoBatcher
+
+
+class RecordingFetch:
+    """fetch_batch stand-in that records each batch it is sent."""
+
+    def __init__(self, missing=()):
+        self.batches = []
+        self.missing = set(missing)
+
+    async def __call__(self, fullnames):
+        self.batches.append(list(fullnames))
+        return {
+            name: {"fullname": name} for name in fullnames if name not in self.missing
+        }
+
+
+class TestInfoBatcher:
+    """Test lookup batching and result scattering."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_call(self):
+        """Lookups made within the window go out as one batch."""
+        fetch = RecordingFetch()
+        batcher = InfoBatcher(fetch, max_wait=0.01)
+
+        results = await asyncio.gather(
+            batcher.load("t3_a"), batcher.load("t1_b"), batcher.load("t3_c")
+        )
+
+        assert results == [
+            {"fullname": "t3_a"},
+            {"fullname": "t1_b"},
+            {"fullname": "t3_c"},
+        ]
+        assert fetch.batches == [["t3_a", "t1_b", "t3_c"]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self):
+        """10k lookups cost 100 calls, sent as soon as each batch fills."""
+        fetch = RecordingFetch()
+        batcher = InfoBatcher(fetch, max_wait=60.0)
+        fullnames = [f"t3_{i}" for i in range(10000)]
+
+        results = await asyncio.wait_for(batcher.load_many(fullnames), timeout=5)
+
+        assert len(fetch.batches) == 100
+        assert all(len(batch) == 100 for batch in fetch.batches)
+        assert results["t3_9999"] == {"fullname": "t3_9999"}
+        assert batcher.get_stats()["api_calls_saved"] == 9900
+
+    @pytest.mark.asyncio
+    async def test_duplicate_fullnames_share_a_slot(self):
+        """A fullname requested twice in one window is fetched once."""
+        fetch = RecordingFetch()
+        batcher = InfoBatcher(fetch, max_wait=0.01)
+
+        first, second = await asyncio.gather(batcher.load("t3_a"), batcher.load("t3_a"))
+
+        assert first == second == {"fullname": "t3_a"}
+        assert fetch.batches == [["t3_a"]]
+
+    @pytest.mark.asyncio
+    async def test_missing_results_resolve_to_none(self):
+        """Fullnames Reddit doesn't return resolve to None."""
+        batcher = InfoBatcher(RecordingFetch(missing={"t3_gone"}), max_wait=0.01)
+
+        results = await batcher.load_many(["t3_a", "t3_gone"])
+
+        assert results == {"t3_a": {"fullname": "t3_a"}, "t3_gone": None}
+
+    @pytest.mark.asyncio
+    async def test_batch_errors_reach_every_waiter(self):
+        """A failed call fails each lookup in the batch."""
+
+        async def failing_fetch(fullnames):
+            raise RuntimeError("upstream error")
+
+        batcher = InfoBatcher(failing_fetch, max_wait=0.01)
+
+        results = await asyncio.gather(
+            batcher.load("t3_a"), batcher.load("t3_b"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_aclose_flushes_waiting_lookups(self):
+        """Closing sends queued lookups instead of dropping them."""
+        fetch = RecordingFetch()
+        batcher = InfoBatcher(fetch, max_wait=60.0)
+
+        task = asyncio.create_task(batcher.load("t3_a"))
+        await asyncio.sleep(0)
+        await batcher.aclose()
+
+        assert await task == {"fullname": "t3_a"}
+
+    def test_rejects_batches_over_api_limit(self):
+        """Reddit caps info lookups at 100 ids."""
+        with pytest.raises(ValueError):
+            InfoBatcher(RecordingFetch(), max_batch_size=101)
@@ -158,7 +158,9 @@ class TestPhase2Basic:
         queue = RequestQueue(max_concurrent=3)
         assert queue is not None
         assert queue.max_concurrent == 3
-        assert hasattr(queue, "queues")
+        assert queue.get_status()["queue_sizes"] == {
+            priority.name: 0 for priority in RequestPriority
+        }
 
         # Test enums
         assert RequestPriority.HIGH.value > RequestPriority.LOW.value
@@ -119,6 +119,9 @@ class TestCLICommentCollection:
                     "is_locked": False,
                 },
             ]
+            client.iter_subreddit_posts.side_effect = lambda *args, **kwargs: iter(
+                [client.get_subreddit_posts.return_value]
+            )
 
             # Mock comments
             def mock_get_comments(post_id, limit=50, depth=3, min_score=None):
@@ -197,6 +200,7 @@ class TestCLICommentCollection:
                 }
 
             client.get_user_info.side_effect = mock_user_info
+            client.rate_limiter.reserve.return_value = 0.0
 
             mock.return_value = client
             yield client
@@ -546,6 +550,9 @@ class TestCLICommentCollection:
                     "is_locked": False,
                 }
             ]
+            client.iter_subreddit_posts.side_effect = lambda *args, **kwargs: iter(
+                [client.get_subreddit_posts.return_value]
+            )
 
             # Mock deleted comment
             client.get_post_comments.return_value = [
@@ -0,0 +1,86 @@
+"""Query-plan regression tests for the main command queries on SQLite."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from reddit_analyzer.models import Comment, Post
+
+START = datetime(2024, 1, 1)
+END = START + timedelta(days=30)
+
+
+def _query_plan(session, query) -> str:
+    """EXPLAIN QUERY PLAN output for a query, one step per line."""
+    compiled = query.statement.compile(
+        dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+class TestQueryPlans:
+    """Hot query shapes must be answered from an index, not a table scan."""
+
+    @pytest.mark.parametrize(
+        "build_query, index",
+        [
+            # analyze dimensions / topics / sentiment
+            (
+                lambda db: db.query(Post)
+                .filter(
+                    Post.subreddit_id == 1,
+                    Post.created_utc >= START,
+                    Post.created_utc <= END,
+                )
+                .order_by(Post.created_utc.desc()),
+                "ix_posts_subreddit_created_utc",
+            ),
+            # viz trends / report daily for one subreddit
+            (
+                lambda db: db.query(Post).filter(
+                    Post.subreddit_id == 1, Post.created_at >= START
+                ),
+                "ix_posts_subreddit_created_at",
+            ),
+            # report daily across all subreddits
+            (
+                lambda db: db.query(Post).filter(
+                    Post.created_at >= START, Post.created_at < END
+                ),
+                "ix_posts_created_at",
+            ),
+            # analytics over all recent posts
+            (
+                lambda db: db.query(Post).filter(Post.created_utc >= START),
+                "ix_posts_created_utc",
+            ),
+            # user metrics
+            (
+                lambda db: db.query(Post).filter(
+                    Post.author_id == 1, Post.created_utc >= START
+                ),
+                "ix_posts_author_created_utc",
+            ),
+            (
+                lambda db: db.query(Comment).filter(
+                    Comment.author_id == 1, Comment.created_utc >= START
+                ),
+                "ix_comments_author_created_utc",
+            ),
+            # comments for the posts of an analysis window
+            (
+                lambda db: db.query(Comment).filter(
+                    Comment.post_id.in_(["a", "b", "c"])
+                ),
+                "ix_comments_post_created_utc",
+            ),
+        ],
+    )
+    def test_uses_index(self, db_session, build_query, index):
+        plan = _query_plan(db_session, build_query(db_session))
+
+        assert f"USING INDEX {index}" in plan or f"USING COVERING INDEX {index}" in plan
+        assert "SCAN posts" not in plan
+        assert "SCAN comments" not in plan
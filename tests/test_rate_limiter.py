@@ -2,6 +2,7 @@
 
 import pytest
 import time
+from unittest.mock import AsyncMock, patch
 from reddit_analyzer.core.rate_limiter import RateLimiter, RateLimitConfig
 
 
@@ -63,16 +64,20 @@ class TestRateLimiter:
         result = await rate_limiter.acquire("endpoint2")
         assert result is True
 
-    def test_rate_limit_reset(self, rate_limiter):
+    @pytest.mark.asyncio
+    async def test_rate_limit_reset(self, rate_limiter):
         """Test rate limit reset functionality."""
-        # Set some requests for an endpoint
-        rate_limiter.requests["test_endpoint"] = [time.time()]
+        # Use up the burst for an endpoint
+        for i in range(3):
+            await rate_limiter.acquire("test_endpoint")
+        assert await rate_limiter.acquire("test_endpoint") is False
 
         # Reset the endpoint
         rate_limiter.reset_endpoint("test_endpoint")
 
         # Should have no requests recorded
-        assert rate_limiter.requests["test_endpoint"] == []
+        assert "test_endpoint" not in rate_limiter.states
+        assert await rate_limiter.acquire("test_endpoint") is True
 
     def test_get_status(self, rate_limiter):
         """Test rate limiter status reporting."""
@@ -97,3 +102,135 @@ class TestRateLimiter:
 
         # Should have waited some time
         assert elapsed > 0
+
+    @pytest.mark.asyncio
+    async def test_wait_if_needed_sleeps_exact_delay(self, rate_limiter):
+        """Blocked callers sleep once, for exactly the time to the next slot."""
+        with patch("reddit_analyzer.core.rate_limiter.time.time", return_value=100.0):
+            for i in range(3):
+                await rate_limiter.acquire("test_endpoint")
+
+            with patch(
+                "reddit_analyzer.core.rate_limiter.asyncio.sleep", new=AsyncMock()
+            ) as mock_sleep:
+                await rate_limiter.wait_if_needed("test_endpoint")
+                await rate_limiter.wait_if_needed("test_endpoint")
+
+        # Burst of 3 per 10s refills one slot every 10/3 seconds, and the
+        # second waiter is queued behind the first
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == pytest.approx([10 / 3, 20 / 3])
+
+    @pytest.mark.asyncio
+    async def test_minute_limit_enforced(self):
+        """The per-minute limit holds when bursts are spread out."""
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=4, burst_limit=3))
+
+        with patch("reddit_analyzer.core.rate_limiter.time.time") as clock:
+            granted = 0
+            for second in range(0, 60, 5):
+                clock.return_value = 1000.0 + second
+                granted += await limiter.acquire("test_endpoint")
+
+            # Burst of 4, then one per 15 seconds
+            assert granted == 4 + 3
+            status = limiter.get_status("test_endpoint")
+            assert status["remaining_requests"] < 4
+
+    @pytest.mark.asyncio
+    async def test_adaptive_spends_reported_budget(self):
+        """A large reported budget lifts the static limits."""
+        limiter = RateLimiter(
+            RateLimitConfig(requests_per_minute=10, burst_limit=3, adaptive=True)
+        )
+
+        with patch("reddit_analyzer.core.rate_limiter.time.time", return_value=100.0):
+            limiter.observe_limits(remaining=610, reset_timestamp=160.0)
+            granted = [await limiter.acquire("reddit_api") for _ in range(50)]
+
+            status = limiter.get_status("reddit_api")
+
+        assert all(granted)
+        assert status["effective_requests_per_minute"] > 500
+
+    def test_adaptive_pacing_is_front_loaded(self):
+        """Surplus budget goes early; pacing settles at the static rate."""
+        clock = [0.0]
+        limiter = RateLimiter(
+            RateLimitConfig(requests_per_minute=60, burst_limit=10, adaptive=True)
+        )
+
+        with patch(
+            "reddit_analyzer.core.rate_limiter.time.time",
+            side_effect=lambda: clock[0],
+        ):
+            limiter.observe_limits(remaining=1010, reset_timestamp=600.0)
+            sent = []
+            while True:
+                clock[0] += limiter.reserve("reddit_api")
+                if clock[0] >= 600.0:
+                    break
+                sent.append(clock[0])
+
+        per_minute = [
+            sum(1 for at in sent if minute * 60 <= at < (minute + 1) * 60)
+            for minute in range(10)
+        ]
+        # The whole budget (less the safety margin) fits before the reset
+        assert len(sent) == 1000
+        # Much faster than an even spread (100/min) at first, tapering off
+        assert per_minute[0] > 300
+        assert per_minute == sorted(per_minute, reverse=True)
+        assert per_minute[-3:] == [60, 60, 60]
+
+    def test_adaptive_slows_below_static_rate_only_when_needed(self):
+        """A budget too small for the static rate is spread until the reset."""
+        limiter = RateLimiter(
+            RateLimitConfig(requests_per_minute=60, adaptive=True, safety_margin=0)
+        )
+
+        with patch("reddit_analyzer.core.rate_limiter.time.time", return_value=0.0):
+            limiter.observe_limits(remaining=100, reset_timestamp=600.0)
+            per_minute, _ = limiter.effective_limits(0.0)
+
+        assert per_minute == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_adaptive_waits_for_reset_when_exhausted(self):
+        """Once the reported budget is spent, callers wait for the reset."""
+        limiter = RateLimiter(
+            RateLimitConfig(
+                requests_per_minute=60, burst_limit=10, adaptive=True, safety_margin=2
+            )
+        )
+
+        with patch("reddit_analyzer.core.rate_limiter.time.time", return_value=100.0):
+            limiter.observe_limits(remaining=4, reset_timestamp=130.0)
+            assert await limiter.acquire("reddit_api") is True
+            assert await limiter.acquire("reddit_api") is True
+            assert await limiter.acquire("reddit_api") is False
+
+            with patch(
+                "reddit_analyzer.core.rate_limiter.asyncio.sleep", new=AsyncMock()
+            ) as mock_sleep:
+                await limiter.wait_if_needed("reddit_api")
+
+        mock_sleep.assert_called_once_with(pytest.approx(30.0))
+
+    @pytest.mark.asyncio
+    async def test_observations_ignored_unless_adaptive(self, rate_limiter):
+        """Static limiters keep their configured pacing."""
+        rate_limiter.observe_limits(remaining=1000, reset_timestamp=time.time() + 60)
+
+        granted = [await rate_limiter.acquire("test_endpoint") for _ in range(4)]
+
+        assert granted == [True, True, True, False]
+
+    def test_observe_without_reset_uses_server_window(self):
+        """PRAW versions without reset_timestamp align to Reddit's window."""
+        limiter = RateLimiter(RateLimitConfig(adaptive=True))
+
+        with patch("reddit_analyzer.core.rate_limiter.time.time", return_value=1250.0):
+            limiter.observe_limits(remaining=300, used=300)
+
+        assert limiter.observed_reset == 1800.0
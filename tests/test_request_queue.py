@@ -1,14 +1,25 @@
 """Tests for request queue functionality."""
 
 import pytest
+import pytest_asyncio
 import asyncio
-from reddit_analyzer.core.request_queue import RequestQueue, RequestPriority
+import time
+from unittest.mock import patch
+from reddit_analyzer.core.request_queue import (
+    OverflowPolicy,
+    QueueFullError,
+    QueuedRequest,
+    RequestHistory,
+    RequestQueue,
+    RequestPriority,
+    RequestStatus,
+)
 
 
 class TestRequestQueue:
     """Test request queue functionality."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def request_queue(self):
         """Create a request queue for testing."""
         queue = RequestQueue(max_concurrent=2)
@@ -128,3 +139,402 @@ class TestRequestQueue:
         cleared_count = await request_queue.clear_completed(older_than_hours=0)
 
         assert cleared_count >= 0
+
+    @pytest.mark.asyncio
+    async def test_idle_workers_pick_up_work_immediately(self):
+        """Workers block on the queue instead of polling every 100 ms."""
+        queue = RequestQueue(max_concurrent=1)
+        executed = asyncio.Event()
+
+        async def execute(request):
+            executed.set()
+            return {}
+
+        with patch.object(queue, "_execute_request", side_effect=execute):
+            await queue.start_workers()
+            await asyncio.sleep(0.05)  # Worker is now idle
+
+            started = time.perf_counter()
+            await queue.enqueue("test_endpoint", "GET", {})
+            await asyncio.wait_for(executed.wait(), timeout=1.0)
+            latency = time.perf_counter() - started
+
+            await queue.stop_workers()
+
+        assert latency < 0.05
+
+    @pytest.mark.asyncio
+    async def test_heap_orders_by_priority(self):
+        """Higher priorities run first when enqueued together."""
+        queue = RequestQueue(max_concurrent=1)
+        order = []
+
+        async def execute(request):
+            order.append(request.priority)
+            return {}
+
+        for priority in (RequestPriority.LOW, RequestPriority.CRITICAL):
+            await queue.enqueue("test_endpoint", "GET", {"p": priority.name}, priority)
+        await queue.enqueue("test_endpoint", "GET", {"p": "m"}, RequestPriority.MEDIUM)
+
+        with patch.object(queue, "_execute_request", side_effect=execute):
+            await queue.start_workers()
+            await asyncio.sleep(0.05)
+            await queue.stop_workers()
+
+        assert order == [
+            RequestPriority.CRITICAL,
+            RequestPriority.MEDIUM,
+            RequestPriority.LOW,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_aging_prevents_starvation(self):
+        """An old LOW request outranks HIGH requests that arrived much later."""
+        queue = RequestQueue(max_concurrent=1, aging_interval=30.0)
+
+        with patch("reddit_analyzer.core.request_queue.time.time") as clock:
+            clock.return_value = 1000.0
+            low_id = await queue.enqueue(
+                "test_endpoint", "GET", {}, RequestPriority.LOW
+            )
+            clock.return_value = 1061.0
+            await queue.enqueue(
+                "test_endpoint", "GET", {"after": 1}, RequestPriority.HIGH
+            )
+
+            request = await queue._get_next_request()
+
+        assert request.id == low_id
+
+    @pytest.mark.asyncio
+    async def test_retry_is_scheduled_not_slept(self):
+        """A failing request waits for its retry without holding a worker."""
+        queue = RequestQueue(max_concurrent=1)
+        await queue.start_workers()
+
+        fail_id = await queue.enqueue("test_fail_endpoint", "GET", {}, max_retries=2)
+        await asyncio.sleep(0.15)
+        ok_id = await queue.enqueue("test_endpoint", "GET", {})
+        await asyncio.sleep(0.3)
+
+        status = queue.get_status()
+        await queue.stop_workers()
+
+        assert queue.get_request_status(ok_id)["status"] == "completed"
+        assert queue.get_request_status(fail_id)["status"] == (
+            RequestStatus.RETRYING.value
+        )
+        assert status["scheduled_retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_due_retry_wakes_idle_worker(self):
+        """Idle workers wake up when a scheduled retry becomes due."""
+        queue = RequestQueue(max_concurrent=1, retry_delay=0.05)
+        attempts = []
+
+        async def execute(request):
+            attempts.append(request.attempts)
+            if len(attempts) == 1:
+                raise Exception("Simulated API error")
+            return {}
+
+        with patch.object(queue, "_execute_request", side_effect=execute):
+            await queue.start_workers()
+            request_id = await queue.enqueue("test_endpoint", "GET", {})
+            await asyncio.sleep(0.2)
+            await queue.stop_workers()
+
+        assert attempts == [1, 2]
+        assert queue.get_request_status(request_id)["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_requests_fan_out(self):
+        """Identical pending requests run once and notify every caller."""
+        queue = RequestQueue(max_concurrent=1)
+        calls = []
+        results = []
+
+        async def execute(request):
+            calls.append(request.params)
+            return {"subreddit": request.params["subreddit"]}
+
+        async def async_callback(result):
+            results.append(("async", result))
+
+        def sync_callback(result):
+            results.append(("sync", result))
+
+        first_id = await queue.enqueue(
+            "subreddit_posts",
+            "get",
+            {"subreddit": "python", "limit": 100},
+            callback=async_callback,
+        )
+        second_id = await queue.enqueue(
+            "subreddit_posts",
+            "GET",
+            {"limit": 100, "subreddit": "python"},
+            callback=sync_callback,
+        )
+
+        with patch.object(queue, "_execute_request", side_effect=execute):
+            await queue.start_workers()
+            await asyncio.sleep(0.05)
+            await queue.stop_workers()
+
+        assert second_id == first_id
+        assert len(calls) == 1
+        assert results == [
+            ("async", {"subreddit": "python"}),
+            ("sync", {"subreddit": "python"}),
+        ]
+        assert queue.get_status()["deduplicated_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_of_in_flight_request(self):
+        """A request already being processed absorbs new identical requests."""
+        queue = RequestQueue(max_concurrent=1)
+        release = asyncio.Event()
+        results = []
+
+        async def execute(request):
+            await release.wait()
+            return {"ok": True}
+
+        with patch.object(queue, "_execute_request", side_effect=execute):
+            await queue.start_workers()
+            first_id = await queue.enqueue("user_info", "GET", {"user": "spez"})
+            await asyncio.sleep(0.01)
+            assert first_id in queue.processing
+
+            second_id = await queue.enqueue(
+                "user_info", "GET", {"user": "spez"}, callback=results.append
+            )
+            release.set()
+            await asyncio.sleep(0.01)
+
+            # Once finished, the same request goes upstream again
+            third_id = await queue.enqueue("user_info", "GET", {"user": "spez"})
+            await asyncio.sleep(0.01)
+            await queue.stop_workers()
+
+        assert second_id == first_id
+        assert third_id != first_id
+        assert results == [{"ok": True}]
+        assert queue.get_status()["deduplicated_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deduplication_can_be_disabled(self):
+        """deduplicate=False always queues a new request."""
+        queue = RequestQueue(max_concurrent=1)
+
+        first_id = await queue.enqueue("test_endpoint", "GET", {})
+        second_id = await queue.enqueue("test_endpoint", "GET", {}, deduplicate=False)
+
+        assert first_id != second_id
+        assert queue.get_status()["queue_sizes"]["MEDIUM"] == 2
+
+
+class TestRequestQueueCapacity:
+    """Test bounded capacity and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_reject_policy_raises_when_full(self):
+        """REJECT refuses requests beyond a priority's capacity."""
+        queue = RequestQueue(
+            priority_capacity={RequestPriority.LOW: 2},
+            overflow_policy=OverflowPolicy.REJECT,
+        )
+        for i in range(2):
+            await queue.enqueue("endpoint", "GET", {"i": i}, RequestPriority.LOW)
+
+        with pytest.raises(QueueFullError):
+            await queue.enqueue("endpoint", "GET", {"i": 2}, RequestPriority.LOW)
+
+        # Other priorities have their own room
+        await queue.enqueue("endpoint", "GET", {"i": 3}, RequestPriority.HIGH)
+        status = queue.get_status()
+        assert status["rejected_count"] == 1
+        assert status["queue_depth"] == 3
+
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_room(self):
+        """BLOCK holds the producer until a worker takes a request."""
+        queue = RequestQueue(max_concurrent=1, max_pending=1)
+        release = asyncio.Event()
+
+        async def execute(request):
+            await release.wait()
+            return {}
+
+        await queue.enqueue("endpoint", "GET", {"i": 0})
+        producer = asyncio.create_task(queue.enqueue("endpoint", "GET", {"i": 1}))
+        await asyncio.sleep(0.01)
+        assert not producer.done()
+
+        with patch.object(queue, "_execute_request", side_effect=execute):
+            await queue.start_workers()
+            request_id = await asyncio.wait_for(producer, timeout=1.0)
+            release.set()
+            await queue.stop_workers()
+
+        assert queue.get_request_status(request_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_block_policy_times_out(self):
+        """A blocked producer gives up after its timeout."""
+        queue = RequestQueue(max_pending=1)
+        await queue.enqueue("endpoint", "GET", {"i": 0})
+
+        with pytest.raises(QueueFullError):
+            await queue.enqueue("endpoint", "GET", {"i": 1}, timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_low_sheds_low_work(self):
+        """A full queue drops its oldest LOW request to admit a new one."""
+        queue = RequestQueue(
+            max_pending=3, overflow_policy=OverflowPolicy.DROP_OLDEST_LOW
+        )
+        oldest_low = await queue.enqueue(
+            "endpoint", "GET", {"i": 0}, RequestPriority.LOW
+        )
+        await queue.enqueue("endpoint", "GET", {"i": 1}, RequestPriority.LOW)
+        await queue.enqueue("endpoint", "GET", {"i": 2}, RequestPriority.HIGH)
+
+        await queue.enqueue("endpoint", "GET", {"i": 3}, RequestPriority.HIGH)
+
+        assert queue.get_request_status(oldest_low)["status"] == "dropped"
+        status = queue.get_status()
+        assert status["dropped_count"] == 1
+        assert status["queue_sizes"] == {
+            "LOW": 1,
+            "MEDIUM": 0,
+            "HIGH": 2,
+            "CRITICAL": 0,
+        }
+
+        # The dropped request is never executed
+        request = await queue._get_next_request()
+        assert request.id != oldest_low
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_low_rejects_without_low_work(self):
+        """With no LOW request to shed, the new request is rejected."""
+        queue = RequestQueue(
+            max_pending=1, overflow_policy=OverflowPolicy.DROP_OLDEST_LOW
+        )
+        await queue.enqueue("endpoint", "GET", {"i": 0}, RequestPriority.HIGH)
+
+        with pytest.raises(QueueFullError):
+            await queue.enqueue("endpoint", "GET", {"i": 1}, RequestPriority.LOW)
+
+    @pytest.mark.asyncio
+    async def test_high_water_mark_pauses_producers(self):
+        """Producers wait at the high-water mark until the low-water mark."""
+        queue = RequestQueue(high_water_mark=4, low_water_mark=1)
+        for i in range(4):
+            await queue.enqueue("endpoint", "GET", {"i": i})
+        assert queue.above_high_water is True
+
+        waiter = asyncio.create_task(queue.wait_for_capacity())
+        for _ in range(2):
+            await queue._get_next_request()
+        await asyncio.sleep(0.01)
+        assert not waiter.done()  # Still above the low-water mark
+
+        await queue._get_next_request()
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert queue.above_high_water is False
+
+    @pytest.mark.asyncio
+    async def test_wait_times_reported(self):
+        """get_status reports how long requests waited to start."""
+        queue = RequestQueue()
+
+        with patch("reddit_analyzer.core.request_queue.time.time") as clock:
+            clock.return_value = 1000.0
+            await queue.enqueue("endpoint", "GET", {"i": 0}, RequestPriority.LOW)
+            await queue.enqueue("endpoint", "GET", {"i": 1}, RequestPriority.LOW)
+            clock.return_value = 1002.5
+            await queue._get_next_request()
+            clock.return_value = 1004.0
+            status = queue.get_status()
+
+        assert status["wait_times"]["LOW"] == {
+            "avg": 2.5,
+            "max": 2.5,
+            "oldest_pending": 4.0,
+        }
+
+
+class TestRequestHistory:
+    """Test bounded request history."""
+
+    @staticmethod
+    def _finished(request_id, completed_at, status=RequestStatus.COMPLETED):
+        return QueuedRequest(
+            id=request_id,
+            endpoint="test_endpoint",
+            method="GET",
+            params={},
+            priority=RequestPriority.MEDIUM,
+            status=status,
+            created_at=completed_at,
+            completed_at=completed_at,
+        )
+
+    def test_evicts_oldest_past_max_entries(self):
+        """The history keeps only the most recent max_entries requests."""
+        history = RequestHistory(max_entries=3, max_age=3600)
+
+        for i in range(5):
+            history.add(self._finished(f"req_{i}", 1000.0 + i))
+
+        assert len(history) == 3
+        assert history.get("req_1") is None
+        assert history.get("req_4") is not None
+        assert history.evicted == 2
+
+    def test_evicts_entries_past_max_age(self):
+        """Entries older than max_age are dropped as the history advances."""
+        history = RequestHistory(max_entries=100, max_age=60)
+
+        history.add(self._finished("old", 1000.0))
+        history.add(self._finished("new", 1061.0))
+
+        assert history.get("old") is None
+        assert history.get("new") is not None
+
+    def test_counts_survive_eviction(self):
+        """Totals include requests no longer held in the history."""
+        history = RequestHistory(max_entries=1, max_age=3600)
+
+        history.add(self._finished("a", 1000.0))
+        history.add(self._finished("b", 1001.0, RequestStatus.FAILED))
+        history.add(self._finished("c", 1002.0))
+
+        assert history.counts[RequestStatus.COMPLETED] == 2
+        assert history.counts[RequestStatus.FAILED] == 1
+        assert len(history) == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_status_after_eviction(self):
+        """get_status stays accurate once history entries are evicted."""
+        queue = RequestQueue(max_concurrent=2, history_max_entries=2)
+
+        async def execute(request):
+            return {}
+
+        with patch.object(queue, "_execute_request", side_effect=execute):
+            await queue.start_workers()
+            for i in range(5):
+                await queue.enqueue(f"endpoint_{i}", "GET", {}, callback=execute)
+            await asyncio.sleep(0.05)
+            await queue.stop_workers()
+
+        status = queue.get_status()
+        assert status["completed_count"] == 5
+        assert status["history_size"] == 2
+        assert status["history_evicted"] == 3
+        assert queue.callbacks == {}